@@ -18,6 +18,7 @@ from SALib.analyze import sobol as sobol_analyse
 from tqdm import tqdm
 
 # ─────────────────────────── virtual_ecosystem entry point ──────────────────
+from virtual_ecosystem.core.config import Config
 from virtual_ecosystem.main import ve_run
 
 # ─────────────────────── 1 ▸ parameter bounds (EDIT) ────────────────────────
@@ -110,6 +111,10 @@ def main() -> None:
         for i, row in enumerate(X)
     ]
 
+    # Compile the base configuration once: forked workers inherit it through the
+    # compiled configuration cache and only validate their parameter overrides.
+    Config(cfg_paths=[args.config_dir])
+
     ctx = mp.get_context("fork")
     with ctx.Pool(processes=args.cpu, maxtasksperchild=1) as pool:
         for idx, y in tqdm(
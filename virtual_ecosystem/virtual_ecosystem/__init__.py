@@ -3,8 +3,6 @@
 import importlib.metadata
 import warnings
 
-from pyrealm.core.experimental import ExperimentalFeatureWarning
-
 from . import example_data
 
 __version__ = importlib.metadata.version("virtual_ecosystem")
@@ -17,9 +15,8 @@ circumstances, e.g. if this Python package is inside a zip file, but it should w
 the ordinary case.
 """
 
-# Ignore experimental and user warnings coming from pyrealm
+# Ignore user warnings coming from pyrealm. The experimental feature warnings are
+# ignored by the plants model, which uses those features, so that pyrealm is only
+# imported when a model that uses it is loaded.
 
-warnings.filterwarnings(
-    action="ignore", category=ExperimentalFeatureWarning, module=r"pyrealm"
-)
 warnings.filterwarnings(action="ignore", category=UserWarning, module=r"pyrealm")
@@ -7,6 +7,9 @@ Each of the core sub-modules has its own API reference page:
 * The :mod:`~virtual_ecosystem.core.config` submodule covers the definition of formal
   configuration schema for components and the parsing and validation of TOML
   configuration documents against those schema.
+* The :mod:`~virtual_ecosystem.core.cache` submodule provides a persistent cache of
+  the merged configuration schema, module registry and known variables, used to speed
+  up simulation startup.
 * The :mod:`~virtual_ecosystem.core.logger` configures the :class:`~logging.Logger`
   instance used throughout the package.
 * The :mod:`~virtual_ecosystem.core.grid` submodule covers the definition of the
@@ -0,0 +1,193 @@
+"""The :mod:`~virtual_ecosystem.core.cache` module provides a simple persistent cache
+used to speed up the start of a Virtual Ecosystem simulation.
+
+Every simulation has to load and check the JSON schemas for the requested modules,
+merge them into a single validation schema (see
+:meth:`~virtual_ecosystem.core.config.Config.build_schema`), discover the model and
+constants classes for each module (see
+:func:`~virtual_ecosystem.core.registry.register_module`) and load and validate the
+known variables (see
+:func:`~virtual_ecosystem.core.variables.register_all_variables`). None of these steps
+depend on the user configuration beyond the set of requested modules, so the results
+are stored as JSON files in a cache directory and reused by later runs.
+
+Cache entries are keyed using the package version, the set of requested modules and the
+size and modification time of the underlying schema and variable definition files and
+of the Python source files of each module, so that a new release or an edit to those
+files in a development install invalidates the cache. The cache directory is set using
+the ``VE_CACHE_DIR`` environment variable, falling back to ``virtual_ecosystem`` within
+``XDG_CACHE_HOME`` or ``~/.cache``. Setting the ``VE_NO_CACHE`` environment variable to
+any non-empty value disables the cache.
+
+The cache is an optimisation only: any problem reading or writing a cache file is
+logged and the simulation falls back to building the data from scratch.
+"""  # noqa: D205
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from importlib import resources
+from pathlib import Path
+from typing import Any
+
+from virtual_ecosystem import __version__
+from virtual_ecosystem.core.logger import LOGGER
+
+
+def get_cache_dir() -> Path | None:
+    """Get the directory used to store startup cache files.
+
+    Returns:
+        The cache directory path, or None if caching has been disabled using the
+        ``VE_NO_CACHE`` environment variable.
+    """
+
+    if os.environ.get("VE_NO_CACHE"):
+        return None
+
+    if cache_dir := os.environ.get("VE_CACHE_DIR"):
+        return Path(cache_dir)
+
+    cache_root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_root) / "virtual_ecosystem"
+
+
+def _file_signature(path: Any) -> str:
+    """Get a short signature string for a package resource file.
+
+    Args:
+        path: A path or Traversable for the file.
+
+    Returns:
+        A string combining the file size and modification time, or ``missing`` if the
+        file cannot be found.
+    """
+
+    try:
+        stat = os.stat(str(path))
+    except OSError:
+        return "missing"
+
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _source_signature(path: Any) -> str:
+    """Get a short signature string for the Python source files of a module.
+
+    Args:
+        path: A path or Traversable for the module directory.
+
+    Returns:
+        A hash of the names and signatures of all of the Python source files within the
+        module directory, including those in subpackages.
+    """
+
+    module_dir = Path(str(path))
+    signatures = [
+        f"{source_file.relative_to(module_dir)}={_file_signature(source_file)}"
+        for source_file in sorted(module_dir.rglob("*.py"))
+    ]
+
+    return hashlib.sha256("|".join(signatures).encode()).hexdigest()[:16]
+
+
+def cache_key(kind: str, modules: Iterable[str] = ()) -> str:
+    """Generate a cache key for a set of modules.
+
+    The key combines the package version, the sorted set of module names and the
+    signatures of the files that the cached data are built from: the
+    ``module_schema.json`` file and Python source files for each module and the variable
+    definition and schema files. Including the source files means that moving or
+    renaming a model or constants class in a development install invalidates the cached
+    import paths for that module.
+
+    Args:
+        kind: The kind of cache entry, used as a prefix for the key.
+        modules: The short names of the modules (e.g. ``core`` or ``soil``) that the
+            cache entry depends on.
+
+    Returns:
+        A key string that can be used as a cache file name stem.
+    """
+
+    package_root = resources.files("virtual_ecosystem")
+    sources = [
+        __version__,
+        _file_signature(package_root / "data_variables.toml"),
+        _file_signature(package_root / "core" / "variables_schema.json"),
+    ]
+
+    for module in sorted(set(modules)):
+        module_root = package_root if module == "core" else package_root / "models"
+        schema_file = module_root / module / "module_schema.json"
+        sources.append(
+            f"{module}={_file_signature(schema_file)}:"
+            f"{_source_signature(module_root / module)}"
+        )
+
+    digest = hashlib.sha256("|".join(sources).encode()).hexdigest()[:16]
+
+    return f"{kind}_{digest}"
+
+
+def load_cache(key: str) -> Any | None:
+    """Load a cache entry.
+
+    Args:
+        key: The cache key, as generated by
+            :func:`~virtual_ecosystem.core.cache.cache_key`.
+
+    Returns:
+        The cached data, or None if caching is disabled or no valid entry exists.
+    """
+
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+
+    cache_file = cache_dir / f"{key}.json"
+    if not cache_file.exists():
+        return None
+
+    try:
+        with open(cache_file) as cache_io:
+            payload = json.load(cache_io)
+    except (OSError, json.JSONDecodeError) as excep:
+        LOGGER.warning(f"Could not read startup cache file {cache_file}: {excep}")
+        return None
+
+    LOGGER.debug(f"Loaded startup cache entry: {cache_file}")
+    return payload
+
+
+def save_cache(key: str, payload: Any) -> None:
+    """Save a cache entry.
+
+    The file is written to a temporary file and then moved into place, so that
+    simulations starting in parallel never read a partially written cache file.
+
+    Args:
+        key: The cache key, as generated by
+            :func:`~virtual_ecosystem.core.cache.cache_key`.
+        payload: JSON serialisable data to be cached.
+    """
+
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return
+
+    cache_file = cache_dir / f"{key}.json"
+    temp_file = cache_dir / f"{key}.{os.getpid()}.tmp"
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(temp_file, "w") as cache_io:
+            json.dump(payload, cache_io)
+        os.replace(temp_file, cache_file)
+    except (OSError, TypeError) as excep:
+        LOGGER.warning(f"Could not write startup cache file {cache_file}: {excep}")
+        temp_file.unlink(missing_ok=True)
+        return
+
+    LOGGER.debug(f"Saved startup cache entry: {cache_file}")
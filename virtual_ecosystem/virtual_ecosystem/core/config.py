@@ -8,18 +8,26 @@ with the different model components. See the :mod:`~virtual_ecosystem.core.schem
 module for details.
 """  # noqa: D205
 
+import hashlib
+import pickle
 import sys
 from collections.abc import Sequence
 from copy import deepcopy
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import tomli_w
 from jsonschema import FormatChecker
 
+from virtual_ecosystem.core.cache import cache_key, load_cache, save_cache
 from virtual_ecosystem.core.exceptions import ConfigurationError
 from virtual_ecosystem.core.logger import LOGGER
-from virtual_ecosystem.core.registry import MODULE_REGISTRY, register_module
+from virtual_ecosystem.core.registry import (
+    MODULE_REGISTRY,
+    get_cache_entry,
+    register_module,
+)
 from virtual_ecosystem.core.schema import ValidatorWithDefaults, merge_schemas
 
 if sys.version_info[:2] >= (3, 11):
@@ -29,7 +37,11 @@ else:
 
 
 def config_merge(
-    dest: dict, source: dict, conflicts: tuple = (), path: str = ""
+    dest: dict,
+    source: dict,
+    conflicts: tuple = (),
+    path: str = "",
+    in_place: bool = False,
 ) -> tuple[dict, tuple]:
     """Recursively merge two dictionaries detecting duplicated key definitions.
 
@@ -56,14 +68,16 @@ def config_merge(
         source: A dictionary of key value pairs to extend ``dest``
         conflicts: A tuple of duplicated key paths between the two dictionaries
         path: A string giving the current key path.
+        in_place: Extend the ``dest`` dictionary in place rather than extending a copy.
 
     Returns:
-        A copy of dest, extended recursively with values from source, and a tuple of
-        duplicate key paths.
+        A copy of dest, or dest itself if ``in_place`` is used, extended recursively
+        with values from source, and a tuple of duplicate key paths.
     """
 
     # Copy inputs to avoid mangling inputs
-    dest = deepcopy(dest)
+    if not in_place:
+        dest = deepcopy(dest)
     source = deepcopy(source)
 
     # Loop over the elements in the source dictionary
@@ -76,7 +90,7 @@ def config_merge(
             # Both values for this key are dictionaries, so recurse, extending the path
             next_path = src_key if path == "" else f"{path}.{src_key}"
             dest[src_key], conflicts = config_merge(
-                dest_val, src_val, conflicts=conflicts, path=next_path
+                dest_val, src_val, conflicts=conflicts, path=next_path, in_place=True
             )
         elif isinstance(dest_val, list) and isinstance(src_val, list):
             # Both values for this key are lists, so merge the lists
@@ -147,6 +161,50 @@ def _resolve_config_paths(config_dir: Path, config_dict: dict[str, Any]) -> None
                 config_dict[key] = str(file_resolved)
 
 
+@dataclass
+class CompiledConfig:
+    """A validated base configuration stored in the compiled configuration cache.
+
+    Instances of this dataclass are stored in the
+    :data:`~virtual_ecosystem.core.config.COMPILED_CONFIG_CACHE` and hold the
+    configuration data built and validated from a particular set of TOML contents,
+    before any override parameters are applied.
+    """
+
+    pickled_data: bytes
+    """The validated configuration data, including default values, stored as a pickle
+    so that independent copies can be created quickly."""
+    toml_contents: dict[str | Path, dict]
+    """The parsed TOML contents used to build the configuration."""
+    merged_schema: dict[str, Any]
+    """The merged schema used to validate the configuration."""
+    model_classes: dict[str, Any]
+    """The model classes specified in the configuration, keyed by model name."""
+
+
+COMPILED_CONFIG_CACHE: dict[str, CompiledConfig] = {}
+"""The compiled configuration cache.
+
+This dictionary stores validated base configurations, keyed by a hash of the TOML
+files or strings used to build them. When a
+:class:`~virtual_ecosystem.core.config.Config` instance is created from TOML contents
+that have already been compiled, the cached configuration is reused and only the
+override parameters are applied and validated.
+Note that processes forked after a configuration has been compiled inherit the cache.
+"""
+
+SECTION_SCHEMA_KEYWORDS: frozenset[str] = frozenset(
+    ("type", "properties", "additionalProperties", "required", "description", "default")
+)
+"""Schema keywords that only constrain the properties of an object one at a time.
+
+Overrides to an object whose schema only uses these keywords can be validated property
+by property, as merging in overrides can only add or change properties. Any other
+keyword (such as ``oneOf`` or ``dependentRequired``) can relate properties to each
+other, so the whole object is validated when one of its properties is overridden.
+"""
+
+
 class Config(dict):
     """Configuration loading and validation.
 
@@ -192,6 +250,17 @@ class Config(dict):
     If the core.data_output_options.save_merged_config option is set to true a merged
     config file will be automatically generated, unless ``auto`` is set to false.
 
+    Building and validating a configuration is repeated for every simulation, but an
+    ensemble of simulations typically shares the same TOML configuration and only
+    differs in a few override parameters. Automatically validated configurations are
+    therefore stored in the
+    :data:`~virtual_ecosystem.core.config.COMPILED_CONFIG_CACHE`, keyed by the TOML
+    contents. When the same contents are used again, the files are not parsed again:
+    the cached configuration is copied and only the override parameters are merged and
+    validated (see
+    :meth:`~virtual_ecosystem.core.config.Config.validate_overrides`). The ``use_cache``
+    argument can be used to turn off this behaviour.
+
     Args:
         cfg_paths: A string, Path or list of strings or Paths giving configuration
             file or directory paths.
@@ -200,6 +269,8 @@ class Config(dict):
         override_params: Extra parameters provided by the user.
         auto: A boolean flag setting whether the configuration data is automatically
             loaded and validated
+        use_cache: A boolean flag setting whether automatically validated configuration
+            data is stored in and retrieved from the compiled configuration cache.
     """
 
     def __init__(
@@ -208,6 +279,7 @@ class Config(dict):
         cfg_strings: str | list[str] = [],
         override_params: dict[str, Any] = {},
         auto: bool = True,
+        use_cache: bool = True,
     ) -> None:
         # Define custom attributes
         self.cfg_paths: list[Path] = []
@@ -263,13 +335,20 @@ class Config(dict):
                 self.cfg_paths = [Path(p) for p in cfg_paths]
 
         if auto:
+            if cfg_paths:
+                # Collect the TOML files from the provided paths
+                self.collect_config_paths()
+
+            # Use a cached compiled configuration where possible
+            if use_cache and self.load_compiled_config(override_params):
+                return
+
             if cfg_strings:
                 # Load the TOML content
                 self.load_config_toml_string()
             if cfg_paths:
                 # Load the TOML content from resolved paths and resolve file paths
                 # within configuration files.
-                self.collect_config_paths()
                 self.load_config_toml()
                 self.resolve_config_file_paths()
 
@@ -475,6 +554,10 @@ class Config(dict):
         simulation. The schemas for the requested modules are then loaded and combined
         using the :meth:`~virtual_ecosystem.core.schema.merge_schemas` function to
         generate a single validation schema for model configuration.
+
+        The registry entries and merged schema for a given set of modules are stored in
+        the startup cache (see :mod:`~virtual_ecosystem.core.cache`) and are reused when
+        the same set of modules is requested again.
         """
 
         # Extract the requested modules, which are the top-level config keys.
@@ -487,14 +570,22 @@ class Config(dict):
         else:
             requested_modules.remove("core")
 
+        # Look for a cached registry and merged schema for this set of modules
+        schema_cache_key = cache_key("schema", ["core", *requested_modules])
+        cached = load_cache(schema_cache_key)
+        cached_registry = {} if cached is None else cached["registry"]
+
         # Register the core module components and access the core schema.
-        register_module("virtual_ecosystem.core")
+        register_module("virtual_ecosystem.core", cached=cached_registry.get("core"))
         core_schema = MODULE_REGISTRY["core"].schema
 
         # Attempt to register the requested modules - this function will handle unknown
         # module names and exit.
         for module in requested_modules:
-            register_module(f"virtual_ecosystem.models.{module}")
+            register_module(
+                f"virtual_ecosystem.models.{module}",
+                cached=cached_registry.get(module),
+            )
 
         # Generate a dictionary of schemas for requested modules and populate the
         # model_classes attribute
@@ -503,10 +594,23 @@ class Config(dict):
             all_schemas[module] = MODULE_REGISTRY[module].schema
             self.model_classes[module] = MODULE_REGISTRY[module].model
 
+        if cached is not None:
+            self.merged_schema = cached["merged_schema"]
+            LOGGER.info("Validation schema for configuration loaded from cache.")
+            return
+
         # Merge the schemas into a single combined schema
         self.merged_schema = merge_schemas(all_schemas)
         LOGGER.info("Validation schema for configuration built.")
 
+        save_cache(
+            schema_cache_key,
+            {
+                "registry": {module: get_cache_entry(module) for module in all_schemas},
+                "merged_schema": self.merged_schema,
+            },
+        )
+
     def validate_config(self) -> None:
         """Validate the model configuration.
 
@@ -573,6 +677,224 @@ class Config(dict):
         else:
             val.validate(config_data)
 
+    def compiled_config_key(self) -> str:
+        """Generate the compiled configuration cache key for the configuration sources.
+
+        The key is a hash of the raw contents of the TOML files, along with their
+        absolute paths, or of the TOML strings used to create the instance.
+
+        Returns:
+            A hash of the configuration sources.
+        """
+
+        key_hash = hashlib.sha256()
+
+        for cfg_string in self.cfg_strings:
+            key_hash.update(cfg_string.encode())
+
+        for toml_file in self.toml_files:
+            key_hash.update(str(Path(toml_file).absolute()).encode())
+            key_hash.update(Path(toml_file).read_bytes())
+
+        return key_hash.hexdigest()
+
+    def load_compiled_config(self, override_params: dict[str, Any]) -> bool:
+        """Populate the configuration from the compiled configuration cache.
+
+        This method looks for a compiled base configuration for the configuration
+        sources in the :data:`~virtual_ecosystem.core.config.COMPILED_CONFIG_CACHE`. If
+        there is no cached configuration, the base configuration is loaded, built and
+        validated without the override parameters and then added to the cache. A copy
+        of the cached configuration is then loaded into the instance and the override
+        parameters are merged in and validated using
+        :meth:`~virtual_ecosystem.core.config.Config.validate_overrides`.
+
+        The cache is not used - and the method returns False - if the base
+        configuration is not valid on its own, for example when a required setting is
+        only provided by the override parameters, or if the override parameters add
+        modules that are not in the base configuration. In those cases the full
+        configuration should be built and validated in the usual way.
+
+        Args:
+            override_params: Extra parameter settings
+
+        Returns:
+            A boolean indicating whether the configuration was populated from the cache.
+
+        Raises:
+            ConfigurationError: if the override parameters are not compatible with the
+                configuration schema.
+        """
+
+        key = self.compiled_config_key()
+        compiled = COMPILED_CONFIG_CACHE.get(key)
+
+        if compiled is None:
+            # Build and validate the base configuration in a scratch instance, so that
+            # any failure leaves this instance ready to be built in full.
+            base = Config(
+                cfg_paths=self.cfg_paths,
+                cfg_strings=self.cfg_strings,
+                auto=False,
+            )
+            if self.from_cfg_strings:
+                base.load_config_toml_string()
+            else:
+                base.toml_files = list(self.toml_files)
+                base.load_config_toml()
+                base.resolve_config_file_paths()
+
+            toml_contents = deepcopy(base.toml_contents)
+            base.build_config()
+            base.build_schema()
+            base._validate_and_set_defaults(base, base.merged_schema)
+
+            if base.config_errors:
+                LOGGER.info("Base configuration invalid without overrides: not cached")
+                return False
+
+            compiled = CompiledConfig(
+                pickled_data=pickle.dumps(dict(base)),
+                toml_contents=toml_contents,
+                merged_schema=base.merged_schema,
+                model_classes=base.model_classes,
+            )
+            COMPILED_CONFIG_CACHE[key] = compiled
+            LOGGER.info("Compiled configuration added to cache")
+        else:
+            LOGGER.info("Compiled configuration loaded from cache")
+
+        # Overrides that introduce new modules need a new schema and full validation
+        if not set(override_params).issubset(compiled.model_classes.keys() | {"core"}):
+            return False
+
+        self.toml_contents = deepcopy(compiled.toml_contents)
+        self.update(pickle.loads(compiled.pickled_data))
+        self.merged_schema = compiled.merged_schema
+        self.model_classes = dict(compiled.model_classes)
+
+        # The instance holds its own copy of the data, so overrides can be merged in
+        # place and then validated
+        self.override_config(override_params, in_place=True)
+        self.validate_overrides(override_params)
+
+        return True
+
+    def validate_overrides(self, override_params: dict[str, Any]) -> None:
+        """Validate the configuration settings changed by override parameters.
+
+        This method is used to validate a configuration that was built from an already
+        validated base configuration by merging in override parameters. Rather than
+        validating the whole configuration again, the override parameters are used to
+        find the configuration sections that have changed and only those sections are
+        validated against the matching part of the merged schema, again filling in any
+        default values.
+
+        This gives the same result as validating the whole configuration as long as
+        the schema of each section only constrains its properties one at a time (see
+        :data:`~virtual_ecosystem.core.config.SECTION_SCHEMA_KEYWORDS`). Where a schema
+        uses keywords that relate its properties to each other, the whole object
+        containing the overridden setting is validated instead, and the whole
+        configuration is validated if the top level of the schema uses them.
+
+        Args:
+            override_params: The override parameters merged into the configuration.
+
+        Raises:
+            ConfigurationError: if the overridden configuration settings are not
+                compatible with the configuration schema.
+        """
+
+        if not self.merged_schema:
+            raise RuntimeError("Merged schema not built.")
+
+        if set(self.merged_schema) <= SECTION_SCHEMA_KEYWORDS:
+            self._validate_override_section(
+                override_params=override_params,
+                config_data=self,
+                schema=self.merged_schema,
+                path=[],
+            )
+        else:
+            self._validate_and_set_defaults(self, self.merged_schema)
+
+        if self.config_errors:
+            for cfg_err_path, cfg_err in self.config_errors:
+                LOGGER.error(f"Configuration error in {cfg_err_path}: {cfg_err}")
+
+            to_raise = ConfigurationError(
+                "Configuration contains schema violations: check log"
+            )
+            LOGGER.critical(to_raise)
+            raise to_raise
+
+        self.validated = True
+        LOGGER.info("Configuration overrides validated")
+
+    def _validate_override_section(
+        self,
+        override_params: dict[str, Any],
+        config_data: dict[str, Any],
+        schema: dict[str, Any],
+        path: list[str],
+    ) -> None:
+        """Recursively validate the configuration settings changed by overrides.
+
+        The override parameters and the schema are descended together while the
+        configuration values are objects with defined schema properties that can be
+        validated property by property, and each changed value is then validated against
+        its own subschema. Errors are appended to the
+        :attr:`~virtual_ecosystem.core.config.Config.config_errors` attribute.
+
+        Args:
+            override_params: The override parameters for this section.
+            config_data: The merged configuration data for this section.
+            schema: The schema for this section.
+            path: The key path to this section.
+        """
+
+        properties = schema.get("properties", {})
+
+        for key, value in override_params.items():
+            key_path = [*path, key]
+            subschema = properties.get(key)
+
+            if subschema is None:
+                if schema.get("additionalProperties", True) is False:
+                    self.config_errors.append(
+                        (
+                            str(path),
+                            "Additional properties are not allowed "
+                            f"('{key}' was unexpected)",
+                        )
+                    )
+                continue
+
+            if (
+                isinstance(value, dict)
+                and isinstance(config_data[key], dict)
+                and "properties" in subschema
+                and set(subschema) <= SECTION_SCHEMA_KEYWORDS
+            ):
+                self._validate_override_section(
+                    override_params=value,
+                    config_data=config_data[key],
+                    schema=subschema,
+                    path=key_path,
+                )
+                continue
+
+            val = ValidatorWithDefaults(subschema, format_checker=FormatChecker())
+            errors = [
+                (str(key_path + list(error.path)), error.message)
+                for error in val.iter_errors(config_data[key])
+            ]
+
+            if errors:
+                self.config_errors.extend(errors)
+            else:
+                val.validate(config_data[key])
+
     def export_config(self, outfile: Path) -> None:
         """Exports a validated and merged configuration as a single file.
 
@@ -593,13 +915,19 @@ class Config(dict):
             tomli_w.dump(self, toml_file)
         LOGGER.info("Saving config to: %s", outfile)
 
-    def override_config(self, override_params: dict[str, Any]) -> None:
+    def override_config(
+        self, override_params: dict[str, Any], in_place: bool = False
+    ) -> None:
         """Override any parameters desired.
 
         Args:
             override_params: Extra parameter settings
+            in_place: Merge the override parameters directly into the existing
+                configuration data, rather than into a copy of the data.
         """
-        updated, conflicts = config_merge(self, override_params, conflicts=tuple())
+        updated, conflicts = config_merge(
+            self, override_params, conflicts=tuple(), in_place=in_place
+        )
 
         # Conflicts are not errors as we want users to be able to override parameters
         if conflicts:
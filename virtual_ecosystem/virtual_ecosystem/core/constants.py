@@ -3,14 +3,14 @@ the Virtual Ecosystem. This includes universal constants but also constants that
 shared across model.
 
 Note that true universal constants are defined as class variables of dataclasses. This
-prevents them being changed by user specified configuration.
+prevents them being changed by user specified configuration. The values of physical
+constants are the CODATA 2018 values provided by :mod:`scipy.constants`, written out so
+that importing the core constants does not import :mod:`scipy`.
 """  # noqa: D205
 
 from dataclasses import dataclass
 from typing import ClassVar
 
-from scipy import constants
-
 from virtual_ecosystem.core.constants_class import ConstantsDataclass
 
 
@@ -34,10 +34,10 @@ class CoreConsts(ConstantsDataclass):
     placeholder: float = 123.4
     """A placeholder configurable constant."""
 
-    zero_Celsius: ClassVar[float] = constants.zero_Celsius
+    zero_Celsius: ClassVar[float] = 273.15
     """Conversion constant from Kelvin to Celsius (°)."""
 
-    standard_pressure: float = constants.atmosphere / 1000
+    standard_pressure: float = 101.325
     """Standard atmospheric pressure, [kPa]"""
 
     standard_mole: float = 44.642
@@ -46,10 +46,10 @@ class CoreConsts(ConstantsDataclass):
     molar_heat_capacity_air: float = 29.19
     """Molar heat capacity of air, [J mol-1 K-1]."""
 
-    gravity: float = constants.gravitational_constant
+    gravity: float = 6.6743e-11
     """Newtonian constant of gravitation, [m s-1]."""
 
-    stefan_boltzmann_constant: float = constants.Stefan_Boltzmann
+    stefan_boltzmann_constant: float = 5.6703744191844314e-08
     """Stefan-Boltzmann constant, [W m-2 K-4].
 
     The Stefan-Boltzmann constant relates the energy radiated by a black body to its
@@ -337,6 +337,8 @@ class LayerStructure:
     """Thickness of each soil layer (m)"""
     soil_layer_active_thickness: NDArray[np.float32] = field(init=False)
     """Thickness of the microbially active soil in each soil layer (m)"""
+    float_dtype: np.dtype = field(init=False)
+    """The floating point type used for the layer data array template."""
     _array_template: DataArray = field(init=False)
     """A private data array template. Access copies using get_template."""
 
@@ -389,6 +391,9 @@ class LayerStructure:
             lcfg["surface_layer_height"], "surface_layer_height"
         )
 
+        # Set the precision used for layer data arrays
+        self.float_dtype = np.dtype(config["core"]["precision"]["float_dtype"])
+
         # Set the layer role sequence
         self.layer_roles: NDArray[np.str_] = np.array(
             ["above"]
@@ -498,7 +503,7 @@ class LayerStructure:
         # from_template creating it when called.
 
         self._array_template = DataArray(
-            np.full((self.n_layers, self._n_cells), np.nan),
+            np.full((self.n_layers, self._n_cells), np.nan, dtype=self.float_dtype),
             dims=("layers", "cell_id"),
             coords={
                 "layers": self.layer_indices,
@@ -89,6 +89,26 @@ supported formats and for extending the system to additional file formats.
     )
     data['temperature'] = results['temperature']
 
+Data precision
+--------------
+
+By default, floating point data are stored using double precision (``float64``). Large
+simulations can halve the memory used by the simulation state and the size of output
+files by setting the precision to single precision:
+
+.. code-block:: toml
+
+    [core.precision]
+    float_dtype = "float32"
+
+In this mode, floating point data arrays are converted to ``float32`` when they are
+added to a :class:`~virtual_ecosystem.core.data.Data` instance. The exceptions are the
+stiff or accumulating quantities - such as the soil and litter pools - that are marked
+with ``precision = "float64"`` in the variable definitions (see
+:mod:`~virtual_ecosystem.core.variables`), which are always stored as ``float64``.
+Further variables can be stored as ``float64`` using the
+``core.precision.float64_variables`` option.
+
 Using a data configuration
 --------------------------
 
@@ -115,6 +135,18 @@ group model-specific data with other model configuration options, and allow
 configuration files to be swapped in a more modular fashion. However, the data
 configurations across all files **must not** contain repeated data variable names.
 
+By default, data files are loaded one after another. Configurations that load data from
+many large files can set ``core.data.load_workers`` to load distinct files in parallel
+using a pool of worker processes. Separate processes are used rather than threads
+because the NetCDF and HDF5 libraries are not thread safe (see below). The loaded data
+are always validated and added to the ``Data`` instance in the main process, in the same
+order as when loading sequentially.
+
+.. code-block:: toml
+
+    [core.data]
+    load_workers = 4
+
 .. code-block:: python
 
     # Load configured datasets
@@ -122,6 +154,9 @@ configurations across all files **must not** contain repeated data variable name
 
 """  # noqa: D205
 
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from itertools import groupby
 from pathlib import Path
 from typing import Any
@@ -148,6 +183,31 @@ from virtual_ecosystem.core.utils import check_outfile
 dask.config.set(scheduler="single-threaded")
 
 
+def get_float64_variables() -> frozenset[str]:
+    """Get the known variables that are always stored in double precision.
+
+    These are the variables defined with ``precision = "float64"`` in the variable
+    definitions, which are stiff or accumulating quantities where the loss of precision
+    would affect the simulation results. The known variables are registered first if
+    that has not already been done.
+
+    Returns:
+        The names of the variables that are always stored as ``float64``.
+    """
+
+    # Imported here as the variables module depends on this module
+    from virtual_ecosystem.core import variables
+
+    if not variables.KNOWN_VARIABLES:
+        variables.register_all_variables()
+
+    return frozenset(
+        name
+        for name, var in variables.KNOWN_VARIABLES.items()
+        if var.precision == "float64"
+    )
+
+
 class Data:
     """The Virtual Ecosystem data object.
 
@@ -158,12 +218,22 @@ class Data:
 
     Args:
         grid: The Grid instance that will be used for simulation.
+        float_dtype: The floating point type used to store data, either ``float64`` or
+            ``float32``.
+        float64_variables: Additional variable names that are always stored as
+            ``float64``, alongside the known variables defined with a ``float64``
+            precision.
 
     Raises:
         TypeError: when grid is not a Grid object
     """
 
-    def __init__(self, grid: Grid) -> None:
+    def __init__(
+        self,
+        grid: Grid,
+        float_dtype: str = "float64",
+        float64_variables: Iterable[str] = (),
+    ) -> None:
         # Set up the instance properties
         if not isinstance(grid, Grid):
             to_raise = TypeError("Data must be initialised with a Grid object")
@@ -174,6 +244,10 @@ class Data:
         """The configured Grid to be used in a simulation."""
         self.data = Dataset()
         """The :class:`~xarray.Dataset` used to store data."""
+        self.float_dtype = np.dtype(float_dtype)
+        """The floating point type used to store data."""
+        self.float64_variables = get_float64_variables().union(float64_variables)
+        """The variables that are always stored as float64."""
         self.variable_validation: dict[str, dict[str, str | None]] = {}
         """Records validation details for loaded variables.
 
@@ -225,6 +299,13 @@ class Data:
         else:
             LOGGER.info(f"Replacing data array for '{key}'")
 
+        # Store floating point data at the configured precision. In double precision
+        # mode, data is stored as provided.
+        if self.float_dtype != np.float64 and np.issubdtype(value.dtype, np.floating):
+            dtype = np.float64 if key in self.float64_variables else self.float_dtype
+            if value.dtype != dtype:
+                value = value.astype(dtype)
+
         # Validate and store the data array
         value, valid_dict = validate_dataarray(value=value, grid=self.grid)
         self.data[key] = value
@@ -303,6 +384,10 @@ class Data:
         source file path, so that each file is only opened once to load the requested
         variables.
 
+        If the ``load_workers`` option in the data configuration is greater than one,
+        distinct files are loaded in parallel in a pool of worker processes. The data
+        are still validated and added to the instance in this process, in file order.
+
         Args:
             config: A validated Virtual Ecosystem model configuration object.
         """
@@ -344,26 +429,48 @@ class Data:
             # Group variables by file
             variables = data_config["variable"]
             variables.sort(key=lambda v: v["file_path"])
-            file_groups = groupby(variables, key=lambda v: v["file_path"])
-
-            # Load data from each data source
-            for file, file_vars in file_groups:
-                # Attempt to load the file, trapping exceptions as critical logger
-                # messages and defer failure until the whole configuration has been
-                # processed
-
-                try:
-                    loaded_data = load_to_dataarray(
-                        file=Path(file),
-                        var_names=[var["var_name"] for var in file_vars],
-                    )
-
-                except Exception as err:
-                    LOGGER.error(str(err))
-                    clean_load = False
-                else:
-                    for var_name, data_array in loaded_data.items():
-                        self[var_name] = data_array
+            file_groups = [
+                (Path(file), [var["var_name"] for var in file_vars])
+                for file, file_vars in groupby(variables, key=lambda v: v["file_path"])
+            ]
+
+            # Load data from each data source, using worker processes if requested and
+            # there is more than one file to load
+            n_workers = min(data_config.get("load_workers", 1), len(file_groups))
+
+            if n_workers > 1:
+                LOGGER.info(
+                    f"Loading {len(file_groups)} data files using {n_workers} workers"
+                )
+                executor = ProcessPoolExecutor(max_workers=n_workers)
+                loading: list[Callable[[], dict[str, DataArray]]] = [
+                    executor.submit(load_to_dataarray, file, var_names).result
+                    for file, var_names in file_groups
+                ]
+            else:
+                executor = None
+                loading = [
+                    partial(load_to_dataarray, file, var_names)
+                    for file, var_names in file_groups
+                ]
+
+            # Add the data in file order, whether the loading is running in the worker
+            # processes or is carried out here. Attempt to load each file, trapping
+            # exceptions as critical logger messages and defer failure until the whole
+            # configuration has been processed
+            try:
+                for load in loading:
+                    try:
+                        loaded_data = load()
+                    except Exception as err:
+                        LOGGER.error(str(err))
+                        clean_load = False
+                    else:
+                        for var_name, data_array in loaded_data.items():
+                            self[var_name] = data_array
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
 
         if "constant" in data_config:
             msg = "Data config for constants not yet implemented."
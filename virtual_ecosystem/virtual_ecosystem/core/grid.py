@@ -18,7 +18,6 @@ from typing import Any, TypeAlias
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.spatial.distance import cdist, pdist, squareform  # type: ignore
 from shapely.affinity import scale, translate  # type: ignore
 from shapely.geometry import GeometryCollection, Point, Polygon  # type: ignore
 
@@ -445,6 +444,8 @@ class Grid:
             _cell_to = np.array([cell_to] if isinstance(cell_to, int) else cell_to)
 
         if self._distances is None:
+            from scipy.spatial.distance import cdist  # type: ignore
+
             return cdist(self.centroids[_cell_from], self.centroids[_cell_to])
 
         return self._distances[np.ix_(_cell_from, _cell_to)]
@@ -460,6 +461,8 @@ class Grid:
         reasonable.
         """
 
+        from scipy.spatial.distance import pdist, squareform  # type: ignore
+
         self._distances = squareform(pdist(self.centroids))
 
     def map_xy_to_cell_id(
@@ -30,6 +30,27 @@ using :func:`~virtual_ecosystem.core.axes.validate_dataarray`. For example:
     @register_file_format_loader(('.tif', '.tiff'))
     def new_function_to_load_tif_data(...):
         # code to turn tif file into a data array
+
+Columnar tabular data
+=====================
+
+Tabular inputs, such as plant cohort data, can be stored as CSV or Excel files, but
+these text and spreadsheet formats have to be parsed every time a simulation is run.
+For large tables, the binary columnar Parquet (``.parquet``) and Arrow IPC (``.arrow``
+or ``.feather``) formats are much faster to load. These are read using
+:func:`~virtual_ecosystem.core.readers.load_arrow`, which only reads the columns for the
+requested variables from the file. Existing CSV or Excel files can be converted using
+:func:`~virtual_ecosystem.core.readers.convert_tabular_file`:
+
+.. code-block:: python
+
+    convert_tabular_file(
+        Path('example_plant_cohorts.csv'), Path('example_plant_cohorts.parquet')
+    )
+
+Reading and writing these formats requires the optional ``pyarrow`` package to be
+installed, which can be done using the ``arrow`` extra (``pip install
+virtual_ecosystem[arrow]``).
 """  # noqa: D205
 
 from collections.abc import Callable
@@ -233,6 +254,129 @@ def load_excel(file: Path, var_names: list[str]) -> dict[str, DataArray]:
     return {var: dataset[var].to_xarray() for var in var_names}
 
 
+@register_file_format_loader(file_types=(".parquet", ".arrow", ".feather"))
+def load_arrow(file: Path, var_names: list[str]) -> dict[str, DataArray]:
+    """Loads a DataArray from a Parquet or Arrow IPC file.
+
+    Only the columns for the requested variables are read from the file. The resulting
+    data arrays have the same structure as those loaded from a csv file.
+
+    Args:
+        file: A Path for a Parquet or Arrow IPC file containing the variables to load.
+        var_names: A list of strings providing the names of the variables to be loaded
+            from the file.
+
+    Raises:
+        ImportError: if the optional pyarrow package is not installed.
+        FileNotFoundError: with bad file path names.
+        ValueError: if the file data is not readable.
+        KeyError: if the named variable is not present in the data.
+    """
+
+    to_raise: Exception
+
+    # Import pyarrow when it is needed, as it is an optional dependency
+    try:
+        from pyarrow import ArrowException, feather, ipc, memory_map, parquet
+    except ImportError:
+        to_raise = ImportError(
+            f"Loading data from {file} requires the pyarrow package to be installed: "
+            "install virtual_ecosystem with the 'arrow' extra."
+        )
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    # Check the file exists and then read the column names without loading the data
+    if not file.exists():
+        to_raise = FileNotFoundError(f"Data file not found: {file}")
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    try:
+        if file.suffix == ".parquet":
+            columns = parquet.read_schema(file).names
+        else:
+            with memory_map(str(file)) as source:
+                columns = ipc.open_file(source).schema.names
+    except (ArrowException, OSError) as err:
+        to_raise = ValueError(f"Could not load data from {file}: {err}.")
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    # Check if file vars are in the dataset
+    missing_vars = set(var_names).difference(columns)
+    if missing_vars:
+        to_raise = KeyError(
+            f"Data variables not found in {file}: {', '.join(missing_vars)}"
+        )
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    # Load only the requested columns
+    if file.suffix == ".parquet":
+        table = parquet.read_table(file, columns=var_names)
+    else:
+        table = feather.read_table(file, columns=var_names, memory_map=True)
+
+    dataset = table.to_pandas()
+
+    return {var: dataset[var].to_xarray() for var in var_names}
+
+
+def convert_tabular_file(file: Path, output_file: Path) -> None:
+    """Converts a csv or Excel file to a columnar binary format.
+
+    The output format is set by the suffix of the output file: ``.parquet`` for Parquet
+    files or ``.arrow`` and ``.feather`` for Arrow IPC files. The converted file can
+    then be used in place of the original file in a data configuration, and is loaded
+    using :func:`~virtual_ecosystem.core.readers.load_arrow`.
+
+    Args:
+        file: A Path for the csv or Excel file to convert.
+        output_file: A Path for the converted file.
+
+    Raises:
+        ValueError: if the input or output file formats are not supported.
+        ImportError: if the optional pyarrow package is not installed.
+    """
+
+    to_raise: Exception
+
+    if file.suffix not in (".csv", ".xlsx"):
+        to_raise = ValueError(f"Cannot convert file format: {file.suffix}")
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    if output_file.suffix not in (".parquet", ".arrow", ".feather"):
+        to_raise = ValueError(f"Unknown columnar file format: {output_file.suffix}")
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    try:
+        from pyarrow import Table, feather, parquet
+    except ImportError:
+        to_raise = ImportError(
+            f"Converting {file} requires the pyarrow package to be installed: "
+            "install virtual_ecosystem with the 'arrow' extra."
+        )
+        LOGGER.critical(to_raise)
+        raise to_raise
+
+    if file.suffix == ".csv":
+        dataset = read_csv(file)
+    else:
+        dataset = read_excel(file, engine="openpyxl")
+
+    table = Table.from_pandas(dataset, preserve_index=False)
+
+    if output_file.suffix == ".parquet":
+        parquet.write_table(table, output_file)
+    else:
+        feather.write_feather(table, output_file, compression="uncompressed")
+
+    LOGGER.info(f"Converted {file} to {output_file}")
+
+
 def load_to_dataarray(
     file: Path,
     var_names: list[str],
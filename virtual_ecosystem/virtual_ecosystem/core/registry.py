@@ -9,6 +9,11 @@ core schema and constants, but does not provide a model object.
 
 The module also provides the :func:`~virtual_ecosystem.core.registry.register_module`
 function, which is used to populate the registry with the components of a given module.
+Registration can also use an entry from the startup cache (see
+:mod:`~virtual_ecosystem.core.cache`), generated using
+:func:`~virtual_ecosystem.core.registry.get_cache_entry`. This avoids reloading and
+checking the module schema and searching the module members for the model and constants
+classes.
 """  # noqa: D205
 
 from dataclasses import dataclass
@@ -62,7 +67,61 @@ registry using the stem name of the module being registered.
 """
 
 
-def register_module(module_name: str) -> None:
+def _import_object(object_path: str) -> Any:
+    """Import an object from a ``package.module:name`` path string.
+
+    Args:
+        object_path: The path to the object.
+
+    Returns:
+        The imported object.
+    """
+
+    module_path, _, object_name = object_path.partition(":")
+    return getattr(import_module(module_path), object_name)
+
+
+def _object_path(obj: Any) -> str:
+    """Get the ``package.module:name`` path string for an object.
+
+    Args:
+        obj: A class or function.
+
+    Returns:
+        The path string for the object.
+    """
+
+    return f"{obj.__module__}:{obj.__qualname__}"
+
+
+def get_cache_entry(module_name: str) -> dict[str, Any]:
+    """Get the startup cache entry for a registered module.
+
+    The entry stores the module schema along with the import paths of the model and
+    constants classes, and can be passed back to
+    :func:`~virtual_ecosystem.core.registry.register_module` to restore the registry
+    entry for the module.
+
+    Args:
+        module_name: The short name of a registered module (e.g. 'soil').
+
+    Returns:
+        A JSON serialisable dictionary of the module information.
+    """
+
+    module_info = MODULE_REGISTRY[module_name]
+
+    return {
+        "model": None if module_info.model is None else _object_path(module_info.model),
+        "schema": module_info.schema,
+        "constants_classes": {
+            class_name: _object_path(class_obj)
+            for class_name, class_obj in module_info.constants_classes.items()
+        },
+    }
+
+
+def register_module(module_name: str, cached: dict[str, Any] | None = None) -> None:
     """Register module components.
 
     This function loads the module schema, any constants classes and the main
@@ -77,9 +136,17 @@ def register_module(module_name: str) -> None:
     components required to validate and setup the model configuration for a particular
     simulation.
 
+    If a startup cache entry for the module is provided, the schema is taken directly
+    from the cache and the model and constants classes are imported from their cached
+    locations, rather than searching the module members. If any of the cached locations
+    cannot be imported, the cache entry is ignored and the module is registered from
+    scratch.
+
     Args:
         module_name: The full name of the module to be registered (e.g.
             'virtual_ecosystem.model.animal').
+        cached: An optional startup cache entry for the module, as generated by
+            :func:`~virtual_ecosystem.core.registry.get_cache_entry`.
 
     Raises:
         RuntimeError: if the requested module cannot be found or where a module does not
@@ -97,6 +164,30 @@ def register_module(module_name: str) -> None:
         LOGGER.warning(f"Module already registered: {module_name}")
         return
 
+    is_core = module_name == "virtual_ecosystem.core"
+
+    if cached is not None:
+        try:
+            model = None if cached["model"] is None else _import_object(cached["model"])
+            constants_classes = {
+                class_name: _import_object(class_path)
+                for class_name, class_path in cached["constants_classes"].items()
+            }
+        except (ImportError, AttributeError) as excep:
+            LOGGER.warning(
+                f"Startup cache entry for {module_name} is out of date, registering "
+                f"from scratch: {excep}"
+            )
+        else:
+            LOGGER.info(f"Registering module from startup cache: {module_name}")
+            MODULE_REGISTRY[module_name_short] = ModuleInfo(
+                model=model,
+                schema=cached["schema"],
+                constants_classes=constants_classes,
+                is_core=is_core,
+            )
+            return
+
     # Try and import the module from the name to get a reference to the module
     try:
         module = import_module(module_name)
@@ -104,8 +195,6 @@ def register_module(module_name: str) -> None:
         LOGGER.critical(f"Unknown module - registration failed: {module_name}")
         raise excep
 
-    is_core = module_name == "virtual_ecosystem.core"
-
     LOGGER.info(f"Registering module: {module_name}")
 
     # Locate _one_ BaseModel class in the module root if this is not the core.
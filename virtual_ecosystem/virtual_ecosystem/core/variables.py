@@ -24,7 +24,9 @@ as:
     axis = ["axis1", "axis2"]
 
 where `axis1` and `axis2` are the name of axis validators defined
-on :mod:`~virtual_ecosystem.core.axes`.
+on :mod:`~virtual_ecosystem.core.axes`. Stiff or accumulating variables, such as the
+soil and litter pools, can also set `precision = "float64"` so that they are always
+stored in double precision, even when the simulation stores data in single precision.
 """
 
 import json
@@ -42,6 +44,7 @@ from tabulate import tabulate
 
 import virtual_ecosystem.core.axes as axes
 import virtual_ecosystem.core.base_model as base_model
+from virtual_ecosystem.core.cache import cache_key, load_cache, save_cache
 from virtual_ecosystem.core.exceptions import ConfigurationError
 from virtual_ecosystem.core.logger import LOGGER
 from virtual_ecosystem.core.schema import ValidatorWithDefaults
@@ -78,6 +81,8 @@ class Variable:
     """Type of the variable."""
     axis: tuple[str, ...]
     """Axes the variable is defined on."""
+    precision: str | None = None
+    """Floating point precision the variable is always stored in, if it is fixed."""
     populated_by_init: list[str] = field(default_factory=list, init=False)
     """Model that initialised the variable either in init or by input data."""
     populated_by_update: list[str] = field(default_factory=list, init=False)
@@ -128,19 +133,31 @@ KNOWN_VARIABLES: dict[str, Variable] = {}
 
 
 def register_all_variables() -> None:
-    """Registers all variables provided by the models."""
-    with open(
-        str(resources.files("virtual_ecosystem") / "data_variables.toml"), "rb"
-    ) as f:
-        known_vars = tomllib.load(f).get("variable", [])
-
-    with (resources.files("virtual_ecosystem.core") / "variables_schema.json").open(
-        "r"
-    ) as f:
-        schema = json.load(f)
-
-    val = ValidatorWithDefaults(schema, format_checker=FormatChecker())
-    val.validate(known_vars)
+    """Registers all variables provided by the models.
+
+    The validated variable definitions are stored in the startup cache (see
+    :mod:`~virtual_ecosystem.core.cache`), so that the definitions file only needs to be
+    loaded and validated when it changes.
+    """
+
+    variables_cache_key = cache_key("variables")
+    known_vars = load_cache(variables_cache_key)
+
+    if known_vars is None:
+        with open(
+            str(resources.files("virtual_ecosystem") / "data_variables.toml"), "rb"
+        ) as f:
+            known_vars = tomllib.load(f).get("variable", [])
+
+        with (resources.files("virtual_ecosystem.core") / "variables_schema.json").open(
+            "r"
+        ) as f:
+            schema = json.load(f)
+
+        val = ValidatorWithDefaults(schema, format_checker=FormatChecker())
+        val.validate(known_vars)
+
+        save_cache(variables_cache_key, known_vars)
 
     for var in known_vars:
         Variable(**var)
@@ -116,7 +116,11 @@ def ve_run(
     if progress:
         print("* Built core model components")
 
-    data = Data(grid)
+    data = Data(
+        grid,
+        float_dtype=config["core"]["precision"]["float_dtype"],
+        float64_variables=config["core"]["precision"]["float64_variables"],
+    )
     data.load_data_config(config)
     if progress:
         print("* Initial data loaded")
@@ -148,7 +152,11 @@ def ve_run(
 
     LOGGER.info("All models successfully initialised.")
 
-    # TODO - A model spin up might be needed here in future
+    # Spin up the models, in the same order that they were initialised
+    for model in models_init.values():
+        model.spinup()
+    if progress:
+        print("* Models spun up")
 
     # Create output folder if it does not exist
     out_path = Path(config["core"]["data_output_options"]["out_path"])
@@ -9,6 +9,19 @@ Each of the animal sub-modules has its own API reference page:
   can then make use of.
 * The :mod:`~virtual_ecosystem.models.animal.animal_cohorts` provides a class for the
   individual animal cohorts, their attributes, and behaviors.
+* The :mod:`~virtual_ecosystem.models.animal.cohort_table` provides a columnar store
+  for the state of the animal cohorts, with vectorised cohort lifecycle processes.
+* The :mod:`~virtual_ecosystem.models.animal.cohort_merging` finds similar cohorts to
+  merge when the number of cohorts exceeds a configured maximum.
+* The :mod:`~virtual_ecosystem.models.animal.domain_decomposition` provides the
+  optional decomposition of animal foraging into spatial tiles foraged by worker
+  processes.
+* The :mod:`~virtual_ecosystem.models.animal.predation` resolves the predation between
+  all animal cohorts in a single batched pass.
+* The :mod:`~virtual_ecosystem.models.animal.prey_index` provides an index of the
+  cohorts in each grid cell, sorted by body mass, used to find the prey of predators.
+* The :mod:`~virtual_ecosystem.models.animal.random_streams` provides the independent
+  random number generators used by the stochastic animal processes.
 * The :mod:`~virtual_ecosystem.models.animal.functional_group` provides a class for
   the animal functional groups that define the type of animal in an animal cohort.
 * The :mod:`~virtual_ecosystem.models.animal.animal_traits` provides classes for
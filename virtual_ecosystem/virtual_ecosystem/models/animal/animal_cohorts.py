@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import random
 import uuid
+from collections.abc import Sequence
 from math import ceil, exp, sqrt
-from typing import Literal
 
 from numpy import timedelta64
 
@@ -14,6 +14,14 @@ from virtual_ecosystem.core.grid import Grid
 from virtual_ecosystem.core.logger import LOGGER
 from virtual_ecosystem.models.animal.animal_traits import VerticalOccupancy
 from virtual_ecosystem.models.animal.cnp import CNP
+from virtual_ecosystem.models.animal.cohort_table import (
+    LOCATION_STATUSES,
+    CohortColumn,
+    CohortMassCNP,
+    CohortReproductiveCNP,
+    CohortTable,
+    LocationStatus,
+)
 from virtual_ecosystem.models.animal.constants import AnimalConsts
 from virtual_ecosystem.models.animal.decay import (
     CarcassPool,
@@ -26,7 +34,23 @@ from virtual_ecosystem.models.animal.protocols import Resource
 
 
 class AnimalCohort:
-    """This is a class of animal cohorts."""
+    """This is a class of animal cohorts.
+
+    The mass, population size, age, location and status of the cohort are stored in a
+    row of a :class:`~virtual_ecosystem.models.animal.cohort_table.CohortTable`, and the
+    corresponding attributes are views onto that row. If no table is provided, the
+    cohort is given a table of its own.
+    """
+
+    age = CohortColumn[float]()
+    individuals = CohortColumn[int]()
+    centroid_key = CohortColumn[int]()
+    remaining_time_away = CohortColumn[float]()
+    is_alive = CohortColumn[bool]()
+    is_mature = CohortColumn[bool]()
+    time_to_maturity = CohortColumn[float]()
+    time_since_maturity = CohortColumn[float]()
+    largest_mass_achieved = CohortColumn[float]()
 
     def __init__(
         self,
@@ -37,6 +61,7 @@ class AnimalCohort:
         centroid_key: int,
         grid: Grid,
         constants: AnimalConsts = AnimalConsts(),
+        table: CohortTable | None = None,
     ) -> None:
         if age < 0:
             raise ValueError("Age must be a positive number.")
@@ -44,6 +69,13 @@ class AnimalCohort:
         if mass < 0:
             raise ValueError("Mass must be a positive number.")
         """Check if mass is a positive number."""
+        self.table: CohortTable
+        """The cohort table holding the state of the cohort."""
+        self.row: int
+        """The row of the cohort table holding the state of the cohort."""
+        if table is None:
+            table = CohortTable(constants=constants, capacity=1)
+        table.add(self, functional_group)
         self.functional_group = functional_group
         """The functional group of the animal cohort which holds constants."""
         self.name = functional_group.name
@@ -58,19 +90,19 @@ class AnimalCohort:
         """The the grid structure of the simulation."""
         self.constants = constants
         """Animal constants."""
-        self.location_status: Literal["active", "migrated", "aquatic"] = "active"
+        self.location_status = "active"
         """Location status of the cohort, active means present and participating."""
-        self.remaining_time_away: float = 0.0
+        self.remaining_time_away = 0.0
         """Remaining time that the cohort is frozen in a migrated or aquatic state."""
         self.id: uuid.UUID = uuid.uuid4()
         """A unique identifier for the cohort."""
-        self.is_alive: bool = True
+        self.is_alive = True
         """Whether the cohort is alive [True] or dead [False]."""
-        self.is_mature: bool = False
+        self.is_mature = False
         """Whether the cohort has reached adult body-mass."""
-        self.time_to_maturity: float = 0.0
+        self.time_to_maturity = 0.0
         """The amount of time [days] between birth and adult body-mass."""
-        self.time_since_maturity: float = 0.0
+        self.time_since_maturity = 0.0
         """The amount of time [days] since reaching adult body-mass."""
         self.prey_groups: dict[str, tuple[float, float]] = {}
         """The identification of usable food resources."""
@@ -80,7 +112,7 @@ class AnimalCohort:
         """The proportion of the cohort that is within a territorial given grid cell."""
         self._initialize_territory(centroid_key)
         """Initialize the territory using the centroid grid key."""
-        self.territory: list[int]
+        self.territory: tuple[int, ...]
         """The list of grid cells currently occupied by the cohort."""
         # TODO - In future this should be parameterised using a constants dataclass, but
         # this hasn't yet been implemented for the animal model
@@ -99,19 +131,29 @@ class AnimalCohort:
         if not abs(sum(self.cnp_proportions.values()) - 1.0) < 1e-6:
             raise ValueError("CNP proportions must sum to 1.")
 
-        self.mass_cnp = CNP(
-            carbon=mass * self.cnp_proportions["carbon"],
-            nitrogen=mass * self.cnp_proportions["nitrogen"],
-            phosphorus=mass * self.cnp_proportions["phosphorus"],
-        )
+        self.mass_cnp: CNP = CohortMassCNP(self)
         """The mass of C, N, and P in the cohort, from total mass and proportions."""
+        self.mass_cnp.carbon = mass * self.cnp_proportions["carbon"]
+        self.mass_cnp.nitrogen = mass * self.cnp_proportions["nitrogen"]
+        self.mass_cnp.phosphorus = mass * self.cnp_proportions["phosphorus"]
 
-        self.reproductive_mass_cnp = CNP(0.0, 0.0, 0.0)
+        self.reproductive_mass_cnp: CNP = CohortReproductiveCNP(self)
         """The reproductive mass of each stoichiometric element found in the animal
           cohort, {"carbon": value, "nitrogen": value, "phosphorus": value}."""
-        self.largest_mass_achieved: float = mass
+        self.largest_mass_achieved = mass
         """The largest body-mass ever achieved by this cohort [kg]."""
 
+    @property
+    def location_status(self) -> LocationStatus:
+        """Location status of the cohort, active means present and participating."""
+        return LOCATION_STATUSES[self.table.columns["location_status"].item(self.row)]
+
+    @location_status.setter
+    def location_status(self, status: LocationStatus) -> None:
+        self.table.columns["location_status"][self.row] = LOCATION_STATUSES.index(
+            status
+        )
+
     @property
     def mass_current(self) -> float:
         """Dynamically calculate the current total body mass from CNP object."""
@@ -135,11 +177,11 @@ class AnimalCohort:
                 self.mass_current, self.functional_group.adult_mass
             )
 
-    def get_territory_cells(self, centroid_key: int) -> list[int]:
-        """This calls bfs_territory to determine the scope of the territory.
+    def get_territory_cells(self, centroid_key: int) -> tuple[int, ...]:
+        """This calls get_territory to determine the scope of the territory.
 
-        TODO: local import of bfs_territory is temporary while deciding whether to keep
-        animal_territory.py
+        The territories are cached by centroid and size, so cohorts of the same size
+        born or migrating into the same grid cell share the same territory.
 
         Args:
             centroid_key: The central grid cell key of the territory.
@@ -148,9 +190,9 @@ class AnimalCohort:
         # Each grid cell is 1 hectare, territory size in grids is the same as hectares
         target_cell_number = int(self.territory_size)
 
-        # Perform BFS to determine the territory cells
-        territory_cells = sf.bfs_territory(
-            centroid_key,
+        # Look up the territory cells, only running a BFS near the grid edges
+        territory_cells = sf.get_territory(
+            int(centroid_key),
             target_cell_number,
             self.grid.cell_nx,
             self.grid.cell_ny,
@@ -173,7 +215,7 @@ class AnimalCohort:
 
         self.territory = self.get_territory_cells(centroid_key)
 
-    def update_territory(self, new_grid_cell_keys: list[int]) -> None:
+    def update_territory(self, new_grid_cell_keys: tuple[int, ...]) -> None:
         """Update territory details at initialization and after migration.
 
         Args:
@@ -1264,6 +1306,7 @@ class AnimalCohort:
         scavenge_carcass_pools: list[Resource],
         scavenge_excrement_pools: list[Resource],
         herbivory_waste_pools: dict[int, HerbivoryWaste],
+        predation_gain: dict[str, float] | None = None,
     ) -> None:
         """Coordinate all resource consumption for a single cohort.
 
@@ -1288,7 +1331,9 @@ class AnimalCohort:
                 the territory that the cohort will consume via coprophagy.
             herbivory_waste_pools: Mapping ``cell_id → HerbivoryWaste`` for
                 litter generated by partial plant consumption.
-
+            predation_gain: The stoichiometric mass already gained from predation
+                when this has been resolved for all cohorts at once, see
+                :func:`~virtual_ecosystem.models.animal.predation.resolve_predation`.
 
         """
         if self.individuals == 0:
@@ -1313,6 +1358,10 @@ class AnimalCohort:
             for k in total_gain:
                 total_gain[k] += gain[k]
 
+        if predation_gain is not None:
+            for k in total_gain:
+                total_gain[k] += predation_gain[k]
+
         # litter detritivory
         if litter_pools:
             gain = self.delta_mass_detritivory(litter_pools)
@@ -1544,12 +1593,13 @@ class AnimalCohort:
 
     def get_prey(
         self,
-        communities: dict[int, list[AnimalCohort]],
+        communities: dict[int, dict[uuid.UUID, AnimalCohort]],
     ) -> list[AnimalCohort]:
         """Collect suitable prey cohorts within the cohort's territory.
 
         Args:
-            communities: Dictionary mapping cell IDs to lists of animal cohorts.
+            communities: Dictionary mapping cell IDs to the animal cohorts in each cell,
+                keyed by cohort ID.
 
         Returns:
             List of animal cohorts that can be preyed upon.
@@ -1557,7 +1607,7 @@ class AnimalCohort:
         prey_list: list[AnimalCohort] = []
 
         for cell_id in self.territory:
-            for prey_cohort in communities[cell_id]:
+            for prey_cohort in communities[cell_id].values():
                 if self.can_prey_on(prey_cohort):
                     prey_list.append(prey_cohort)
 
@@ -1678,7 +1728,7 @@ class AnimalCohort:
 
     def find_intersecting_carcass_pools(
         self,
-        prey_territory: list[int],
+        prey_territory: Sequence[int],
         carcass_pools: dict[int, list[CarcassPool]],
     ) -> list[CarcassPool]:
         """Find the carcass pools of the intersection of two territories.
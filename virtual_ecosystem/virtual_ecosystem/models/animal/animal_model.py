@@ -18,11 +18,15 @@ by downstream functions so that all model configuration failures can be reported
 from __future__ import annotations
 
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import chain
 from math import ceil, sqrt
-from random import choice, random
-from typing import Any, cast
+from typing import Any
 
+import numpy as np
 from numpy import array, inf, timedelta64, zeros
+from numpy.typing import NDArray
 from xarray import DataArray
 
 from virtual_ecosystem.core.base_model import BaseModel
@@ -37,20 +41,44 @@ from virtual_ecosystem.models.animal.animal_traits import (
     DietType,
     ReproductiveEnvironment,
 )
-from virtual_ecosystem.models.animal.cnp import CNP
+from virtual_ecosystem.models.animal.cohort_merging import (
+    CohortMergingOptions,
+    find_merge_pairs,
+)
+from virtual_ecosystem.models.animal.cohort_table import CohortTable
 from virtual_ecosystem.models.animal.constants import AnimalConsts
 from virtual_ecosystem.models.animal.decay import (
+    POOL_NUTRIENTS,
     CarcassPool,
+    DecayPoolArrays,
     ExcrementPool,
     HerbivoryWaste,
     LitterPool,
+    PoolCNP,
+)
+from virtual_ecosystem.models.animal.domain_decomposition import (
+    AnimalTile,
+    DomainDecompositionOptions,
+    ForagingResources,
+    assign_tiles,
+    colour_tiles,
+    detach_cohorts,
+    forage_cohorts,
+    forage_tile,
+    restore_cohorts,
 )
 from virtual_ecosystem.models.animal.functional_group import (
     FunctionalGroup,
     get_functional_group_by_name,
 )
 from virtual_ecosystem.models.animal.plant_resources import PlantResources
+from virtual_ecosystem.models.animal.predation import (
+    find_predation_encounters,
+    resolve_predation,
+)
+from virtual_ecosystem.models.animal.prey_index import PreyIndex
 from virtual_ecosystem.models.animal.protocols import Resource
+from virtual_ecosystem.models.animal.random_streams import AnimalRandomStreams
 from virtual_ecosystem.models.animal.scaling_functions import (
     damuths_law,
     prey_group_selection,
@@ -144,10 +172,17 @@ class AnimalModel(
 
         super().__init__(data, core_components, static, **kwargs)
 
-        self.communities: dict[int, list[AnimalCohort]]
-        """Animal communities with grid cell IDs and lists of AnimalCohorts."""
+        self.communities: dict[int, dict[uuid.UUID, AnimalCohort]]
+        """Animal communities with grid cell IDs and the AnimalCohorts occupying each
+        cell, keyed by cohort ID."""
         self.active_cohorts: dict[uuid.UUID, AnimalCohort] = {}
         """A dictionary of all active animal cohorts and their unique ids."""
+        self.cohort_table: CohortTable
+        """The columnar store holding the state of the cohorts in the model."""
+        self.prey_index: PreyIndex
+        """The index of the cohorts in each grid cell used to find prey."""
+        self.cohort_merging: CohortMergingOptions | None
+        """The settings used to merge similar cohorts, if cohorts are merged."""
         self.migrated_cohorts: dict[uuid.UUID, AnimalCohort] = {}
         """A dictionary of all migrated animal cohorts and their unique ids."""
         self.aquatic_cohorts: dict[uuid.UUID, AnimalCohort] = {}
@@ -160,12 +195,24 @@ class AnimalModel(
         """Animal constants."""
         self.plant_resources: dict[int, list[Resource]]
         """The plant resource pools in the model with associated grid cell ids."""
+        self.excrement_masses: DecayPoolArrays
+        """The nutrient masses of the excrement pools in every grid cell."""
         self.excrement_pools: dict[int, list[ExcrementPool]]
         """The excrement pools in the model with associated grid cell ids."""
+        self.carcass_masses: DecayPoolArrays
+        """The nutrient masses of the carcass pools in every grid cell."""
         self.carcass_pools: dict[int, list[CarcassPool]]
         """The carcass pools in the model with associated grid cell ids."""
+        self.leaf_waste_masses: NDArray[np.float64]
+        """The nutrient masses of the leaf herbivory waste in every grid cell."""
         self.leaf_waste_pools: dict[int, HerbivoryWaste]
         """A pool for leaves removed by herbivory but not actually consumed."""
+        self.domain_decomposition: DomainDecompositionOptions | None
+        """The settings used to decompose foraging into tiles, if it is decomposed."""
+        self.cell_tiles: NDArray[np.int_]
+        """The domain decomposition tile of each grid cell."""
+        self.random_streams: AnimalRandomStreams
+        """The random number generators of the stochastic animal processes."""
         self.litter_pools: dict[int, dict[str, Resource]] = self.populate_litter_pools()
         """The litter pools with associated grid cell ids."""
 
@@ -188,7 +235,7 @@ class AnimalModel(
         """
         # Initialize communities dictionary with cell IDs as keys and empty lists for
         # cohorts
-        self.communities = {cell_id: list() for cell_id in self.data.grid.cell_id}
+        self.communities = {cell_id: dict() for cell_id in self.data.grid.cell_id}
 
         # Iterate over each cell and functional group to create and populate cohorts
         for cell_id in self.data.grid.cell_id:
@@ -225,6 +272,8 @@ class AnimalModel(
         # Load in the relevant constants
         model_constants = load_constants(config, "animal", "AnimalConsts")
         static = config["animal"]["static"]
+        cohort_merging = config["animal"]["cohort_merging"]
+        domain_decomposition = config["animal"]["domain_decomposition"]
 
         # Load functional groups
         functional_groups = [
@@ -243,12 +292,30 @@ class AnimalModel(
             static=static,
             functional_groups=functional_groups,
             model_constants=model_constants,
+            cohort_merging=(
+                CohortMergingOptions(max_cohorts=cohort_merging["max_cohorts"])
+                if cohort_merging["enabled"]
+                else None
+            ),
+            domain_decomposition=(
+                DomainDecompositionOptions(
+                    tiles_x=domain_decomposition["tiles_x"],
+                    tiles_y=domain_decomposition["tiles_y"],
+                    workers=domain_decomposition["workers"],
+                )
+                if domain_decomposition["enabled"]
+                else None
+            ),
+            random_seed=config["animal"].get("random_seed"),
         )
 
     def _setup(
         self,
         functional_groups: list[FunctionalGroup],
         model_constants: AnimalConsts = AnimalConsts(),
+        cohort_merging: CohortMergingOptions | None = None,
+        domain_decomposition: DomainDecompositionOptions | None = None,
+        random_seed: int | None = None,
         **kwargs: Any,
     ) -> None:
         """Method to setup the animal model specific data variables.
@@ -259,6 +326,12 @@ class AnimalModel(
             functional_groups: The list of animal functional groups present in the
                 simulation.
             model_constants: Set of constants for the animal model.
+            cohort_merging: The settings used to merge similar cohorts, or None if
+                cohorts are not merged.
+            domain_decomposition: The settings used to decompose the foraging of cohorts
+                into spatial tiles, or None if foraging is not decomposed.
+            random_seed: The seed of the random streams of the stochastic animal
+                processes, or None to seed them from operating system entropy.
             **kwargs: Further arguments to the setup method.
         """
         days_as_float = self.model_timing.update_interval_quantity.to("days").magnitude
@@ -279,34 +352,55 @@ class AnimalModel(
         }
         # TODO - In future, need to take in data on average size of excrement and
         # carcasses pools and their stoichiometries for the initial scavengeable pool
-        # parameterisations
+        # parameterisations. The pools of each grid cell are views onto the rows of
+        # the arrays holding the pool masses of every grid cell.
+        self.excrement_masses = DecayPoolArrays(self.data.grid.n_cells)
+        self.excrement_masses.scavengeable[:] = (1e-3, 1e-4, 1e-6)
         self.excrement_pools = {
             cell_id: [
                 ExcrementPool(
-                    scavengeable_cnp=CNP(1e-3, 1e-4, 1e-6),
-                    decomposed_cnp=CNP(0.0, 0.0, 0.0),
+                    scavengeable_cnp=self.excrement_masses.scavengeable_cnp(cell_index),
+                    decomposed_cnp=self.excrement_masses.decomposed_cnp(cell_index),
                 )
             ]
-            for cell_id in self.data.grid.cell_id
+            for cell_index, cell_id in enumerate(self.data.grid.cell_id)
         }
 
+        self.carcass_masses = DecayPoolArrays(self.data.grid.n_cells)
+        self.carcass_masses.scavengeable[:] = (1e-3, 1e-4, 1e-6)
         self.carcass_pools = {
             cell_id: [
                 CarcassPool(
-                    scavengeable_cnp=CNP(1e-3, 1e-4, 1e-6),
-                    decomposed_cnp=CNP(0.0, 0.0, 0.0),
+                    scavengeable_cnp=self.carcass_masses.scavengeable_cnp(cell_index),
+                    decomposed_cnp=self.carcass_masses.decomposed_cnp(cell_index),
                 )
             ]
-            for cell_id in self.data.grid.cell_id
+            for cell_index, cell_id in enumerate(self.data.grid.cell_id)
         }
 
+        self.leaf_waste_masses = zeros((self.data.grid.n_cells, len(POOL_NUTRIENTS)))
         self.leaf_waste_pools = {
-            cell_id: HerbivoryWaste(plant_matter_type="leaf")
-            for cell_id in self.data.grid.cell_id
+            cell_id: HerbivoryWaste(
+                plant_matter_type="leaf",
+                mass_cnp=PoolCNP(self.leaf_waste_masses[cell_index]),
+            )
+            for cell_index, cell_id in enumerate(self.data.grid.cell_id)
         }
 
+        self.cohort_table = CohortTable(constants=self.model_constants)
+        self.cohort_merging = cohort_merging
+        self.random_streams = AnimalRandomStreams(random_seed)
+        self.domain_decomposition = domain_decomposition
+        self.cell_tiles = zeros(self.data.grid.n_cells, dtype=np.int_)
+        if domain_decomposition is not None:
+            self.cell_tiles = assign_tiles(
+                self.data.grid,
+                domain_decomposition.tiles_x,
+                domain_decomposition.tiles_y,
+            )
         self.active_cohorts = {}
-        self.communities = {cell_id: list() for cell_id in self.data.grid.cell_id}
+        self.communities = {cell_id: dict() for cell_id in self.data.grid.cell_id}
+        self.prey_index = PreyIndex(self.cohort_table, self.data.grid.cell_id)
 
         self._initialize_communities(functional_groups)
         """Create the dictionary of animal communities and populate each community with
@@ -403,6 +497,7 @@ class AnimalModel(
         - Updating timers for migrated or aquatic cohorts
         - Reintegration of previously inactive cohorts
         - Removal of dead cohorts
+        - Merging of similar cohorts, if the number of cohorts exceeds the maximum
 
         Args:
             dt: Time step duration [days].
@@ -411,6 +506,7 @@ class AnimalModel(
         self.update_migrated_and_aquatic(dt)
         self.reintegrate_community()
         self.remove_dead_cohort_community()
+        self.merge_cohort_community()
 
     def update_cohort_bookkeeping(self, dt: timedelta64) -> None:
         """Perform lifecycle-related updates for each cohort.
@@ -526,28 +622,16 @@ class AnimalModel(
             the proportion of input carbon that is lignin [unitless].
         """
 
+        carbon, nitrogen, phosphorus = self.leaf_waste_masses.T
+
         # Find the size of the leaf waste pool (in carbon terms)
-        leaf_addition = [
-            self.leaf_waste_pools[cell_id].mass_cnp["carbon"] / self.data.grid.cell_area
-            for cell_id in self.data.grid.cell_id
-        ]
+        leaf_addition = carbon / self.data.grid.cell_area
 
         # Find the chemistry of the pools, handling different cases properly
-        leaf_c_n = [
-            self.leaf_waste_pools[cell_id].mass_cnp["carbon"]
-            / self.leaf_waste_pools[cell_id].mass_cnp["nitrogen"]
-            if self.leaf_waste_pools[cell_id].mass_cnp["nitrogen"] > 0
-            else (inf if self.leaf_waste_pools[cell_id].mass_cnp["carbon"] > 0 else 0.0)
-            for cell_id in self.data.grid.cell_id
-        ]
-
-        leaf_c_p = [
-            self.leaf_waste_pools[cell_id].mass_cnp["carbon"]
-            / self.leaf_waste_pools[cell_id].mass_cnp["phosphorus"]
-            if self.leaf_waste_pools[cell_id].mass_cnp["phosphorus"] > 0
-            else (inf if self.leaf_waste_pools[cell_id].mass_cnp["carbon"] > 0 else 0.0)
-            for cell_id in self.data.grid.cell_id
-        ]
+        no_carbon_ratio = np.where(carbon > 0, inf, 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            leaf_c_n = np.where(nitrogen > 0, carbon / nitrogen, no_carbon_ratio)
+            leaf_c_p = np.where(phosphorus > 0, carbon / phosphorus, no_carbon_ratio)
 
         leaf_lignin = [
             self.leaf_waste_pools[cell_id].lignin_proportion
@@ -555,19 +639,12 @@ class AnimalModel(
         ]
 
         # Reset all of the herbivory waste pools to zero
-        for waste in self.leaf_waste_pools.values():
-            waste.mass_cnp["carbon"] = 0.0
-            waste.mass_cnp["nitrogen"] = 0.0
-            waste.mass_cnp["phosphorus"] = 0.0
+        self.leaf_waste_masses[:] = 0.0
 
         return {
-            "herbivory_waste_leaf_carbon": DataArray(
-                array(leaf_addition), dims="cell_id"
-            ),
-            "herbivory_waste_leaf_nitrogen": DataArray(array(leaf_c_n), dims="cell_id"),
-            "herbivory_waste_leaf_phosphorus": DataArray(
-                array(leaf_c_p), dims="cell_id"
-            ),
+            "herbivory_waste_leaf_carbon": DataArray(leaf_addition, dims="cell_id"),
+            "herbivory_waste_leaf_nitrogen": DataArray(leaf_c_n, dims="cell_id"),
+            "herbivory_waste_leaf_phosphorus": DataArray(leaf_c_p, dims="cell_id"),
             "herbivory_waste_leaf_lignin": DataArray(
                 array(leaf_lignin), dims="cell_id"
             ),
@@ -576,96 +653,75 @@ class AnimalModel(
     def calculate_soil_additions(self) -> dict[str, DataArray]:
         """Calculate how much animal matter should be transferred to the soil."""
 
-        nutrients = ["carbon", "nitrogen", "phosphorus"]
-
-        # Find the size of all decomposed excrement and carcass pools, by cell_id
-        decomposed_excrement = {
-            nutrient: [
-                pool.decomposed_nutrient_per_area(
-                    nutrient=nutrient, grid_cell_area=self.data.grid.cell_area
-                )
-                for cell_id, pools in self.excrement_pools.items()
-                for pool in pools
-            ]
-            for nutrient in nutrients
+        # Decomposed masses per area and per day of the update interval
+        cell_area = self.data.grid.cell_area
+        days = self.model_timing.update_interval_quantity.to("days").magnitude
+        decomposed = {
+            "excrement": self.excrement_masses.decomposed / cell_area / days,
+            "carcasses": self.carcass_masses.decomposed / cell_area / days,
         }
 
-        decomposed_carcasses = {
-            nutrient: [
-                pool.decomposed_nutrient_per_area(
-                    nutrient=nutrient, grid_cell_area=self.data.grid.cell_area
-                )
-                for cell_id, pools in self.carcass_pools.items()
-                for pool in pools
-            ]
-            for nutrient in nutrients
-        }
-
-        # Reset all decomposed excrement pools to zero
-        for excrement_pools in self.excrement_pools.values():
-            for excrement_pool in excrement_pools:
-                excrement_pool.reset()
-
-        for carcass_pools in self.carcass_pools.values():
-            for carcass_pool in carcass_pools:
-                carcass_pool.reset()
+        # Reset all decomposed excrement and carcass pools to zero
+        self.excrement_masses.reset()
+        self.carcass_masses.reset()
 
         # Create the output DataArray for each nutrient
         return {
-            "decomposed_excrement_carbon": DataArray(
-                array(decomposed_excrement["carbon"])
-                / self.model_timing.update_interval_quantity.to("days").magnitude,
-                dims="cell_id",
-            ),
-            "decomposed_excrement_nitrogen": DataArray(
-                array(decomposed_excrement["nitrogen"])
-                / self.model_timing.update_interval_quantity.to("days").magnitude,
-                dims="cell_id",
-            ),
-            "decomposed_excrement_phosphorus": DataArray(
-                array(decomposed_excrement["phosphorus"])
-                / self.model_timing.update_interval_quantity.to("days").magnitude,
-                dims="cell_id",
-            ),
-            "decomposed_carcasses_carbon": DataArray(
-                array(decomposed_carcasses["carbon"])
-                / self.model_timing.update_interval_quantity.to("days").magnitude,
-                dims="cell_id",
-            ),
-            "decomposed_carcasses_nitrogen": DataArray(
-                array(decomposed_carcasses["nitrogen"])
-                / self.model_timing.update_interval_quantity.to("days").magnitude,
-                dims="cell_id",
-            ),
-            "decomposed_carcasses_phosphorus": DataArray(
-                array(decomposed_carcasses["phosphorus"])
-                / self.model_timing.update_interval_quantity.to("days").magnitude,
-                dims="cell_id",
-            ),
+            f"decomposed_{pool}_{nutrient}": DataArray(masses[:, index], dims="cell_id")
+            for pool, masses in decomposed.items()
+            for index, nutrient in enumerate(POOL_NUTRIENTS)
         }
 
+    def community_memberships(self) -> tuple[NDArray[np.int_], NDArray[np.int_]]:
+        """Get the grid cell and cohort table row of every community membership.
+
+        A cohort is a member of the community of each grid cell in its territory. The
+        memberships are ordered by grid cell, and then by the order of the cohorts in
+        each community.
+
+        Returns:
+            The grid cell ID and the cohort table row of each membership.
+        """
+
+        cell_ids = np.repeat(
+            np.array(list(self.communities), dtype=np.int_),
+            [len(community) for community in self.communities.values()],
+        )
+        rows = self.cohort_table.rows(
+            chain.from_iterable(
+                community.values() for community in self.communities.values()
+            )
+        )
+        return cell_ids, rows
+
     def update_population_densities(self) -> None:
-        """Updates the densities for each functional group in each community."""
+        """Updates the densities for each functional group in each community.
+
+        The densities of the cohorts in each community are summed by functional group
+        in a single grouped reduction, and the population densities are then written
+        in one pass.
+        """
 
-        for community_id, community in self.communities.items():
-            # Create a dictionary to accumulate densities by functional group
-            fg_density_dict = {}
+        cell_ids, rows = self.community_memberships()
+        table = self.cohort_table
+        functional_group_names = [fg.name for fg in self.functional_groups]
+        group_positions = np.array(
+            [functional_group_names.index(fg.name) for fg in table.functional_groups],
+            dtype=np.int_,
+        )
+        groups = group_positions[table.columns["functional_group_index"][rows]]
 
-            for cohort in community:
-                fg_name = cohort.functional_group.name
-                fg_density = self.calculate_density_for_cohort(cohort)
+        # Population density of each cohort in each community (individuals/m2)
+        densities = table.columns["individuals"][rows] / self.data.grid.cell_area
 
-                # Sum the density for the functional group
-                if fg_name not in fg_density_dict:
-                    fg_density_dict[fg_name] = 0.0
-                fg_density_dict[fg_name] += fg_density
+        n_groups = len(functional_group_names)
+        population_densities = np.bincount(
+            cell_ids * n_groups + groups,
+            weights=densities,
+            minlength=self.data.grid.n_cells * n_groups,
+        ).reshape(self.data.grid.n_cells, n_groups)
 
-            # Update the corresponding entries in the data variable for each
-            # functional group
-            for fg_name, fg_density in fg_density_dict.items():
-                self.data["population_densities"].loc[
-                    {"community_id": community_id, "functional_group_id": fg_name}
-                ] = fg_density
+        self.data["population_densities"].data[:] = population_densities
 
     def calculate_density_for_cohort(self, cohort: AnimalCohort) -> float:
         """Calculate the population density for a cohort within a specific community.
@@ -696,9 +752,8 @@ class AnimalModel(
             cohort: The cohort to be removed from the occupancy lists.
         """
         for cell_id in cohort.territory:
-            self.communities[cell_id] = [
-                c for c in self.communities[cell_id] if c.id != cohort.id
-            ]
+            self.communities[cell_id].pop(cohort.id, None)
+        self.prey_index.remove(cohort, cohort.territory)
 
     def update_community_occupancy(
         self, cohort: AnimalCohort, centroid_key: int
@@ -714,7 +769,8 @@ class AnimalModel(
         cohort.update_territory(territory_cells)
 
         for cell_id in territory_cells:
-            self.communities[cell_id].append(cohort)
+            self.communities[cell_id][cohort.id] = cohort
+        self.prey_index.add(cohort, territory_cells)
 
     def migrate(self, migrant: AnimalCohort, destination_centroid: int) -> None:
         """Function to move an AnimalCohort between grid cells.
@@ -734,13 +790,13 @@ class AnimalModel(
 
         # Remove the cohort from its current community
         current_centroid = migrant.centroid_key
-        self.communities[current_centroid].remove(migrant)
+        self.communities[current_centroid].pop(migrant.id, None)
 
         # Update the cohort's cell ID to the destination cell ID
         migrant.centroid_key = destination_centroid
 
         # Add the cohort to the destination community
-        self.communities[destination_centroid].append(migrant)
+        self.communities[destination_centroid][migrant.id] = migrant
 
         # Regenerate a territory for the cohort at the destination community
         self.abandon_communities(migrant)
@@ -753,27 +809,41 @@ class AnimalModel(
         1) The cohort is starving and needs to move for a chance at resource access
         2) An initial migration event immediately after birth.
 
+        The dispersal of juveniles and the destinations of the migrating cohorts are
+        drawn in batches from the migration random stream.
+
         TODO: MGO - migrate distance mod for larger territories?
 
 
         """
-        for cohort in self.active_cohorts.values():
-            is_starving = cohort.is_below_mass_threshold(
-                self.model_constants.dispersal_mass_threshold
-            )
-            is_juvenile_and_migrate = (
-                cohort.age == 0.0 and random() <= cohort.migrate_juvenile_probability()
-            )
-            migrate = is_starving or is_juvenile_and_migrate
-
-            if not migrate:
-                continue
-
-            # Get the list of neighbors for the current cohort's cell
-            neighbour_keys = self.data.grid.neighbours[cohort.centroid_key]
+        cohorts = list(self.active_cohorts.values())
+        rows = self.cohort_table.rows(cohorts)
+        starving = self.cohort_table.is_below_mass_threshold(
+            rows, self.model_constants.dispersal_mass_threshold
+        )
+        rng = self.random_streams.migration
+
+        # Juvenile dispersal is drawn for every cohort, so that the draws of each
+        # cohort do not depend on the ages of the other cohorts
+        is_juvenile = self.cohort_table.columns["age"][rows] == 0.0
+        juvenile_probability = np.array(
+            [
+                cohort.migrate_juvenile_probability() if juvenile else 0.0
+                for cohort, juvenile in zip(cohorts, is_juvenile)
+            ]
+        )
+        disperses = is_juvenile & (rng.random(len(cohorts)) <= juvenile_probability)
+
+        # Choose a neighbouring cell of the current cell of each migrating cohort
+        migrants = np.flatnonzero(starving | disperses)
+        centroids = self.cohort_table.columns["centroid_key"][rows[migrants]]
+        neighbour_keys = [self.data.grid.neighbours[key] for key in centroids]
+        destinations = rng.integers(
+            0, np.array([len(keys) for keys in neighbour_keys], dtype=np.int_)
+        )
 
-            destination_key = choice(neighbour_keys)
-            self.migrate(cohort, destination_key)
+        for index, keys, destination in zip(migrants, neighbour_keys, destinations):
+            self.migrate(cohorts[index], int(keys[destination]))
 
     def remove_dead_cohort(self, cohort: AnimalCohort) -> None:
         """Removes an AnimalCohort from the model's cohorts and relevant communities.
@@ -787,29 +857,96 @@ class AnimalModel(
         Raises:
             KeyError: If the cohort ID does not exist in the model's cohorts.
         """
-        # Check if the cohort exists in self.active_cohorts
-        if cohort.id in self.active_cohorts:
-            # Iterate over all grid cell keys in the cohort's territory
+        self.remove_dead_cohorts([cohort])
+
+    def remove_dead_cohorts(self, cohorts: list[AnimalCohort]) -> None:
+        """Removes a set of AnimalCohorts from the model in a single pass.
+
+        Each cohort is removed from the communities of its territory, the prey index,
+        the model's main cohort dictionary and the cohort table. All of the cohorts are
+        checked before any are removed.
+
+        Args:
+            cohorts: The AnimalCohorts to be removed.
+
+        Raises:
+            KeyError: If a cohort ID does not exist in the model's cohorts.
+        """
+        for cohort in cohorts:
+            if cohort.id not in self.active_cohorts:
+                raise KeyError(f"Cohort with ID {cohort.id} does not exist.")
+
+        for cohort in cohorts:
             for cell_id in cohort.territory:
-                if cell_id in self.communities and cohort in self.communities[cell_id]:
-                    self.communities[cell_id].remove(cohort)
+                self.communities[cell_id].pop(cohort.id, None)
+            self.prey_index.remove(cohort, cohort.territory)
 
-            # Remove the cohort from the model's cohorts dictionary
+            # Remove the cohort from the model's cohorts dictionary and table
             del self.active_cohorts[cohort.id]
-        else:
-            raise KeyError(f"Cohort with ID {cohort.id} does not exist.")
+            self.cohort_table.remove(cohort)
 
     def remove_dead_cohort_community(self) -> None:
         """This handles remove_dead_cohort for all cohorts in a community."""
         # Collect cohorts to remove (to avoid modifying the dictionary during iteration)
+        cohorts = list(self.active_cohorts.values())
+        individuals = self.cohort_table.columns["individuals"][
+            self.cohort_table.rows(cohorts)
+        ]
         cohorts_to_remove = [
-            cohort for cohort in self.active_cohorts.values() if cohort.individuals == 0
+            cohort for cohort, count in zip(cohorts, individuals) if count == 0
         ]
 
-        # Remove each cohort
+        # Remove the cohorts in a single pass
         for cohort in cohorts_to_remove:
             cohort.is_alive = False
-            self.remove_dead_cohort(cohort)
+        self.remove_dead_cohorts(cohorts_to_remove)
+
+    def merge_cohort_community(self) -> None:
+        """Merge similar cohorts when the number of active cohorts exceeds the maximum.
+
+        Pairs of similar cohorts are found with
+        :func:`~virtual_ecosystem.models.animal.cohort_merging.find_merge_pairs` and
+        merged, and the merged cohorts are removed from the model. This is repeated
+        until the number of active cohorts is within the maximum or no more cohorts
+        can be merged, and the number of merges is logged.
+        """
+
+        if self.cohort_merging is None:
+            return
+
+        max_cohorts = self.cohort_merging.max_cohorts
+        initial_cohorts = len(self.active_cohorts)
+        number_merged = 0
+        largest_distance = 0.0
+
+        while len(self.active_cohorts) > max_cohorts:
+            rows = self.cohort_table.rows(self.active_cohorts.values())
+            pairs = find_merge_pairs(
+                self.cohort_table, rows, len(self.active_cohorts) - max_cohorts
+            )
+            if not len(pairs.source_rows):
+                break
+
+            merged_cohorts = [
+                self.cohort_table.cohorts[row] for row in pairs.source_rows
+            ]
+            self.cohort_table.merge(pairs.target_rows, pairs.source_rows)
+            self.remove_dead_cohorts(merged_cohorts)
+
+            number_merged += len(merged_cohorts)
+            largest_distance = max(largest_distance, float(pairs.distances.max()))
+
+        if number_merged:
+            LOGGER.info(
+                f"Merged {number_merged} animal cohorts, reducing the active cohorts "
+                f"from {initial_cohorts} to {len(self.active_cohorts)}. The largest "
+                f"difference between merged cohorts was {largest_distance:.3g}."
+            )
+        if len(self.active_cohorts) > max_cohorts:
+            LOGGER.warning(
+                f"The {len(self.active_cohorts)} active animal cohorts exceed the "
+                f"maximum of {max_cohorts}, but no more cohorts can be merged."
+            )
 
     def birth(self, parent_cohort: AnimalCohort) -> None:
         """Produce offspring for a parent cohort using helper methods.
@@ -1011,15 +1148,21 @@ class AnimalModel(
     def birth_community(self) -> None:
         """This handles birth for all cohorts in a community."""
 
-        # reproduction occurs for cohorts with sufficient reproductive mass
-        for cohort in self.active_cohorts.values():
-            if (
-                not cohort.is_below_mass_threshold(
-                    self.model_constants.birth_mass_threshold
-                )
-                and cohort.functional_group.reproductive_type != "nonreproductive"
-            ):
-                self.birth(cohort)
+        # reproduction occurs for cohorts with sufficient reproductive mass, which are
+        # found before any births as these change the cohorts and the table rows
+        cohorts = list(self.active_cohorts.values())
+        below_threshold = self.cohort_table.is_below_mass_threshold(
+            self.cohort_table.rows(cohorts), self.model_constants.birth_mass_threshold
+        )
+        parents = [
+            cohort
+            for cohort, is_below in zip(cohorts, below_threshold)
+            if not is_below
+            and cohort.functional_group.reproductive_type != "nonreproductive"
+        ]
+
+        for cohort in parents:
+            self.birth(cohort)
 
     def forage_community(self) -> None:
         """Loop through every active cohort and trigger resource consumption.
@@ -1028,7 +1171,8 @@ class AnimalModel(
         assembled and forwarded to ``cohort.forage_cohort``:
 
         * ``DietType.HERBIVORE`` → live plant resources
-        * ``DietType.CARNIVORE`` → live prey cohorts
+        * ``DietType.CARNIVORE`` → live prey cohorts, resolved for all predators at
+          once by :func:`~virtual_ecosystem.models.animal.predation.resolve_predation`
         * ``DietType.DETRITUS``  → plant-litter pools (detritivory)
         * ``DietType.CARCASSES``   → carcass pools   (scavenging)
         * ``DietType.WASTE``     → excrement pools (coprophagy)
@@ -1037,86 +1181,154 @@ class AnimalModel(
         ``carcass_pool_map`` for uneaten prey remains) are always supplied so
         trophic functions can update them regardless of whether the cohort
         actively scavenges in the same step.
+
+        Once predation has been resolved, the cohorts forage in turn using
+        :func:`~virtual_ecosystem.models.animal.domain_decomposition.forage_cohorts`,
+        or tile by tile in worker processes if the model uses domain decomposition (see
+        :meth:`forage_tiles`).
         """
-        for cohort in list(self.active_cohorts.values()):
+        predator_diet = (
+            DietType.BLOOD
+            | DietType.INVERTEBRATES
+            | DietType.FISH
+            | DietType.VERTEBRATES
+        )
+        for cohort in self.active_cohorts.values():
             # Safety check territory must be defined
             if cohort.territory is None:
                 raise ValueError("The cohort's territory hasn't been defined.")
 
-            diet: DietType = cohort.functional_group.diet
-
-            #  Build resource collections based on diet flags
-            plant_list: list[Resource] = []
-            prey_list: list[AnimalCohort] = []
-            litter_list: list[Resource] = []
-            scavenge_carcass_pools: list[Resource] = []
-            scavenge_waste_pools: list[Resource] = []
-
-            # Deposition targets (always passed)
-            excrement_pools = cohort.get_excrement_pools(self.excrement_pools)
-            carcass_pool_map = self.carcass_pools
-
-            # Live plant resources
-            if diet & (
-                DietType.ALGAE
-                | DietType.FLOWERS
-                | DietType.FOLIAGE
-                | DietType.FRUIT
-                | DietType.FUNGUS
-                | DietType.SEEDS
-                | DietType.NECTAR
-                | DietType.WOOD
-            ):
-                plant_list = cohort.get_plant_resources(self.plant_resources)
-
-            # Live prey
-            if diet & (
-                DietType.BLOOD
-                | DietType.INVERTEBRATES
-                | DietType.FISH
-                | DietType.VERTEBRATES
-            ):
-                prey_list = cohort.get_prey(self.communities)
-
-            # Detritivory
-            if diet & DietType.DETRITUS:
-                litter_list = cohort.get_litter_pools(self.litter_pools)
-
-            # Carcass scavenging
-            if diet & DietType.CARCASSES:
-                scavenge_carcass_pools = cast(
-                    list[Resource], cohort.get_carcass_pools(self.carcass_pools)
-                )
+        # Resolve predation between all cohorts at once, using the 30 day time period
+        # of AnimalCohort.calculate_consumed_mass_predation
+        predators = [
+            cohort
+            for cohort in self.active_cohorts.values()
+            if cohort.functional_group.diet & predator_diet
+            and cohort.individuals > 0
+            and cohort.mass_current > 0
+        ]
+        encounters = find_predation_encounters(
+            self.cohort_table, predators, self.prey_index
+        )
+        predation_gains = resolve_predation(
+            self.cohort_table,
+            encounters,
+            self.carcass_pools,
+            dt=30.0,
+            rng=self.random_streams.predation,
+        )
 
-            # Coprophagy
-            if diet & DietType.WASTE:
-                scavenge_waste_pools = cast(list[Resource], excrement_pools)
-
-            cohort.forage_cohort(
-                plant_list=plant_list,
-                animal_list=prey_list,
-                litter_pools=litter_list,
-                excrement_pools=excrement_pools,  # for defecation
-                carcass_pool_map=carcass_pool_map,  # for prey remains
-                scavenge_carcass_pools=scavenge_carcass_pools,
-                scavenge_excrement_pools=scavenge_waste_pools,
-                herbivory_waste_pools=self.leaf_waste_pools,
-            )
+        cohorts = list(self.active_cohorts.values())
+        cohort_gains = predation_gains[self.cohort_table.rows(cohorts)]
+        resources = ForagingResources(
+            plant_resources=self.plant_resources,
+            litter_pools=self.litter_pools,
+            excrement_pools=self.excrement_pools,
+            carcass_pools=self.carcass_pools,
+            leaf_waste_pools=self.leaf_waste_pools,
+        )
+        if self.domain_decomposition is None:
+            forage_cohorts(cohorts, cohort_gains, resources)
+        else:
+            self.forage_tiles(cohorts, cohort_gains, resources)
 
         # Remove any cohorts that died during foraging
         self.remove_dead_cohort_community()
 
+    def forage_tiles(
+        self,
+        cohorts: list[AnimalCohort],
+        predation_gains: NDArray[np.float64],
+        resources: ForagingResources,
+    ) -> None:
+        """Forage a set of cohorts tile by tile, using the domain decomposition.
+
+        Each cohort is owned by the tile containing its territory centroid, and the
+        tiles are coloured so that tiles of the same colour do not share any grid cells
+        in the territories of their cohorts. The colours are foraged in turn. The tiles
+        of each colour are foraged in parallel by a pool of worker processes that is
+        created for this update and shut down at its end, using detached copies of their
+        cohorts and resource pools, and the results are written back before the next
+        colour is foraged.
+
+        Args:
+            cohorts: The cohorts to forage.
+            predation_gains: The C, N and P mass gained by each cohort from predation.
+            resources: The resource pools of the model.
+        """
+
+        # Find the cohorts owned by each tile, keeping the cohort order within tiles
+        centroids = self.cohort_table.columns["centroid_key"][
+            self.cohort_table.rows(cohorts)
+        ]
+        cohort_tiles = self.cell_tiles[centroids]
+        tile_ids = np.unique(cohort_tiles)
+        owned = [np.flatnonzero(cohort_tiles == tile_id) for tile_id in tile_ids]
+        footprints = [
+            set(chain.from_iterable(cohorts[index].territory for index in indices))
+            for indices in owned
+        ]
+        colours = colour_tiles(footprints)
+
+        # Worker processes are only started for this update, so that none outlive it
+        workers = (
+            1
+            if self.domain_decomposition is None
+            else self.domain_decomposition.workers
+        )
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+        with executor if executor is not None else nullcontext():
+            for colour in range(max(colours, default=-1) + 1):
+                tiles = [
+                    AnimalTile(
+                        tile_id=int(tile_id),
+                        cohorts=detach_cohorts(
+                            self.cohort_table, [cohorts[index] for index in indices]
+                        ),
+                        predation_gains=predation_gains[indices],
+                        resources=resources.detach(footprint),
+                    )
+                    for tile_id, indices, footprint, tile_colour in zip(
+                        tile_ids, owned, footprints, colours
+                    )
+                    if tile_colour == colour
+                ]
+
+                if executor is None:
+                    foraged = [forage_tile(tile) for tile in tiles]
+                else:
+                    foraged = list(executor.map(forage_tile, tiles))
+
+                # Write the results back, exchanging the state of the halos with the
+                # tiles of later colours
+                for tile in foraged:
+                    indices = owned[int(np.searchsorted(tile_ids, tile.tile_id))]
+                    restore_cohorts(
+                        self.cohort_table,
+                        [cohorts[index] for index in indices],
+                        tile.cohorts,
+                    )
+                    resources.update(tile.resources)
+
+        LOGGER.debug(
+            f"Foraged {len(cohorts)} animal cohorts in {len(tile_ids)} tiles using "
+            f"{max(colours, default=-1) + 1} colours."
+        )
+
     def metabolize_community(self, dt: timedelta64) -> None:
         """This handles metabolize for all cohorts in a community.
 
-        This method generates a total amount of metabolic waste per cohort and passes
-        that waste to handler methods for distinguishing between nitrogenous and
-        carbonaceous wastes as they need depositing in different pools. This will not
-        be fully implemented until the stoichiometric rework.
+        This method generates a total amount of metabolic waste per cohort, using the
+        vectorised metabolism of the cohort table for the cohorts of all communities at
+        once. Currently only carbon is metabolized, so the waste of each community is
+        totaled with a grouped sum and passed to the respiration and excretion
+        handlers. This will need to distinguish between nitrogenous and carbonaceous
+        wastes after the stoichiometric rework, as they need depositing in different
+        pools.
 
         Respiration wastes are totaled because they are CO2 and not tracked spatially.
-        Excretion wastes are handled cohort by cohort because they will need to be
-        spatially explicit with multi-grid occupancy.
+        Excretion wastes are deposited in the excrement pools of each community.
 
         Args:
             air_temperature_data: The full air temperature data (as a DataArray) for
@@ -1124,33 +1336,74 @@ class AnimalModel(
             dt: Number of days over which the metabolic costs should be calculated.
 
         """
-        for cell_id, community in self.communities.items():
-            # Check for empty community and skip processing if empty
-            if not community:
-                continue
+        cell_ids, rows = self.community_memberships()
+        surface_temperature = self.data["air_temperature"][
+            self.layer_structure.index_surface_scalar
+        ].to_numpy()
+
+        # A cohort metabolizes once in each community of its territory, in grid cell
+        # order. The memberships are therefore metabolized in rounds, where each
+        # cohort metabolizes once per round, using the temperature of the grid cell of
+        # each membership. Only carbon is currently metabolized.
+        order = np.argsort(rows, kind="stable")
+        sorted_rows = rows[order]
+        is_first = np.r_[True, sorted_rows[1:] != sorted_rows[:-1]]
+        group_start = np.maximum.accumulate(np.where(is_first, np.arange(len(rows)), 0))
+        occurrence = np.empty_like(rows)
+        occurrence[order] = np.arange(len(rows)) - group_start
+
+        metabolic_waste_carbon = np.zeros(len(rows))
+        for round_number in range(occurrence.max() + 1 if len(rows) else 0):
+            in_round = occurrence == round_number
+            metabolic_waste_carbon[in_round] = self.cohort_table.metabolize(
+                rows[in_round], surface_temperature[cell_ids[in_round]], dt
+            )
 
-            total_carbonaceous_waste = 0.0
+        community_waste_carbon = np.bincount(
+            cell_ids, weights=metabolic_waste_carbon, minlength=self.data.grid.n_cells
+        )
 
-            # Extract the temperature for this specific community (cell_id)
-            surface_temperature = self.data["air_temperature"][
-                self.layer_structure.index_surface_scalar
-            ].to_numpy()
+        # Excretion of waste into the excrement pools of each occupied community
+        for cell_id in np.unique(cell_ids):
+            self.excrete_community(
+                community_waste_carbon[cell_id], self.excrement_pools[cell_id]
+            )
 
-            grid_temperature = surface_temperature[cell_id]
+        # Carbonaceous waste from respiration, updated for all cells at once
+        self.data["total_animal_respiration"].data += (
+            community_waste_carbon * self.model_constants.carbon_excreta_proportion
+        )
 
-            for cohort in community:
-                # Calculate metabolic waste based on cohort properties
-                metabolic_waste_mass = cohort.metabolize(grid_temperature, dt)
+    def excrete_community(
+        self, carbon: float, excrement_pools: list[ExcrementPool]
+    ) -> None:
+        """Transfers the metabolic carbon waste of a community to its excrement pools.
 
-                # Carbonaceous waste from respiration
-                total_carbonaceous_waste += cohort.respire(metabolic_waste_mass)
+        The waste is distributed evenly across the pools, and split between the
+        scavengeable and decomposed compartments in the same way as
+        :meth:`~virtual_ecosystem.models.animal.animal_cohorts.AnimalCohort.excrete`.
 
-                # Excretion of waste into the excrement pool
-                cohort.excrete(metabolic_waste_mass, self.excrement_pools[cell_id])
+        Args:
+            carbon: The total carbon mass excreted by the cohorts in the community.
+            excrement_pools: List of excrement pools for distributing waste.
 
-            # Update the total_animal_respiration for the specific cell_id
-            self.data["total_animal_respiration"].loc[{"cell_id": cell_id}] += (
-                total_carbonaceous_waste
+        Raises:
+            ValueError: If the carbon mass is negative or no pools are provided.
+        """
+        if carbon < 0:
+            raise ValueError("Excreta mass values must be non-negative.")
+
+        number_communities = len(excrement_pools)
+        if number_communities == 0:
+            raise ValueError("No excrement pools provided for waste distribution.")
+
+        decay_fraction = self.cohort_table.decay_fraction_excrement
+        for excrement_pool in excrement_pools:
+            excrement_pool.scavengeable_cnp.update(
+                carbon=(carbon / number_communities) * (1 - decay_fraction)
+            )
+            excrement_pool.decomposed_cnp.update(
+                carbon=(carbon / number_communities) * decay_fraction
             )
 
     def increase_age_community(self, dt: timedelta64) -> None:
@@ -1160,8 +1413,9 @@ class AnimalModel(
             dt: Number of days over which the metabolic costs should be calculated.
 
         """
-        for cohort in self.active_cohorts.values():
-            cohort.increase_age(dt)
+        self.cohort_table.increase_age(
+            self.cohort_table.rows(self.active_cohorts.values()), dt
+        )
 
     def handle_ontogeny(self) -> None:
         """Update largest body mass achieved for immature cohorts.
@@ -1169,9 +1423,9 @@ class AnimalModel(
         This is used to support ontogeny-aware starvation calculations.
         """
 
-        for cohort in self.active_cohorts.values():
-            if not cohort.is_mature:
-                cohort.update_largest_mass()
+        table = self.cohort_table
+        rows = table.rows(self.active_cohorts.values())
+        table.update_largest_mass(rows[~table.columns["is_mature"][rows]])
 
     def inflict_non_predation_mortality_community(self, dt: timedelta64) -> None:
         """This handles natural mortality for all cohorts in a community.
@@ -1184,13 +1438,36 @@ class AnimalModel(
 
         """
         number_of_days = float(dt / timedelta64(1, "D"))
-        for cohort in list(self.active_cohorts.values()):
-            cohort.inflict_non_predation_mortality(
-                number_of_days, cohort.get_carcass_pools(self.carcass_pools)
+        table = self.cohort_table
+        cohorts = list(self.active_cohorts.values())
+        rows = table.rows(cohorts)
+        number_dead = table.inflict_non_predation_mortality(rows, number_of_days)
+
+        # Transfer the biomass of the dead individuals to the carcass pools
+        columns = table.columns
+        dying = number_dead > 0
+        for cohort, deaths, carbon, nitrogen, phosphorus in zip(
+            (cohort for cohort, is_dying in zip(cohorts, dying) if is_dying),
+            number_dead[dying],
+            columns["carbon"][rows[dying]],
+            columns["nitrogen"][rows[dying]],
+            columns["phosphorus"][rows[dying]],
+        ):
+            cohort.update_carcass_pool(
+                carbon * deaths,
+                nitrogen * deaths,
+                phosphorus * deaths,
+                cohort.get_carcass_pools(self.carcass_pools),
             )
-            if cohort.individuals <= 0:
-                cohort.is_alive = False
-                self.remove_dead_cohort(cohort)
+
+        dead_cohorts = [
+            cohort
+            for cohort, count in zip(cohorts, columns["individuals"][rows])
+            if count <= 0
+        ]
+        for cohort in dead_cohorts:
+            cohort.is_alive = False
+        self.remove_dead_cohorts(dead_cohorts)
 
     def metamorphose(self, larval_cohort: AnimalCohort) -> None:
         """This transforms a larval status cohort into an adult status cohort.
@@ -1235,13 +1512,24 @@ class AnimalModel(
     def metamorphose_community(self) -> None:
         """Handle metamorphosis for all applicable cohorts in the community."""
 
-        # Iterate over a static list of cohort values
-        for cohort in list(self.active_cohorts.values()):
-            if (
-                cohort.functional_group.development_type == DevelopmentType.INDIRECT
-                and (cohort.mass_current >= cohort.functional_group.adult_mass)
-            ):
-                self.metamorphose(cohort)
+        # Find the larval cohorts that have reached adult mass before any are
+        # transformed, as this changes the cohorts and the table rows
+        table = self.cohort_table
+        cohorts = list(self.active_cohorts.values())
+        rows = table.rows(cohorts)
+        reached_adult_mass = (
+            table.mass_current(rows)
+            >= (table.adult_mass[table.columns["functional_group_index"][rows]])
+        )
+        larval_cohorts = [
+            cohort
+            for cohort, is_adult_mass in zip(cohorts, reached_adult_mass)
+            if is_adult_mass
+            and cohort.functional_group.development_type == DevelopmentType.INDIRECT
+        ]
+
+        for cohort in larval_cohorts:
+            self.metamorphose(cohort)
 
     def update_migrated_and_aquatic(self, dt: timedelta64) -> None:
         """Handles updating timing on frozen migrated and aquatic cohorts.
@@ -1290,6 +1578,7 @@ class AnimalModel(
 
         else:
             cohort.is_alive = False
+            self.cohort_table.remove(cohort)
 
     def migrate_external(self, cohort: AnimalCohort) -> None:
         """Handles the initiation of external migration events.
@@ -1310,12 +1599,20 @@ class AnimalModel(
         """Cycles through all active cohorts and checks for external migration.
 
         Only calls `trigger_external_migration` for cohorts that are seasonal migrators.
+        Whether it is the migration season for each of these cohorts is drawn in a
+        single batch from the seasonal migration random stream.
         """
-        for cohort in list(self.active_cohorts.values()):
-            if (
-                cohort.functional_group.migration_type == "seasonal"
-                and cohort.is_migration_season()
-            ):
+        seasonal_migrants = [
+            cohort
+            for cohort in self.active_cohorts.values()
+            if cohort.functional_group.migration_type == "seasonal"
+        ]
+        is_migration_season = (
+            self.random_streams.seasonal_migration.random(len(seasonal_migrants))
+            <= self.model_constants.seasonal_migration_probability
+        )
+        for cohort, is_season in zip(seasonal_migrants, is_migration_season):
+            if is_season:
                 self.migrate_external(cohort)
 
     def reintegrate_community(self) -> None:
@@ -1380,6 +1677,7 @@ class AnimalModel(
             centroid_key=centroid_key,
             grid=self.data.grid,
             constants=self.model_constants,
+            table=self.cohort_table,
         )
 
         self.assign_prey_groups(cohort)
@@ -1390,6 +1688,7 @@ class AnimalModel(
             and functional_group.reproductive_environment
             is ReproductiveEnvironment.AQUATIC
         ):
+            cohort.location_status = "aquatic"
             cohort.remaining_time_away = cohort.constants.aquatic_residence_time
             self.aquatic_cohorts[cohort.id] = cohort
         else:
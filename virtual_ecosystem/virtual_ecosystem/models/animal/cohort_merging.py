@@ -0,0 +1,124 @@
+"""The :mod:`~virtual_ecosystem.models.animal.cohort_merging` module finds animal
+cohorts that are similar enough to be merged into a single cohort, which is used to
+bound the number of cohorts in the animal model. This follows the cohort merging used
+in the Madingley model: once the number of active cohorts exceeds a configured maximum,
+the most similar pairs of cohorts are merged until the number of cohorts is back within
+the maximum.
+
+Only cohorts of the same functional group, with the same territory centroid and the
+same maturity status can be merged. The similarity of two cohorts is measured by the
+relative differences in their individual body masses and ages, and candidate pairs are
+the cohorts that are adjacent in body mass within each of these groups. The merging
+itself is applied by
+:meth:`~virtual_ecosystem.models.animal.cohort_table.CohortTable.merge`, which
+conserves the total mass and number of individuals of the merged cohorts.
+"""  # noqa: D205
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from virtual_ecosystem.models.animal.cohort_table import CohortTable
+
+
+@dataclass(frozen=True)
+class CohortMergingOptions:
+    """The settings used to merge animal cohorts."""
+
+    max_cohorts: int
+    """The number of active cohorts above which similar cohorts are merged."""
+
+
+@dataclass
+class CohortMergePairs:
+    """Pairs of cohorts selected to be merged.
+
+    Each source cohort is merged into the target cohort in the same position, and no
+    cohort appears in more than one pair.
+    """
+
+    target_rows: NDArray[np.int_]
+    """The cohort table rows of the cohorts receiving the merged individuals."""
+    source_rows: NDArray[np.int_]
+    """The cohort table rows of the cohorts merged into the targets."""
+    distances: NDArray[np.float64]
+    """The dissimilarity of the cohorts in each pair."""
+
+
+def find_merge_pairs(
+    table: CohortTable, rows: NDArray[np.int_], max_pairs: int
+) -> CohortMergePairs:
+    """Find the most similar pairs of cohorts that can be merged.
+
+    The cohorts are sorted by territory centroid, functional group, maturity status
+    and individual body mass, and each cohort is paired with the next cohort of the
+    same group. The dissimilarity of a pair is the Euclidean norm of the relative
+    differences in body mass and age, each relative to the larger value of the pair.
+    Ages are relative to at least one day, so that newborn cohorts can be compared.
+    The pairs are then selected from the most similar, skipping any pair that
+    includes a cohort that has already been selected, until ``max_pairs`` pairs have
+    been found. Of each pair, the cohort with more individuals is the target.
+
+    Args:
+        table: The cohort table holding the cohorts.
+        rows: The rows of the cohorts that can be merged.
+        max_pairs: The maximum number of pairs to select.
+
+    Returns:
+        The selected pairs of cohorts.
+    """
+
+    columns = table.columns
+    centroid = columns["centroid_key"][rows]
+    group = columns["functional_group_index"][rows]
+    is_mature = columns["is_mature"][rows]
+    mass = table.mass_current(rows)
+    age = columns["age"][rows]
+    individuals = columns["individuals"][rows]
+
+    order = np.lexsort((mass, is_mature, group, centroid))
+    rows, centroid, group, is_mature = (
+        rows[order],
+        centroid[order],
+        group[order],
+        is_mature[order],
+    )
+    mass, age, individuals = mass[order], age[order], individuals[order]
+
+    # Candidate pairs are neighbouring cohorts in the same group
+    is_candidate = (
+        (centroid[1:] == centroid[:-1])
+        & (group[1:] == group[:-1])
+        & (is_mature[1:] == is_mature[:-1])
+    )
+    mass_scale = np.maximum(mass[1:], mass[:-1])
+    age_scale = np.maximum(np.maximum(age[1:], age[:-1]), 1.0)
+    distances = np.sqrt(
+        ((mass[1:] - mass[:-1]) / mass_scale) ** 2
+        + ((age[1:] - age[:-1]) / age_scale) ** 2
+    )
+
+    # Greedily select the most similar pairs without reusing cohorts
+    candidates = np.flatnonzero(is_candidate)
+    is_selected = np.zeros(len(rows), dtype=np.bool_)
+    selected: list[int] = []
+    for first in candidates[np.argsort(distances[candidates], kind="stable")]:
+        if len(selected) >= max_pairs:
+            break
+        if is_selected[first] or is_selected[first + 1]:
+            continue
+        is_selected[first : first + 2] = True
+        selected.append(int(first))
+
+    first = np.array(selected, dtype=np.int_)
+    second = first + 1
+    first_is_target = individuals[first] >= individuals[second]
+
+    return CohortMergePairs(
+        target_rows=np.where(first_is_target, rows[first], rows[second]),
+        source_rows=np.where(first_is_target, rows[second], rows[first]),
+        distances=distances[first],
+    )
@@ -0,0 +1,588 @@
+"""The :mod:`~virtual_ecosystem.models.animal.cohort_table` module provides a columnar
+store for the state of animal cohorts. Each
+:class:`~virtual_ecosystem.models.animal.animal_cohorts.AnimalCohort` occupies a row of
+a :class:`CohortTable`, which holds the mass, population size, age, location and status
+of all of its cohorts in contiguous NumPy arrays. The cohort attributes are thin views
+onto that row, so that code working with individual cohorts is unchanged. The lifecycle
+processes that act on each cohort independently (metabolism, ageing, ontogeny and
+non-predation mortality) are applied to many cohorts at once using the vectorised
+methods of the table, rather than one cohort at a time.
+"""  # noqa: D205
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Literal,
+    Protocol,
+    TypeVar,
+    overload,
+)
+
+import numpy as np
+from numpy import timedelta64
+from numpy.typing import NDArray
+
+import virtual_ecosystem.models.animal.scaling_functions as sf
+from virtual_ecosystem.models.animal.animal_traits import MetabolicType
+from virtual_ecosystem.models.animal.cnp import CNP
+from virtual_ecosystem.models.animal.constants import AnimalConsts
+from virtual_ecosystem.models.animal.decay import find_decay_consumed_split
+from virtual_ecosystem.models.animal.functional_group import FunctionalGroup
+
+if TYPE_CHECKING:
+    from virtual_ecosystem.models.animal.animal_cohorts import AnimalCohort
+
+FLOAT_COLUMNS: tuple[str, ...] = (
+    "carbon",
+    "nitrogen",
+    "phosphorus",
+    "reproductive_carbon",
+    "reproductive_nitrogen",
+    "reproductive_phosphorus",
+    "age",
+    "time_to_maturity",
+    "time_since_maturity",
+    "largest_mass_achieved",
+    "remaining_time_away",
+)
+"""Columns of the cohort table holding floating point values."""
+
+INTEGER_COLUMNS: tuple[str, ...] = (
+    "individuals",
+    "centroid_key",
+    "functional_group_index",
+    "location_status",
+)
+"""Columns of the cohort table holding integer values."""
+
+BOOLEAN_COLUMNS: tuple[str, ...] = ("is_alive", "is_mature")
+"""Columns of the cohort table holding boolean flags."""
+
+LocationStatus = Literal["active", "migrated", "aquatic"]
+"""The location status of a cohort, active means present and participating."""
+
+LOCATION_STATUSES: tuple[LocationStatus, ...] = ("active", "migrated", "aquatic")
+"""The cohort location statuses, stored in the table by their index in this tuple."""
+
+T = TypeVar("T")
+
+
+class TableRow(Protocol):
+    """An object whose state is stored in a row of a :class:`CohortTable`."""
+
+    @property
+    def table(self) -> CohortTable:
+        """The table holding the state of the object."""
+
+    @property
+    def row(self) -> int:
+        """The row of the table holding the state of the object."""
+
+
+class CohortColumn(Generic[T]):
+    """An attribute whose value is stored in a column of a :class:`CohortTable`.
+
+    This is a descriptor that reads and writes the value in the row of the table
+    belonging to the object it is accessed on. Values are returned as Python scalars.
+
+    Args:
+        column: The name of the table column, defaults to the attribute name.
+    """
+
+    def __init__(self, column: str | None = None) -> None:
+        self.column = column or ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Use the attribute name as the column name, unless one was given."""
+        if not self.column:
+            self.column = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> CohortColumn[T]: ...
+
+    @overload
+    def __get__(self, instance: TableRow, owner: type) -> T: ...
+
+    def __get__(self, instance: TableRow | None, owner: type) -> CohortColumn[T] | T:
+        """Get the value from the row of the object in its table."""
+        if instance is None:
+            return self
+        return instance.table.columns[self.column].item(instance.row)
+
+    def __set__(self, instance: TableRow, value: T) -> None:
+        """Set the value in the row of the object in its table."""
+        instance.table.columns[self.column][instance.row] = value
+
+
+class CohortMassCNP(CNP):
+    """The C, N and P body mass of a cohort, stored in its row of a cohort table.
+
+    Args:
+        cohort: The cohort the mass belongs to.
+    """
+
+    carbon = CohortColumn[float]("carbon")  # type: ignore[assignment]
+    nitrogen = CohortColumn[float]("nitrogen")  # type: ignore[assignment]
+    phosphorus = CohortColumn[float]("phosphorus")  # type: ignore[assignment]
+
+    def __init__(self, cohort: AnimalCohort) -> None:
+        self.cohort = cohort
+
+    @property
+    def table(self) -> CohortTable:
+        """The table holding the state of the cohort."""
+        return self.cohort.table
+
+    @property
+    def row(self) -> int:
+        """The row of the table holding the state of the cohort."""
+        return self.cohort.row
+
+
+class CohortReproductiveCNP(CohortMassCNP):
+    """The C, N and P reproductive mass of a cohort, stored in a cohort table.
+
+    Args:
+        cohort: The cohort the reproductive mass belongs to.
+    """
+
+    carbon = CohortColumn[float]("reproductive_carbon")  # type: ignore[assignment]
+    nitrogen = CohortColumn[float]("reproductive_nitrogen")  # type: ignore[assignment]
+    phosphorus = CohortColumn[float]("reproductive_phosphorus")  # type: ignore[assignment]
+
+
+class CohortTable:
+    """A columnar (struct of arrays) store of the state of a set of animal cohorts.
+
+    Each cohort occupies one row of the table, and the rows are kept contiguous: when a
+    cohort is removed the last row is moved into its place. Rows are therefore only
+    stable between additions and removals, and should be looked up from the cohorts
+    (see :meth:`rows`) rather than stored. The per functional group traits used by the
+    vectorised lifecycle methods are held in arrays indexed by the
+    ``functional_group_index`` column.
+
+    Args:
+        constants: The animal constants shared by the cohorts in the table.
+        capacity: The number of rows to allocate initially. The table grows as needed.
+    """
+
+    def __init__(
+        self, constants: AnimalConsts = AnimalConsts(), capacity: int = 16
+    ) -> None:
+        self.constants = constants
+        """Animal constants."""
+        self.size: int = 0
+        """The number of cohorts in the table."""
+        self.columns: dict[str, NDArray[Any]] = {
+            **{name: np.zeros(capacity, dtype=np.float64) for name in FLOAT_COLUMNS},
+            **{name: np.zeros(capacity, dtype=np.int64) for name in INTEGER_COLUMNS},
+            **{name: np.zeros(capacity, dtype=np.bool_) for name in BOOLEAN_COLUMNS},
+        }
+        """The columns of the table, only the first ``size`` rows are in use."""
+        self.cohorts: list[AnimalCohort] = []
+        """The cohort occupying each row of the table."""
+        self.functional_groups: list[FunctionalGroup] = []
+        """The functional groups of the cohorts, indexed by functional_group_index."""
+        self._functional_group_indices: dict[FunctionalGroup, int] = {}
+        """The index of each functional group in the table."""
+        self.adult_mass: NDArray[np.float64] = np.zeros(0)
+        """The adult mass of each functional group [kg]."""
+        self.basal_metabolic_terms: NDArray[np.float64] = np.zeros((0, 2))
+        """The basal metabolic rate constant and exponent of each functional group."""
+        self.field_metabolic_terms: NDArray[np.float64] = np.zeros((0, 2))
+        """The field metabolic rate constant and exponent of each functional group."""
+        self.is_endothermic: NDArray[np.bool_] = np.zeros(0, dtype=np.bool_)
+        """Whether each functional group is endothermic."""
+        self.mechanical_efficiency: NDArray[np.float64] = np.zeros(0)
+        """The mechanical transfer efficiency of each functional group."""
+        self.decay_fraction_excrement: float = find_decay_consumed_split(
+            microbial_decay_rate=self.constants.decay_rate_excrement,
+            animal_scavenging_rate=self.constants.scavenging_rate_excrement,
+        )
+        """The fraction of excrement which decays before it gets consumed."""
+        self.decay_fraction_carcasses: float = find_decay_consumed_split(
+            microbial_decay_rate=self.constants.decay_rate_carcasses,
+            animal_scavenging_rate=self.constants.scavenging_rate_carcasses,
+        )
+        """The fraction of carcass biomass which decays before it gets consumed."""
+
+    def functional_group_index(self, functional_group: FunctionalGroup) -> int:
+        """Get the index of a functional group, registering it if it is new.
+
+        Args:
+            functional_group: The functional group.
+
+        Returns:
+            The index of the functional group in the per functional group trait arrays.
+        """
+
+        index = self._functional_group_indices.get(functional_group)
+        if index is not None:
+            return index
+
+        index = len(self.functional_groups)
+        self.functional_groups.append(functional_group)
+        self._functional_group_indices[functional_group] = index
+
+        terms = functional_group.metabolic_rate_terms
+        self.adult_mass = np.append(self.adult_mass, functional_group.adult_mass)
+        self.basal_metabolic_terms = np.vstack(
+            [self.basal_metabolic_terms, terms["basal"]]
+        )
+        self.field_metabolic_terms = np.vstack(
+            [self.field_metabolic_terms, terms["field"]]
+        )
+        self.is_endothermic = np.append(
+            self.is_endothermic,
+            functional_group.metabolic_type == MetabolicType.ENDOTHERMIC,
+        )
+        self.mechanical_efficiency = np.append(
+            self.mechanical_efficiency, functional_group.mechanical_efficiency
+        )
+
+        return index
+
+    def add(self, cohort: AnimalCohort, functional_group: FunctionalGroup) -> None:
+        """Add a cohort to the table.
+
+        A new row is allocated for the cohort and the cohort is pointed at it. The row
+        is zeroed, apart from the functional group index and the ``is_alive`` flag, so
+        the cohort state must be set after it is added.
+
+        Args:
+            cohort: The cohort to add.
+            functional_group: The functional group of the cohort.
+        """
+
+        if self.size == self.capacity:
+            self._grow()
+
+        row = self.size
+        for column in self.columns.values():
+            column[row] = 0
+        self.columns["functional_group_index"][row] = self.functional_group_index(
+            functional_group
+        )
+        self.columns["is_alive"][row] = True
+
+        self.cohorts.append(cohort)
+        cohort.table = self
+        cohort.row = row
+        self.size += 1
+
+    def remove(self, cohort: AnimalCohort) -> None:
+        """Remove a cohort from the table.
+
+        The state of the cohort is moved to a new table of its own, so that the cohort
+        object remains usable after it is removed (e.g. to check whether it is alive).
+        The last row of the table is moved into the row the cohort occupied.
+
+        Args:
+            cohort: The cohort to remove.
+
+        Raises:
+            ValueError: If the cohort is not in the table.
+        """
+
+        row = cohort.row
+        if cohort.table is not self or self.cohorts[row] is not cohort:
+            raise ValueError(f"Cohort with ID {cohort.id} is not in the table.")
+
+        # Detach the cohort state into a table of its own
+        state = {name: column[row] for name, column in self.columns.items()}
+        detached = CohortTable(constants=self.constants, capacity=1)
+        detached.add(cohort, self.functional_groups[state["functional_group_index"]])
+        for name, value in state.items():
+            if name != "functional_group_index":
+                detached.columns[name][0] = value
+
+        # Move the last row into the gap
+        last = self.size - 1
+        if row != last:
+            for column in self.columns.values():
+                column[row] = column[last]
+            moved = self.cohorts[last]
+            self.cohorts[row] = moved
+            moved.row = row
+        self.cohorts.pop()
+        self.size -= 1
+
+    @property
+    def capacity(self) -> int:
+        """The number of rows currently allocated."""
+        return len(self.columns["age"])
+
+    def _grow(self) -> None:
+        """Double the number of rows allocated to the table."""
+
+        new_capacity = max(2 * self.capacity, 1)
+        for name, column in self.columns.items():
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[: self.size] = column[: self.size]
+            self.columns[name] = grown
+
+    def rows(self, cohorts: Iterable[AnimalCohort]) -> NDArray[np.int_]:
+        """Get the rows of the table occupied by a set of cohorts.
+
+        Args:
+            cohorts: The cohorts.
+
+        Returns:
+            The row of each cohort.
+
+        Raises:
+            ValueError: If any of the cohorts are not in the table.
+        """
+
+        rows = np.fromiter(
+            (cohort.row if cohort.table is self else -1 for cohort in cohorts),
+            dtype=np.int_,
+        )
+        if np.any(rows < 0):
+            raise ValueError("Cohorts must be in the table to find their rows.")
+
+        return rows
+
+    def mass_current(self, rows: NDArray[np.int_]) -> NDArray[np.float64]:
+        """Get the current body mass of a set of cohorts.
+
+        Args:
+            rows: The rows of the cohorts.
+
+        Returns:
+            The total C, N and P body mass of an individual of each cohort [kg].
+        """
+
+        columns = self.columns
+        return (
+            columns["carbon"][rows]
+            + columns["nitrogen"][rows]
+            + columns["phosphorus"][rows]
+        )
+
+    def is_below_mass_threshold(
+        self, rows: NDArray[np.int_], mass_threshold: float
+    ) -> NDArray[np.bool_]:
+        """Check which cohorts have a total mass below a threshold.
+
+        This is the vectorised form of
+        :meth:`~virtual_ecosystem.models.animal.animal_cohorts.AnimalCohort.is_below_mass_threshold`.
+
+        Args:
+            rows: The rows of the cohorts.
+            mass_threshold: A threshold ratio of current total mass (body and
+                reproductive mass) to standard adult mass.
+
+        Returns:
+            Whether each cohort is below the threshold.
+        """
+
+        columns = self.columns
+        reproductive_mass = (
+            columns["reproductive_carbon"][rows]
+            + columns["reproductive_nitrogen"][rows]
+            + columns["reproductive_phosphorus"][rows]
+        )
+        adult_mass = self.adult_mass[columns["functional_group_index"][rows]]
+        return (
+            self.mass_current(rows) + reproductive_mass
+        ) / adult_mass < mass_threshold
+
+    def metabolize(
+        self,
+        rows: NDArray[np.int_],
+        temperature: float | NDArray[np.float64],
+        dt: timedelta64,
+    ) -> NDArray[np.float64]:
+        """Reduce the body carbon mass of a set of cohorts through metabolism.
+
+        This is the vectorised form of
+        :meth:`~virtual_ecosystem.models.animal.animal_cohorts.AnimalCohort.metabolize`.
+        Each row must only appear once.
+
+        Args:
+            rows: The rows of the cohorts.
+            temperature: Current air temperature (K), either shared by all of the
+                cohorts or for each cohort.
+            dt: Number of days over which the metabolic costs should be calculated.
+
+        Returns:
+            The total carbon mass metabolized by each cohort.
+
+        Raises:
+            ValueError: If dt is negative or any cohort has negative carbon mass.
+        """
+
+        if dt < timedelta64(0, "D"):
+            raise ValueError("dt cannot be negative.")
+
+        carbon = self.columns["carbon"]
+        if np.any(carbon[rows] < 0):
+            raise ValueError("Carbon mass (C) cannot be negative.")
+
+        groups = self.columns["functional_group_index"][rows]
+        potential_carbon_metabolized = sf.metabolic_rates(
+            self.mass_current(rows),
+            temperature,
+            self.basal_metabolic_terms[groups],
+            self.field_metabolic_terms[groups],
+            self.is_endothermic[groups],
+        ) * float(dt / timedelta64(1, "D"))
+
+        # Ensure metabolized carbon does not exceed available carbon
+        actual_carbon_metabolized = np.minimum(
+            carbon[rows], potential_carbon_metabolized
+        )
+        carbon[rows] -= actual_carbon_metabolized
+
+        return actual_carbon_metabolized * self.columns["individuals"][rows]
+
+    def increase_age(self, rows: NDArray[np.int_], dt: timedelta64) -> None:
+        """Increase the age of a set of cohorts and flag those that reach maturity.
+
+        This is the vectorised form of
+        :meth:`~virtual_ecosystem.models.animal.animal_cohorts.AnimalCohort.increase_age`.
+
+        Args:
+            rows: The rows of the cohorts.
+            dt: The amount of time that should be added to cohort age.
+        """
+
+        dt_float = float(dt / timedelta64(1, "D"))
+        columns = self.columns
+
+        columns["age"][rows] += dt_float
+
+        is_mature = columns["is_mature"][rows]
+        mature = rows[is_mature]
+        columns["time_since_maturity"][mature] += dt_float
+
+        immature = rows[~is_mature]
+        adult_mass = self.adult_mass[columns["functional_group_index"][immature]]
+        maturing = immature[self.mass_current(immature) >= adult_mass]
+        columns["is_mature"][maturing] = True
+        columns["time_to_maturity"][maturing] = columns["age"][maturing]
+
+    def update_largest_mass(self, rows: NDArray[np.int_]) -> None:
+        """Update the largest body mass achieved by a set of cohorts.
+
+        This is the vectorised form of
+        :meth:`~virtual_ecosystem.models.animal.animal_cohorts.AnimalCohort.update_largest_mass`.
+
+        Args:
+            rows: The rows of the cohorts.
+        """
+
+        largest_mass = self.columns["largest_mass_achieved"]
+        mass_current = self.mass_current(rows)
+        adult_mass = self.adult_mass[self.columns["functional_group_index"][rows]]
+
+        growing = mass_current > largest_mass[rows]
+        largest_mass[rows[growing]] = np.minimum(
+            mass_current[growing], adult_mass[growing]
+        )
+
+    def inflict_non_predation_mortality(
+        self, rows: NDArray[np.int_], dt: float
+    ) -> NDArray[np.int_]:
+        """Inflict combined background, senescence and starvation mortality.
+
+        This is the vectorised form of
+        :meth:`~virtual_ecosystem.models.animal.animal_cohorts.AnimalCohort.inflict_non_predation_mortality`,
+        using the same mortality rates as
+        :func:`~virtual_ecosystem.models.animal.scaling_functions.background_mortality`,
+        :func:`~virtual_ecosystem.models.animal.scaling_functions.senescence_mortality`
+        and
+        :func:`~virtual_ecosystem.models.animal.scaling_functions.starvation_mortality`.
+        The number of individuals in each cohort is reduced, but the biomass of the
+        dead individuals is not transferred to the carcass pools, as this depends on
+        the territory of each cohort.
+
+        Args:
+            rows: The rows of the cohorts.
+            dt: The time passed in the timestep (days).
+
+        Returns:
+            The number of individuals that died in each cohort.
+        """
+
+        constants = self.constants
+        columns = self.columns
+
+        individuals = columns["individuals"][rows]
+        is_mature = columns["is_mature"][rows]
+        mass_max = columns["largest_mass_achieved"][rows]
+
+        # Senescence mortality is only experienced by mature adults
+        u_se = np.zeros(len(rows))
+        u_se[is_mature] = constants.lambda_se * np.exp(
+            columns["time_since_maturity"][rows[is_mature]]
+            / columns["time_to_maturity"][rows[is_mature]]
+        )
+
+        k = -(self.mass_current(rows) - constants.J_st * mass_max) / (
+            constants.zeta_st * mass_max
+        )
+        u_st = constants.lambda_max / (1 + np.exp(-k))
+
+        u_t = sf.background_mortality(constants.u_bg) + u_se + u_st
+
+        # Calculate the total number of dead individuals
+        number_dead = np.ceil(individuals * (1 - np.exp(-u_t * dt))).astype(np.int_)
+        columns["individuals"][rows] -= number_dead
+
+        return number_dead
+
+    def merge(
+        self, target_rows: NDArray[np.int_], source_rows: NDArray[np.int_]
+    ) -> None:
+        """Merge pairs of cohorts, conserving their total mass and individuals.
+
+        The individuals of each source cohort are added to its target cohort. The per
+        individual body and reproductive masses, the ages and the other life history
+        timings of the target are replaced by the averages of the pair, weighted by
+        their numbers of individuals, so the total C, N and P mass of the pair is
+        conserved. The source cohorts are left with no individuals, and need to be
+        removed from the model.
+
+        Args:
+            target_rows: The rows of the cohorts receiving the merged individuals.
+            source_rows: The rows of the cohorts merged into the targets.
+
+        Raises:
+            ValueError: If a cohort appears in more than one pair.
+        """
+
+        all_rows = np.concatenate([target_rows, source_rows])
+        if len(np.unique(all_rows)) != len(all_rows):
+            raise ValueError("Each cohort can only be merged once at a time.")
+
+        columns = self.columns
+        target_individuals = columns["individuals"][target_rows]
+        source_individuals = columns["individuals"][source_rows]
+        total_individuals = target_individuals + source_individuals
+
+        for column in (
+            "carbon",
+            "nitrogen",
+            "phosphorus",
+            "reproductive_carbon",
+            "reproductive_nitrogen",
+            "reproductive_phosphorus",
+            "age",
+            "time_to_maturity",
+            "time_since_maturity",
+            "largest_mass_achieved",
+        ):
+            values = columns[column]
+            values[target_rows] = (
+                values[target_rows] * target_individuals
+                + values[source_rows] * source_individuals
+            ) / total_individuals
+
+        columns["individuals"][target_rows] = total_individuals
+        columns["individuals"][source_rows] = 0
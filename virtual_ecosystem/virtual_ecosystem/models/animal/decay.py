@@ -3,9 +3,21 @@ pools which are still potentially forageable by animals but are in the process o
 microbial decomposition. This includes excrement and carcasses that are tracked solely
 in the animal module. This also includes plant litter which is mainly tracked in the
 `litter` module, but is made available for animal consumption.
+
+The excrement, carcass and herbivory waste pools of each grid cell are views onto rows
+of :class:`DecayPoolArrays` (or a plain array for herbivory waste), which hold the
+nutrient masses of every grid cell as (cell, nutrient) arrays. Animal cohorts interact
+with the pools of individual grid cells, while the transfers to the soil and litter
+models read and reset the arrays for all grid cells at once.
 """  # noqa: D205
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
+from typing import overload
+
+import numpy as np
+from numpy.typing import NDArray
 
 from virtual_ecosystem.core.data import Data
 from virtual_ecosystem.core.logger import LOGGER
@@ -13,14 +25,107 @@ from virtual_ecosystem.models.animal.animal_traits import VerticalOccupancy
 from virtual_ecosystem.models.animal.cnp import CNP
 from virtual_ecosystem.models.animal.protocols import Consumer, ScavengeableResource
 
+POOL_NUTRIENTS: tuple[str, ...] = ("carbon", "nitrogen", "phosphorus")
+"""The nutrients tracked by the pools, in the order of the pool array columns."""
+
+
+class PoolNutrient:
+    """An attribute whose value is stored in a column of the row of a pool array.
+
+    This is a descriptor that reads and writes the value in the ``values`` row of the
+    object it is accessed on. Values are returned as Python floats.
+
+    Args:
+        nutrient: The name of the nutrient held in the column.
+    """
+
+    def __init__(self, nutrient: str) -> None:
+        self.index = POOL_NUTRIENTS.index(nutrient)
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> PoolNutrient: ...
+
+    @overload
+    def __get__(self, instance: PoolCNP, owner: type) -> float: ...
+
+    def __get__(self, instance: PoolCNP | None, owner: type) -> PoolNutrient | float:
+        """Get the value from the row of the object."""
+        if instance is None:
+            return self
+        return instance.values.item(self.index)
+
+    def __set__(self, instance: PoolCNP, value: float) -> None:
+        """Set the value in the row of the object."""
+        instance.values[self.index] = value
+
+
+class PoolCNP(CNP):
+    """The C, N and P mass of a pool in one grid cell, stored in a pool array row.
+
+    Args:
+        values: The row of a pool array holding the masses, which is updated in place.
+    """
+
+    carbon = PoolNutrient("carbon")  # type: ignore[assignment]
+    nitrogen = PoolNutrient("nitrogen")  # type: ignore[assignment]
+    phosphorus = PoolNutrient("phosphorus")  # type: ignore[assignment]
+
+    def __init__(self, values: NDArray[np.float64]) -> None:
+        self.values = values
+
+
+class DecayPoolArrays:
+    """The nutrient masses of a type of decaying pool in every grid cell.
+
+    The masses of the pools are held in arrays with a row for each grid cell and a
+    column for each of the :data:`POOL_NUTRIENTS`. The pools of each grid cell are
+    views onto these rows, which are created by :meth:`scavengeable_cnp` and
+    :meth:`decomposed_cnp`.
+
+    Args:
+        n_cells: The number of grid cells.
+    """
+
+    def __init__(self, n_cells: int) -> None:
+        self.scavengeable: NDArray[np.float64] = np.zeros(
+            (n_cells, len(POOL_NUTRIENTS))
+        )
+        """The animal-accessible nutrient mass in each grid cell [kg]."""
+        self.decomposed: NDArray[np.float64] = np.zeros((n_cells, len(POOL_NUTRIENTS)))
+        """The decomposed nutrient mass in each grid cell [kg]."""
+
+    def scavengeable_cnp(self, cell_index: int) -> PoolCNP:
+        """Get a view of the scavengeable nutrient mass of a grid cell.
+
+        Args:
+            cell_index: The index of the grid cell.
+        """
+        return PoolCNP(self.scavengeable[cell_index])
+
+    def decomposed_cnp(self, cell_index: int) -> PoolCNP:
+        """Get a view of the decomposed nutrient mass of a grid cell.
+
+        Args:
+            cell_index: The index of the grid cell.
+        """
+        return PoolCNP(self.decomposed[cell_index])
+
+    def reset(self) -> None:
+        """Reset the decomposed nutrient masses of all grid cells to zero.
+
+        This should only be called after transfers to the soil model due to
+        decomposition have been calculated.
+        """
+        self.decomposed[:] = 0.0
+
 
 class ScavengeableMixin:
     """Mixin for nutrient pools that can be scavenged by animal cohorts."""
 
     def get_eaten(
-        self: "ScavengeableResource",
+        self: ScavengeableResource,
         consumed_mass: float,
-        scavenger: "Consumer",
+        scavenger: Consumer,
     ) -> tuple[dict[str, float], dict[str, float]]:
         """Remove biomass from the scavengeable pool and return stoichiometric gain.
 
@@ -149,7 +254,9 @@ class CarcassPool(ScavengeableMixin):
         It should only be called after transfers to the soil model due to decomposition
         have been calculated.
         """
-        self.decomposed_cnp = CNP(0.0, 0.0, 0.0)
+        self.decomposed_cnp.carbon = 0.0
+        self.decomposed_cnp.nitrogen = 0.0
+        self.decomposed_cnp.phosphorus = 0.0
 
 
 @dataclass
@@ -228,7 +335,9 @@ class ExcrementPool(ScavengeableMixin):
         It should only be called after transfers to the soil model due to decomposition
         have been calculated.
         """
-        self.decomposed_cnp = CNP(carbon=0.0, nitrogen=0.0, phosphorus=0.0)
+        self.decomposed_cnp.carbon = 0.0
+        self.decomposed_cnp.nitrogen = 0.0
+        self.decomposed_cnp.phosphorus = 0.0
 
 
 def find_decay_consumed_split(
@@ -263,7 +372,7 @@ class LitterPool:
         self,
         pool_name: str,
         cell_id: int,
-        data: "Data",
+        data: Data,
         cell_area: float,
     ) -> None:
         self.pool_name = pool_name
@@ -304,7 +413,7 @@ class LitterPool:
     def get_eaten(
         self,
         consumed_mass: float,
-        detritivore: "Consumer",
+        detritivore: Consumer,
     ) -> tuple[dict[str, float], dict[str, float]]:
         """Remove biomass when a cohort consumes this litter pool.
 
@@ -355,14 +464,16 @@ class HerbivoryWaste:
     be used for each of these groups.
 
     Args:
-        pool_name: Type of plant matter this waste pool contains.
+        plant_matter_type: Type of plant matter this waste pool contains.
+        mass_cnp: The stoichiometric mass of the waste, typically a view onto a row of
+            an array of the waste in every grid cell. Defaults to an empty pool.
 
     Raises:
         ValueError: If initialised for a plant matter type that the litter model doesn't
             accept.
     """
 
-    def __init__(self, plant_matter_type: str) -> None:
+    def __init__(self, plant_matter_type: str, mass_cnp: CNP | None = None) -> None:
         # Check that this isn't being initialised for a plant matter type that the
         # litter model doesn't use
         accepted_plant_matter_types = [
@@ -382,13 +493,8 @@ class HerbivoryWaste:
         self.plant_matter_type = plant_matter_type
         """Type of plant matter this waste pool contains."""
 
-        self.mass_cnp: dict[str, float] = {
-            "carbon": 0.0,
-            "nitrogen": 0.0,
-            "phosphorus": 0.0,
-        }
-        """The mass of each stoichiometric element found in the plant resources,
-        {"carbon": value, "nitrogen": value, "phosphorus": value}."""
+        self.mass_cnp: CNP = mass_cnp if mass_cnp is not None else CNP(0.0, 0.0, 0.0)
+        """The mass of each stoichiometric element found in the plant resources."""
 
         self.lignin_proportion = 0.25
         """Proportion of the herbivory waste pool carbon that is lignin [unitless]."""
@@ -417,5 +523,8 @@ class HerbivoryWaste:
             )
 
         # Add the masses to the current pool
-        for element, value in input_mass_cnp.items():
-            self.mass_cnp[element] += value
+        self.mass_cnp.update(
+            carbon=input_mass_cnp["carbon"],
+            nitrogen=input_mass_cnp["nitrogen"],
+            phosphorus=input_mass_cnp["phosphorus"],
+        )
@@ -0,0 +1,443 @@
+"""The :mod:`~virtual_ecosystem.models.animal.domain_decomposition` module provides the
+optional spatial domain decomposition of the animal model, which allows the foraging of
+animal cohorts to be shared between local worker processes.
+
+The grid is partitioned into rectangular tiles of grid cells, and each tile owns the
+cohorts whose territory centroid lies within it. Ownership is found again at the start
+of every update, so cohorts that migrate between tiles are transferred to their new tile
+at the next step boundary. The footprint of a tile is the set of grid cells in the
+territories of the cohorts it owns, and the cells of the footprint outside of the tile
+form its halo. A tile is foraged in a worker process using a detached copy of its
+cohorts and of the resource pools in its footprint (see :class:`AnimalTile`), and the
+updated state is written back to the model once the tile has been foraged.
+
+Tiles whose footprints overlap would compete for the same resources, so the tiles are
+coloured such that no two tiles of the same colour overlap (see :func:`colour_tiles`).
+The colours are foraged in turn, with the tiles of each colour foraged in parallel and
+the state of the halos exchanged between colours by writing the results back to the
+model. The result of each tile therefore only depends on the tiles of earlier colours,
+so that the results are deterministic and do not depend on the number of workers.
+Cohorts forage in a different order than when the model is not decomposed. The results
+match those of an undecomposed model unless cohorts in different tiles compete for the
+same resources, in which case the resources left for each cohort can differ.
+"""  # noqa: D205
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+from virtual_ecosystem.core.grid import Grid
+from virtual_ecosystem.models.animal.animal_cohorts import AnimalCohort
+from virtual_ecosystem.models.animal.animal_traits import DietType
+from virtual_ecosystem.models.animal.cnp import CNP
+from virtual_ecosystem.models.animal.cohort_table import (
+    CohortMassCNP,
+    CohortReproductiveCNP,
+    CohortTable,
+)
+from virtual_ecosystem.models.animal.decay import (
+    CarcassPool,
+    ExcrementPool,
+    HerbivoryWaste,
+)
+from virtual_ecosystem.models.animal.protocols import Resource
+
+T = TypeVar("T")
+
+PLANT_DIET = (
+    DietType.ALGAE
+    | DietType.FLOWERS
+    | DietType.FOLIAGE
+    | DietType.FRUIT
+    | DietType.FUNGUS
+    | DietType.SEEDS
+    | DietType.NECTAR
+    | DietType.WOOD
+)
+"""The diets that feed on live plant resources."""
+
+DETACHED_EXCLUDED_ATTRIBUTES: tuple[str, ...] = ("data",)
+"""Attributes referring to shared model state, which are left out of detached pools."""
+
+
+@dataclass(frozen=True)
+class DomainDecompositionOptions:
+    """The settings used to decompose the animal model into spatial tiles."""
+
+    tiles_x: int
+    """The number of tiles along the x axis of the grid."""
+    tiles_y: int
+    """The number of tiles along the y axis of the grid."""
+    workers: int
+    """The number of worker processes used to forage the tiles."""
+
+
+@dataclass
+class ForagingResources:
+    """The resource pools that animal cohorts forage from and deposit into.
+
+    Each mapping is keyed by grid cell ID.
+    """
+
+    plant_resources: dict[int, list[Resource]]
+    """The live plant resources in each grid cell."""
+    litter_pools: dict[int, dict[str, Resource]]
+    """The litter pools in each grid cell."""
+    excrement_pools: dict[int, list[ExcrementPool]]
+    """The excrement pools in each grid cell."""
+    carcass_pools: dict[int, list[CarcassPool]]
+    """The carcass pools in each grid cell."""
+    leaf_waste_pools: dict[int, HerbivoryWaste]
+    """The leaf herbivory waste pools in each grid cell."""
+
+    def detach(self, cell_ids: Iterable[int]) -> ForagingResources:
+        """Copy the resource pools of a set of grid cells.
+
+        The copies hold their own nutrient masses, and leave out the references to
+        shared model state (see :data:`DETACHED_EXCLUDED_ATTRIBUTES`), so that they can
+        be sent to a worker process.
+
+        Args:
+            cell_ids: The IDs of the grid cells.
+
+        Returns:
+            The copied resource pools.
+        """
+
+        cell_ids = sorted(cell_ids)
+        return ForagingResources(
+            plant_resources={
+                cell_id: [detach_pool(pool) for pool in self.plant_resources[cell_id]]
+                for cell_id in cell_ids
+            },
+            litter_pools={
+                cell_id: {
+                    name: detach_pool(pool)
+                    for name, pool in self.litter_pools[cell_id].items()
+                }
+                for cell_id in cell_ids
+            },
+            excrement_pools={
+                cell_id: [detach_pool(pool) for pool in self.excrement_pools[cell_id]]
+                for cell_id in cell_ids
+            },
+            carcass_pools={
+                cell_id: [detach_pool(pool) for pool in self.carcass_pools[cell_id]]
+                for cell_id in cell_ids
+            },
+            leaf_waste_pools={
+                cell_id: detach_pool(self.leaf_waste_pools[cell_id])
+                for cell_id in cell_ids
+            },
+        )
+
+    def update(self, detached: ForagingResources) -> None:
+        """Update the resource pools from detached copies of a set of grid cells.
+
+        Args:
+            detached: The detached copies of the resource pools, as created by
+                :meth:`detach`.
+        """
+
+        for cell_id, plants in detached.plant_resources.items():
+            for pool, copy in zip(self.plant_resources[cell_id], plants):
+                restore_pool(pool, copy)
+        for cell_id, litter in detached.litter_pools.items():
+            for name, copy in litter.items():
+                restore_pool(self.litter_pools[cell_id][name], copy)
+        for cell_id, excrement in detached.excrement_pools.items():
+            for pool, copy in zip(self.excrement_pools[cell_id], excrement):
+                restore_pool(pool, copy)
+        for cell_id, carcasses in detached.carcass_pools.items():
+            for pool, copy in zip(self.carcass_pools[cell_id], carcasses):
+                restore_pool(pool, copy)
+        for cell_id, waste in detached.leaf_waste_pools.items():
+            restore_pool(self.leaf_waste_pools[cell_id], waste)
+
+
+@dataclass
+class AnimalTile:
+    """The state needed to forage the cohorts owned by a tile.
+
+    The cohorts are detached copies held in a cohort table of their own, and the
+    resources are detached copies of the pools in the footprint of the tile.
+    """
+
+    tile_id: int
+    """The ID of the tile."""
+    cohorts: list[AnimalCohort]
+    """The cohorts owned by the tile, in foraging order."""
+    predation_gains: NDArray[np.float64]
+    """The C, N and P mass gained by each cohort from predation."""
+    resources: ForagingResources
+    """The resource pools in the footprint of the tile."""
+
+
+def detach_pool(pool: T) -> T:
+    """Copy a resource pool, so that it can be updated independently of the original.
+
+    The nutrient masses of the pool are copied into new
+    :class:`~virtual_ecosystem.models.animal.cnp.CNP` instances, and the attributes in
+    :data:`DETACHED_EXCLUDED_ATTRIBUTES` are left out of the copy.
+
+    Args:
+        pool: The resource pool to copy.
+
+    Returns:
+        The copied resource pool.
+    """
+
+    copy = object.__new__(type(pool))
+    copy.__dict__.update(
+        {
+            name: CNP(value.carbon, value.nitrogen, value.phosphorus)
+            if isinstance(value, CNP)
+            else value
+            for name, value in vars(pool).items()
+            if name not in DETACHED_EXCLUDED_ATTRIBUTES
+        }
+    )
+    return copy
+
+
+def restore_pool(pool: Any, copy: Any) -> None:
+    """Update a resource pool from a detached copy of it.
+
+    Nutrient masses are written into the existing
+    :class:`~virtual_ecosystem.models.animal.cnp.CNP` instances of the pool, so that
+    pools backed by arrays remain views of those arrays.
+
+    Args:
+        pool: The resource pool to update.
+        copy: The detached copy of the pool, as created by :func:`detach_pool`.
+    """
+
+    for name, value in vars(copy).items():
+        current = getattr(pool, name)
+        if isinstance(current, CNP):
+            current.carbon = value.carbon
+            current.nitrogen = value.nitrogen
+            current.phosphorus = value.phosphorus
+        else:
+            setattr(pool, name, value)
+
+
+def detach_cohorts(
+    table: CohortTable, cohorts: Sequence[AnimalCohort]
+) -> list[AnimalCohort]:
+    """Copy a set of cohorts into a cohort table of their own.
+
+    The copies share the traits of the original cohorts but leave out the grid, which is
+    not needed for foraging, so that they can be sent to a worker process. The rows of
+    the new table are in the same order as the cohorts.
+
+    Args:
+        table: The cohort table holding the state of the cohorts.
+        cohorts: The cohorts to copy.
+
+    Returns:
+        The copied cohorts.
+    """
+
+    detached_table = CohortTable(constants=table.constants, capacity=len(cohorts))
+    excluded = {"grid", "table", "row", "mass_cnp", "reproductive_mass_cnp"}
+    copies: list[AnimalCohort] = []
+    for cohort in cohorts:
+        copy = object.__new__(AnimalCohort)
+        copy.__dict__.update(
+            {
+                name: value
+                for name, value in vars(cohort).items()
+                if name not in excluded
+            }
+        )
+        detached_table.add(copy, cohort.functional_group)
+        copy.mass_cnp = CohortMassCNP(copy)
+        copy.reproductive_mass_cnp = CohortReproductiveCNP(copy)
+        copies.append(copy)
+
+    rows = table.rows(cohorts)
+    for name, column in table.columns.items():
+        if name != "functional_group_index":
+            detached_table.columns[name][: len(cohorts)] = column[rows]
+
+    return copies
+
+
+def restore_cohorts(
+    table: CohortTable, cohorts: Sequence[AnimalCohort], copies: Sequence[AnimalCohort]
+) -> None:
+    """Update the state of a set of cohorts from detached copies of them.
+
+    Args:
+        table: The cohort table holding the state of the cohorts.
+        cohorts: The cohorts to update.
+        copies: The detached copies of the cohorts, in the same order, as created by
+            :func:`detach_cohorts`.
+    """
+
+    if not copies:
+        return
+
+    rows = table.rows(cohorts)
+    detached_table = copies[0].table
+    detached_rows = detached_table.rows(copies)
+    for name, column in table.columns.items():
+        if name != "functional_group_index":
+            column[rows] = detached_table.columns[name][detached_rows]
+
+
+def assign_tiles(grid: Grid, tiles_x: int, tiles_y: int) -> NDArray[np.int_]:
+    """Find the tile that each grid cell belongs to.
+
+    The bounding box of the grid is split into ``tiles_x`` by ``tiles_y`` equal
+    rectangles, and each grid cell is assigned to the rectangle containing its
+    centroid. Tiles are numbered in row-major order.
+
+    Args:
+        grid: The grid to partition.
+        tiles_x: The number of tiles along the x axis.
+        tiles_y: The number of tiles along the y axis.
+
+    Returns:
+        The tile ID of each grid cell, in grid cell order.
+
+    Raises:
+        ValueError: If the number of tiles along either axis is less than one.
+    """
+
+    if tiles_x < 1 or tiles_y < 1:
+        raise ValueError("The number of tiles along each axis must be at least one.")
+
+    x_min, y_min, x_max, y_max = grid.bounds
+    centroids = np.asarray(grid.centroids)
+    tile_x = np.clip(
+        ((centroids[:, 0] - x_min) / (x_max - x_min) * tiles_x).astype(np.int_),
+        0,
+        tiles_x - 1,
+    )
+    tile_y = np.clip(
+        ((centroids[:, 1] - y_min) / (y_max - y_min) * tiles_y).astype(np.int_),
+        0,
+        tiles_y - 1,
+    )
+    return tile_y * tiles_x + tile_x
+
+
+def colour_tiles(footprints: Sequence[set[int]]) -> list[int]:
+    """Colour tiles so that tiles of the same colour have disjoint footprints.
+
+    The tiles are coloured greedily in order, each taking the lowest colour not used
+    by an earlier tile with an overlapping footprint.
+
+    Args:
+        footprints: The grid cells in the footprint of each tile.
+
+    Returns:
+        The colour of each tile, numbered from zero.
+    """
+
+    colours: list[int] = []
+    for tile, footprint in enumerate(footprints):
+        used = {
+            colours[other]
+            for other in range(tile)
+            if not footprint.isdisjoint(footprints[other])
+        }
+        colours.append(
+            next(colour for colour in range(len(used) + 1) if colour not in used)
+        )
+    return colours
+
+
+def forage_cohorts(
+    cohorts: Sequence[AnimalCohort],
+    predation_gains: NDArray[np.float64],
+    resources: ForagingResources,
+) -> None:
+    """Forage a set of cohorts in turn, after predation has been resolved.
+
+    The diet flags on each cohort determine which resource lists are assembled and
+    forwarded to
+    :meth:`~virtual_ecosystem.models.animal.animal_cohorts.AnimalCohort.forage_cohort`:
+
+    * Plant diets → live plant resources
+    * ``DietType.DETRITUS`` → plant-litter pools (detritivory)
+    * ``DietType.CARCASSES`` → carcass pools (scavenging)
+    * ``DietType.WASTE`` → excrement pools (coprophagy)
+
+    Deposition targets (``excrement_pools`` for faeces and ``carcass_pool_map`` for
+    uneaten prey remains) are always supplied so trophic functions can update them
+    regardless of whether the cohort actively scavenges in the same step.
+
+    Args:
+        cohorts: The cohorts to forage, in foraging order.
+        predation_gains: The C, N and P mass gained by each cohort from predation.
+        resources: The resource pools in the territories of the cohorts.
+    """
+
+    for cohort, gain in zip(cohorts, predation_gains):
+        diet: DietType = cohort.functional_group.diet
+
+        #  Build resource collections based on diet flags
+        plant_list: list[Resource] = []
+        litter_list: list[Resource] = []
+        scavenge_carcass_pools: list[Resource] = []
+        scavenge_waste_pools: list[Resource] = []
+
+        # Deposition targets (always passed)
+        excrement_pools = cohort.get_excrement_pools(resources.excrement_pools)
+
+        # Live plant resources
+        if diet & PLANT_DIET:
+            plant_list = cohort.get_plant_resources(resources.plant_resources)
+
+        # Detritivory
+        if diet & DietType.DETRITUS:
+            litter_list = cohort.get_litter_pools(resources.litter_pools)
+
+        # Carcass scavenging
+        if diet & DietType.CARCASSES:
+            scavenge_carcass_pools = cast(
+                list[Resource], cohort.get_carcass_pools(resources.carcass_pools)
+            )
+
+        # Coprophagy
+        if diet & DietType.WASTE:
+            scavenge_waste_pools = cast(list[Resource], excrement_pools)
+
+        cohort.forage_cohort(
+            plant_list=plant_list,
+            animal_list=[],  # predation is resolved before foraging
+            litter_pools=litter_list,
+            excrement_pools=excrement_pools,  # for defecation
+            carcass_pool_map=resources.carcass_pools,  # for prey remains
+            scavenge_carcass_pools=scavenge_carcass_pools,
+            scavenge_excrement_pools=scavenge_waste_pools,
+            herbivory_waste_pools=resources.leaf_waste_pools,
+            predation_gain=dict(
+                zip(("carbon", "nitrogen", "phosphorus"), gain.tolist())
+            ),
+        )
+
+
+def forage_tile(tile: AnimalTile) -> AnimalTile:
+    """Forage the cohorts owned by a tile.
+
+    This is run in a worker process, and the tile is updated in place and returned so
+    that the results can be written back to the model.
+
+    Args:
+        tile: The state needed to forage the cohorts of the tile.
+
+    Returns:
+        The tile, after its cohorts have foraged.
+    """
+
+    forage_cohorts(tile.cohorts, tile.predation_gains, tile.resources)
+    return tile
@@ -0,0 +1,270 @@
+"""The :mod:`~virtual_ecosystem.models.animal.predation` module resolves predation
+between all animal cohorts in a single batched pass. The potential encounters between
+each predator cohort and the prey cohorts in its territory are first collected as pairs
+of rows of the :class:`~virtual_ecosystem.models.animal.cohort_table.CohortTable`. The
+Madingley functional response (capture success, search rate, handling time and the
+resulting consumption rate) is then evaluated for all encounters at once, and the
+individuals killed, the biomass assimilated by the predators and the carcass remains
+are applied in bulk.
+
+This replaces the per predator
+:meth:`~virtual_ecosystem.models.animal.animal_cohorts.AnimalCohort.delta_mass_predation`
+in the animal model update, where the functional response denominators were recomputed
+over the whole prey list for every prey cohort. All predators now act on the state of
+their prey at the start of the step, and prey individuals are allocated to the
+predators in encounter order when the demand exceeds the prey available. The prey of
+each predator are found using a
+:class:`~virtual_ecosystem.models.animal.prey_index.PreyIndex`.
+"""  # noqa: D205
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from virtual_ecosystem.models.animal.animal_cohorts import AnimalCohort
+from virtual_ecosystem.models.animal.cohort_table import CohortTable
+from virtual_ecosystem.models.animal.decay import CarcassPool
+from virtual_ecosystem.models.animal.prey_index import PreyIndex
+
+
+@dataclass
+class PredationEncounters:
+    """The potential encounters between predator and prey cohorts in an update.
+
+    Each encounter is a pair of rows of the cohort table. A prey cohort is listed once
+    for each grid cell of the territory of the predator in which it is found.
+    """
+
+    predator_rows: NDArray[np.int_]
+    """The cohort table row of the predator in each encounter."""
+    prey_rows: NDArray[np.int_]
+    """The cohort table row of the prey in each encounter."""
+
+
+def find_predation_encounters(
+    table: CohortTable,
+    predators: Iterable[AnimalCohort],
+    prey_index: PreyIndex,
+) -> PredationEncounters:
+    """Find the prey cohorts available to each predator cohort.
+
+    The prey index is sorted by the current body masses of the cohorts before the prey
+    of each predator are found.
+
+    Args:
+        table: The cohort table holding the predator and prey cohorts.
+        predators: The predator cohorts.
+        prey_index: The index of the cohorts in each grid cell.
+
+    Returns:
+        The potential predator-prey encounters.
+    """
+
+    prey_index.sort()
+
+    predator_rows: list[NDArray[np.int_]] = []
+    prey_rows: list[NDArray[np.int_]] = []
+    for predator in predators:
+        prey = prey_index.find_prey(predator)
+        predator_rows.append(np.full(len(prey), predator.row, dtype=np.int_))
+        prey_rows.append(prey)
+
+    if not prey_rows:
+        return PredationEncounters(
+            predator_rows=np.zeros(0, dtype=np.int_),
+            prey_rows=np.zeros(0, dtype=np.int_),
+        )
+
+    return PredationEncounters(
+        predator_rows=np.concatenate(predator_rows),
+        prey_rows=np.concatenate(prey_rows),
+    )
+
+
+def calculate_potential_consumed_mass(
+    table: CohortTable,
+    encounters: PredationEncounters,
+    dt: float,
+    rng: np.random.Generator,
+) -> NDArray[np.float64]:
+    """Calculate the mass each predator would consume from each prey cohort.
+
+    This evaluates the Madingley functional response used by
+    :meth:`~virtual_ecosystem.models.animal.animal_cohorts.AnimalCohort.calculate_consumed_mass_predation`
+    for all encounters at once. The cumulative density of prey with the same mass as
+    the predator (theta) is summed over the encounters of each predator, and the
+    optimal predator-prey mass ratio is drawn for each encounter.
+
+    Args:
+        table: The cohort table holding the predator and prey cohorts.
+        encounters: The potential predator-prey encounters.
+        dt: The time over which predation takes place [days].
+        rng: The random stream used to draw the optimal predator-prey mass ratios.
+
+    Returns:
+        The mass to be consumed from the prey cohort in each encounter [kg].
+    """
+
+    constants = table.constants
+    A_cell = 1.0  # temporary, as in AnimalCohort
+
+    predator_rows = encounters.predator_rows
+    prey_rows = encounters.prey_rows
+    predator_mass = table.mass_current(predator_rows)
+    prey_mass = table.mass_current(prey_rows)
+    predator_individuals = table.columns["individuals"][predator_rows]
+    prey_individuals = table.columns["individuals"][prey_rows]
+
+    # Probability of successful capture, using a separate draw of the optimal
+    # predator-prey mass ratio for each encounter
+    theta_opt = np.maximum(
+        constants.theta_opt_min_f,
+        rng.normal(constants.theta_opt_f, constants.sigma_opt_f, len(prey_rows)),
+    )
+    w_bar = np.exp(
+        -(
+            (
+                (np.log(prey_mass / predator_mass) - np.log(theta_opt))
+                / constants.sigma_opt_pred_prey
+            )
+            ** 2
+        )
+    )
+    alpha = constants.alpha_0_pred * predator_mass * w_bar
+
+    # Cumulative density of the prey of each predator with the same mass as it
+    _, predator_index = np.unique(predator_rows, return_inverse=True)
+    theta = np.bincount(
+        predator_index,
+        weights=np.where(prey_mass == predator_mass, prey_individuals / A_cell, 0.0),
+    )[predator_index]
+
+    k_target = alpha * (predator_individuals / A_cell) * theta
+    handling_time = (
+        constants.h_pred_0
+        * ((constants.M_pred_ref / predator_mass) ** constants.b_pred)
+        * predator_mass
+    )
+    consumption_rate = (
+        predator_individuals * (k_target / (1 + handling_time)) / prey_individuals
+    )
+
+    return (
+        prey_mass
+        * prey_individuals
+        * (1 - np.exp(-(consumption_rate * dt * constants.tau_f * constants.sigma_f_t)))
+    )
+
+
+def resolve_predation(
+    table: CohortTable,
+    encounters: PredationEncounters,
+    carcass_pools: dict[int, list[CarcassPool]],
+    dt: float,
+    rng: np.random.Generator,
+) -> NDArray[np.float64]:
+    """Resolve all predation in an update in a single batched pass.
+
+    The individuals killed in each encounter are the number needed to supply the
+    potential consumed mass, limited to the prey individuals that remain once earlier
+    encounters with the same prey cohort have been resolved. The predator assimilates
+    the killed mass, up to the potential consumed mass and after mechanical
+    efficiency losses, and the remainder is deposited in the carcass pools of the grid
+    cells shared by the predator and prey territories. Prey cohorts with no remaining
+    individuals are flagged as dead, but are not removed from the model.
+
+    Args:
+        table: The cohort table holding the predator and prey cohorts.
+        encounters: The potential predator-prey encounters.
+        carcass_pools: The carcass pools of each grid cell.
+        dt: The time over which predation takes place [days].
+        rng: The random stream used to draw the optimal predator-prey mass ratios.
+
+    Returns:
+        The C, N and P mass gained by the cohort in each row of the table, with shape
+        (rows, 3).
+    """
+
+    columns = table.columns
+    gains = np.zeros((table.size, 3))
+    if not len(encounters.prey_rows):
+        return gains
+
+    predator_rows = encounters.predator_rows
+    prey_rows = encounters.prey_rows
+    prey_mass = table.mass_current(prey_rows)
+    potential_consumed_mass = calculate_potential_consumed_mass(
+        table, encounters, dt, rng
+    )
+
+    # Allocate the prey individuals to the encounters in order, so that the
+    # encounters with each prey cohort can not kill more than its individuals
+    requested = np.ceil(potential_consumed_mass / prey_mass).astype(np.int_)
+    order = np.argsort(prey_rows, kind="stable")
+    sorted_prey = prey_rows[order]
+    cumulative = np.cumsum(requested[order])
+    group_start = np.flatnonzero(np.r_[True, sorted_prey[1:] != sorted_prey[:-1]])
+    group_offset = np.repeat(
+        cumulative[group_start] - requested[order][group_start],
+        np.diff(np.r_[group_start, len(order)]),
+    )
+    already_killed = cumulative - requested[order] - group_offset
+    killed = np.empty_like(requested)
+    killed[order] = np.clip(
+        columns["individuals"][sorted_prey] - already_killed, 0, requested[order]
+    )
+
+    # Split the killed mass between the predator and the carcass pools
+    mass_killed = killed * prey_mass
+    consumed_mass = (
+        np.minimum(mass_killed, potential_consumed_mass)
+        * table.mechanical_efficiency[columns["functional_group_index"][predator_rows]]
+    )
+    carcass_mass = mass_killed - consumed_mass
+    prey_cnp = (
+        np.column_stack(
+            [
+                columns[element][prey_rows]
+                for element in ("carbon", "nitrogen", "phosphorus")
+            ]
+        )
+        / prey_mass[:, None]
+    )
+
+    # Remove the killed individuals from the prey and credit the predators
+    np.subtract.at(columns["individuals"], prey_rows, killed)
+    columns["is_alive"][prey_rows] &= columns["individuals"][prey_rows] > 0
+    np.add.at(gains, predator_rows, prey_cnp * consumed_mass[:, None])
+
+    # Deposit the carcasses in the pools shared by the predator and prey territories
+    deposits: dict[int, NDArray[np.float64]] = {}
+    for index in np.flatnonzero(carcass_mass > 0):
+        predator = table.cohorts[predator_rows[index]]
+        prey = table.cohorts[prey_rows[index]]
+        shared_cells = set(prey.territory) & set(predator.territory)
+        number_pools = sum(len(carcass_pools[cell_id]) for cell_id in shared_cells)
+        if number_pools == 0:
+            raise ValueError("No carcass pools provided for waste distribution.")
+        deposit = prey_cnp[index] * carcass_mass[index] / number_pools
+        for cell_id in shared_cells:
+            deposits[cell_id] = deposits.get(cell_id, 0.0) + deposit
+
+    decay_fraction = table.decay_fraction_carcasses
+    for cell_id, (carbon, nitrogen, phosphorus) in deposits.items():
+        for carcass_pool in carcass_pools[cell_id]:
+            carcass_pool.scavengeable_cnp.update(
+                carbon=carbon * (1 - decay_fraction),
+                nitrogen=nitrogen * (1 - decay_fraction),
+                phosphorus=phosphorus * (1 - decay_fraction),
+            )
+            carcass_pool.decomposed_cnp.update(
+                carbon=carbon * decay_fraction,
+                nitrogen=nitrogen * decay_fraction,
+                phosphorus=phosphorus * decay_fraction,
+            )
+
+    return gains
@@ -0,0 +1,156 @@
+"""The :mod:`~virtual_ecosystem.models.animal.prey_index` module provides an index of
+the animal cohorts occupying each grid cell, used to find the prey available to
+predators without checking every cohort in their territory.
+
+Within each grid cell, the cohorts are grouped by the name and vertical occupancy of
+their functional group, which are the criteria used by
+:meth:`~virtual_ecosystem.models.animal.animal_cohorts.AnimalCohort.can_prey_on` to
+identify prey, and each group is sorted by body mass. The prey of a predator in a
+group are then found with a range query on the prey mass limits of the predator. The
+membership of the index is updated incrementally by the animal model as cohorts occupy
+and abandon grid cells, but body masses change throughout an update and so the groups
+are sorted by mass again before the index is queried.
+"""  # noqa: D205
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from uuid import UUID
+
+import numpy as np
+from numpy.typing import NDArray
+
+from virtual_ecosystem.models.animal.animal_cohorts import AnimalCohort
+from virtual_ecosystem.models.animal.animal_traits import VerticalOccupancy
+from virtual_ecosystem.models.animal.cohort_table import CohortTable
+
+PreyGroupKey = tuple[str, VerticalOccupancy]
+"""The functional group name and vertical occupancy used to group cohorts."""
+
+
+class PreyIndex:
+    """An index of the animal cohorts in each grid cell, sorted by body mass.
+
+    Args:
+        table: The cohort table holding the state of the indexed cohorts.
+        cell_ids: The IDs of the grid cells to index.
+    """
+
+    def __init__(self, table: CohortTable, cell_ids: Iterable[int]) -> None:
+        self.table = table
+        """The cohort table holding the state of the indexed cohorts."""
+        self.members: dict[int, dict[PreyGroupKey, dict[UUID, AnimalCohort]]] = {
+            cell_id: {} for cell_id in cell_ids
+        }
+        """The cohorts in each group in each grid cell, keyed by cohort ID."""
+        self.is_sorted = False
+        """Whether the sorted rows and masses reflect the current members."""
+
+        self._rows: NDArray[np.int_] = np.zeros(0, dtype=np.int_)
+        self._masses: NDArray[np.float64] = np.zeros(0)
+        self._slices: dict[int, dict[PreyGroupKey, tuple[int, int]]] = {}
+
+    def add(self, cohort: AnimalCohort, cell_ids: Iterable[int]) -> None:
+        """Add a cohort to the index for a set of grid cells.
+
+        Args:
+            cohort: The cohort occupying the grid cells.
+            cell_ids: The IDs of the grid cells.
+        """
+
+        key = (cohort.functional_group.name, cohort.functional_group.vertical_occupancy)
+        for cell_id in cell_ids:
+            self.members[cell_id].setdefault(key, {})[cohort.id] = cohort
+        self.is_sorted = False
+
+    def remove(self, cohort: AnimalCohort, cell_ids: Iterable[int]) -> None:
+        """Remove a cohort from the index for a set of grid cells.
+
+        Cells in which the cohort is not indexed are ignored.
+
+        Args:
+            cohort: The cohort abandoning the grid cells.
+            cell_ids: The IDs of the grid cells.
+        """
+
+        key = (cohort.functional_group.name, cohort.functional_group.vertical_occupancy)
+        for cell_id in cell_ids:
+            group = self.members[cell_id].get(key)
+            if group is not None:
+                group.pop(cohort.id, None)
+        self.is_sorted = False
+
+    def sort(self) -> None:
+        """Sort the cohorts in each group by their current body mass.
+
+        The rows and masses of all indexed cohorts are gathered from the cohort table
+        and sorted in a single pass, and each group is then a contiguous slice of the
+        sorted arrays. This needs to be called whenever the body masses have changed
+        since the index was last sorted.
+        """
+
+        cohorts: list[AnimalCohort] = []
+        group_ids: list[int] = []
+        group_keys: list[tuple[int, PreyGroupKey]] = []
+        for cell_id, groups in self.members.items():
+            for key, group in groups.items():
+                cohorts.extend(group.values())
+                group_ids.extend([len(group_keys)] * len(group))
+                group_keys.append((cell_id, key))
+
+        rows = self.table.rows(cohorts)
+        masses = self.table.mass_current(rows)
+        group_index = np.array(group_ids, dtype=np.int_)
+        order = np.lexsort((masses, group_index))
+        self._rows = rows[order]
+        self._masses = masses[order]
+
+        bounds = np.searchsorted(group_index[order], np.arange(len(group_keys) + 1))
+        self._slices = {cell_id: {} for cell_id in self.members}
+        for group_id, (cell_id, key) in enumerate(group_keys):
+            self._slices[cell_id][key] = (
+                int(bounds[group_id]),
+                int(bounds[group_id + 1]),
+            )
+        self.is_sorted = True
+
+    def find_prey(self, predator: AnimalCohort) -> NDArray[np.int_]:
+        """Find the rows of the cohorts that a predator can prey upon.
+
+        This applies the same criteria as
+        :meth:`~virtual_ecosystem.models.animal.animal_cohorts.AnimalCohort.can_prey_on`
+        to the cohorts in each grid cell of the territory of the predator. A prey
+        cohort is listed once for each grid cell in which it is found.
+
+        Args:
+            predator: The predator cohort.
+
+        Returns:
+            The cohort table rows of the prey cohorts.
+
+        Raises:
+            ValueError: If the index has not been sorted since its members changed.
+        """
+
+        if not self.is_sorted:
+            raise ValueError("The prey index must be sorted before it is queried.")
+
+        predator_occupancy = predator.functional_group.vertical_occupancy
+        ranges: list[NDArray[np.int_]] = []
+        for cell_id in predator.territory:
+            for (name, occupancy), (start, end) in self._slices[cell_id].items():
+                prey_limits = predator.prey_groups.get(name)
+                if prey_limits is None or not occupancy & predator_occupancy:
+                    continue
+                masses = self._masses[start:end]
+                low = start + np.searchsorted(masses, prey_limits[0], side="left")
+                high = start + np.searchsorted(masses, prey_limits[1], side="right")
+                ranges.append(self._rows[low:high])
+
+        if not ranges:
+            return np.zeros(0, dtype=np.int_)
+
+        rows = np.concatenate(ranges)
+        return rows[
+            (self.table.columns["individuals"][rows] > 0) & (rows != predator.row)
+        ]
@@ -0,0 +1,92 @@
+"""The :mod:`~virtual_ecosystem.models.animal.random_streams` module provides the random
+number generators used by the stochastic processes of the animal model.
+
+Each stochastic process draws from its own :class:`numpy.random.Generator`, which is
+spawned from a single root :class:`numpy.random.SeedSequence`. The streams are therefore
+statistically independent of each other and of any other use of random numbers in the
+simulation, and the draws of one process do not depend on how many numbers are drawn by
+the others. The root seed is set by the ``random_seed`` option of the ``[animal]``
+configuration section, so that a simulation can be reproduced exactly, and the state of
+every stream can be saved and restored to checkpoint the model.
+"""  # noqa: D205
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+
+from virtual_ecosystem.core.logger import LOGGER
+
+STREAM_NAMES: tuple[str, ...] = ("migration", "seasonal_migration", "predation")
+"""The stochastic processes of the animal model that have their own random stream."""
+
+
+class AnimalRandomStreams:
+    """The random number generators of the stochastic processes of the animal model.
+
+    Args:
+        seed: The seed of the root seed sequence. If this is None, the seed sequence is
+            seeded from fresh operating system entropy, which is written to the log so
+            that the simulation can be reproduced.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.seed_sequence = np.random.SeedSequence(seed)
+        """The root seed sequence from which the streams are spawned."""
+
+        if seed is None:
+            LOGGER.info(
+                "Animal model random streams seeded with entropy "
+                f"{self.seed_sequence.entropy}."
+            )
+
+        migration, seasonal_migration, predation = (
+            np.random.default_rng(child)
+            for child in self.seed_sequence.spawn(len(STREAM_NAMES))
+        )
+        self.migration: np.random.Generator = migration
+        """The stream used to decide on and direct the migration of cohorts."""
+        self.seasonal_migration: np.random.Generator = seasonal_migration
+        """The stream used to decide on the seasonal migration of cohorts."""
+        self.predation: np.random.Generator = predation
+        """The stream used to draw the optimal predator-prey mass ratios."""
+
+    @property
+    def streams(self) -> dict[str, np.random.Generator]:
+        """The random stream of each stochastic process, keyed by process name."""
+        return {name: getattr(self, name) for name in STREAM_NAMES}
+
+    def get_state(self) -> dict[str, Mapping[str, Any]]:
+        """Get the state of every random stream, so that it can be checkpointed.
+
+        Returns:
+            The state of the bit generator of each stream, keyed by process name. The
+            states only contain strings and integers, so can be stored as JSON.
+        """
+
+        return {
+            name: generator.bit_generator.state
+            for name, generator in self.streams.items()
+        }
+
+    def set_state(self, state: Mapping[str, Mapping[str, Any]]) -> None:
+        """Restore the state of every random stream from a checkpoint.
+
+        Args:
+            state: The state of each stream, as returned by :meth:`get_state`.
+
+        Raises:
+            ValueError: If the state does not contain exactly one state for each
+                stream.
+        """
+
+        if set(state) != set(STREAM_NAMES):
+            raise ValueError(
+                f"Random stream state must be given for each of {STREAM_NAMES}, "
+                f"got {tuple(state)}."
+            )
+
+        for name, generator in self.streams.items():
+            generator.bit_generator.state = state[name]
@@ -7,10 +7,13 @@ To Do:
 
 """  # noqa: D205, D415
 
+from collections import deque
 from collections.abc import Sequence
+from functools import lru_cache
 from math import ceil, exp, log
 
 import numpy as np
+from numpy.typing import NDArray
 
 from virtual_ecosystem.models.animal.animal_traits import DietType, MetabolicType
 from virtual_ecosystem.models.animal.constants import BOLTZMANN_CONSTANT
@@ -96,6 +99,52 @@ def metabolic_rate(
         raise ValueError("Invalid metabolic type: {metabolic_type}")
 
 
+def metabolic_rates(
+    mass: NDArray[np.float64],
+    temperature: float | NDArray[np.float64],
+    basal_terms: NDArray[np.float64],
+    field_terms: NDArray[np.float64],
+    is_endothermic: NDArray[np.bool_],
+) -> NDArray[np.float64]:
+    """Calculates the metabolic rates of a set of cohorts in kg of body mass per day.
+
+    This is the vectorised form of :func:`metabolic_rate`, for cohorts of possibly
+    different metabolic types.
+
+    Args:
+        mass: The body-mass [kg] of each cohort.
+        temperature: The temperature [Celsius] of the environment, either shared by
+            all of the cohorts or for each cohort.
+        basal_terms: The basal metabolic constant and exponent of each cohort, with
+            shape (cohorts, 2).
+        field_terms: The field metabolic constant and exponent of each cohort, with
+            shape (cohorts, 2).
+        is_endothermic: Whether each cohort is endothermic, rather than ectothermic.
+
+    Returns:
+        The metabolic rate of an individual of each cohort [kg/d].
+    """
+
+    Es = 3.7 * 10 ** (-2)  # energy to mass conversion constant (g/kJ)
+    sig = 0.5  # proportion of time-step with temp in active range (toy)
+    Ea = 0.69  # aggregate activation energy of metabolic reactions
+    kB = BOLTZMANN_CONSTANT
+    mass_g = mass * 1000  # convert mass to grams
+
+    Ib, bf = basal_terms[:, 0], basal_terms[:, 1]  # field metabolic constant, exponent
+    If, bb = field_terms[:, 0], field_terms[:, 1]  # basal metabolic constant, exponent
+    # body temperature of the individuals (K)
+    Tk = np.where(is_endothermic, 310.0, temperature + 274.15)
+    return (
+        Es
+        * (
+            (sig * If * np.exp(-(Ea / (kB * Tk)))) * mass_g**bf
+            + ((1 - sig) * Ib * np.exp(-(Ea / (kB * Tk)))) * mass_g**bb
+        )
+        / 1000  # convert back to kg
+    )
+
+
 def prey_group_selection(
     diet_type: DietType,
     mass: float,
@@ -527,12 +576,12 @@ def bfs_territory(
     visited = set(territory_cells)
 
     # Queue for BFS, initialized with the starting position (row, col)
-    queue = [(row, col)]
+    queue = deque([(row, col)])
 
     # Perform BFS until the queue is empty or we reach the target number of cells
     while queue and len(territory_cells) < target_cell_number:
         # Dequeue the next cell to process
-        r, c = queue.pop(0)
+        r, c = queue.popleft()
 
         # Explore all neighboring cells in the defined directions
         for dr, dc in directions:
@@ -551,3 +600,72 @@ def bfs_territory(
                         break
 
     return territory_cells
+
+
+@lru_cache(maxsize=64)
+def territory_stencil(target_cell_number: int) -> NDArray[np.int_]:
+    """Get the row and column offsets of the cells in a territory from its centroid.
+
+    The stencil is the territory found by :func:`bfs_territory` around a centroid that
+    is far enough from the edges of the grid that the search is never clipped, in the
+    order in which the cells are found. Stencils are cached for each territory size and
+    are returned as read only arrays.
+
+    Args:
+        target_cell_number: The number of grid cells in the territory.
+
+    Returns:
+        An array of the row and column offsets of each territory cell, with shape
+        (cells, 2).
+    """
+
+    # A grid wide enough that a territory of this size can never reach the edges
+    width = 2 * max(target_cell_number, 1) + 1
+    centroid_key = target_cell_number * width + target_cell_number
+    cells = bfs_territory(centroid_key, target_cell_number, width, width)
+
+    offsets = np.array([divmod(cell, width) for cell in cells], dtype=np.int_)
+    offsets -= divmod(centroid_key, width)
+    offsets.setflags(write=False)
+
+    return offsets
+
+
+@lru_cache(maxsize=4096)
+def get_territory(
+    centroid_key: int, target_cell_number: int, cell_nx: int, cell_ny: int
+) -> tuple[int, ...]:
+    """Get the grid cells of a territory, using a cached stencil where possible.
+
+    The territory stencil for the target size is placed on the centroid. When the
+    stencil lies entirely within the grid, this gives exactly the cells found by
+    :func:`bfs_territory`. Where the stencil would be clipped by the edges of the grid,
+    the search instead expands into the remaining cells, so the territory is found by
+    running the search itself. Territories are cached for the most recently used
+    centroids and sizes and returned as immutable tuples, so the same territory can be
+    shared by many cohorts.
+
+    Args:
+        centroid_key: The community key anchoring the territory.
+        target_cell_number: The number of grid cells in the territory.
+        cell_nx: Number of cells along the x-axis.
+        cell_ny: Number of cells along the y-axis.
+
+    Returns:
+        The grid cell keys of the territory.
+    """
+
+    row, col = divmod(centroid_key, cell_nx)
+    offsets = territory_stencil(target_cell_number)
+    rows = offsets[:, 0] + row
+    cols = offsets[:, 1] + col
+
+    if (
+        rows.min() >= 0
+        and rows.max() < cell_ny
+        and cols.min() >= 0
+        and cols.max() < cell_nx
+    ):
+        return tuple((rows * cell_nx + cols).tolist())
+
+    return tuple(bfs_territory(centroid_key, target_cell_number, cell_nx, cell_ny))
@@ -28,4 +28,13 @@ The other submodules include:
   present in a particular grid cell.
 """  # noqa: D205
 
-from virtual_ecosystem.models.plants.plants_model import PlantsModel  # noqa: F401
+import warnings
+
+from pyrealm.core.experimental import ExperimentalFeatureWarning
+
+# Ignore the experimental feature warnings coming from pyrealm
+warnings.filterwarnings(
+    action="ignore", category=ExperimentalFeatureWarning, module=r"pyrealm"
+)
+
+from virtual_ecosystem.models.plants.plants_model import PlantsModel  # noqa: E402, F401
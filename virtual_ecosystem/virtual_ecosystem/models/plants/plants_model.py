@@ -520,12 +520,15 @@ class PlantsModel(
         # Estimate the light use efficiency of leaves within each canopy layer within
         # each grid cell. The LUE is set purely by the environmental conditions, which
         # are shared across cohorts so we can calculate all layers in all cells.
-        # Some unit conversion needed - PATM and VPD in kPa to Pa.
+        # Some unit conversion needed - PATM and VPD in kPa to Pa. The P Model is always
+        # calculated in double precision, as it is not stable with single precision
+        # inputs when the simulation data is stored as float32.
         pmodel_env = PModelEnvironment(
-            tc=self.data["air_temperature"].to_numpy(),
-            vpd=self.data["vapour_pressure_deficit"].to_numpy() * 1000,
-            patm=self.data["atmospheric_pressure"].to_numpy() * 1000,
-            co2=self.data["atmospheric_co2"].to_numpy(),
+            tc=self.data["air_temperature"].to_numpy().astype(np.float64, copy=False),
+            vpd=self.data["vapour_pressure_deficit"].to_numpy().astype(np.float64)
+            * 1000,
+            patm=self.data["atmospheric_pressure"].to_numpy().astype(np.float64) * 1000,
+            co2=self.data["atmospheric_co2"].to_numpy().astype(np.float64, copy=False),
             core_const=self.pmodel_core_consts,
             pmodel_const=self.pmodel_consts,
         )
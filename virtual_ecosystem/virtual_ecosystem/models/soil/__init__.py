@@ -14,6 +14,8 @@ Each of the soil sub-modules has its own API reference page:
   functional groups used in the soil model.
 * The :mod:`~virtual_ecosystem.models.soil.constants` provides a set of dataclasses
   containing the constants required by the broader soil model.
+* The :mod:`~virtual_ecosystem.models.soil.solver_diagnostics` provides telemetry for
+  the numerical integration of the soil pools.
 """  # noqa: D205
 
 from virtual_ecosystem.models.soil.soil_model import SoilModel  # noqa: F401
@@ -1,20 +1,34 @@
 """The ``models.soil.env_factors`` module contains functions that are used to
 capture the impact that environmental factors have on microbial rates. These include
 temperature, soil water potential, pH and soil texture.
+
+The response curves for temperature, soil water potential, pH and carbon use efficiency
+can optionally be evaluated from tabulated values (see :class:`ResponseCurveTable`).
+The tables are built to a given error bound the first time they are needed and are
+cached for each set of constants, so that they are only rebuilt if the constants change.
 """  # noqa: D205
 
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.constants import convert_temperature, gas_constant
-from scipy.special import expit
 from xarray import DataArray
 
 from virtual_ecosystem.core.core_components import LayerStructure
 from virtual_ecosystem.core.logger import LOGGER
 from virtual_ecosystem.models.soil.constants import SoilConsts
 
+TABULATED_TEMPERATURE_RANGE: tuple[float, float] = (-40.0, 60.0)
+"""The range of soil temperatures covered by tabulated response curves [C]."""
+
+TABULATED_PH_RANGE: tuple[float, float] = (0.0, 14.0)
+"""The range of soil pH values covered by tabulated response curves [unitless]."""
+
+MAX_TABULATED_POINTS: int = 2**20 + 1
+"""The largest number of points used to tabulate a response curve."""
+
 
 @dataclass
 class EnvironmentalEffectFactors:
@@ -28,11 +42,204 @@ class EnvironmentalEffectFactors:
     """Impact of soil clay fraction on enzyme saturation constants [unitless]."""
 
 
+@dataclass(frozen=True)
+class ResponseCurveTable:
+    """An environmental response curve tabulated on an evenly spaced grid.
+
+    Inputs within the range of the table are evaluated by linear interpolation between
+    the tabulated values, which is within :attr:`max_error` of the exact curve. Inputs
+    outside of the range fall back to evaluating the exact curve.
+    """
+
+    curve: Callable[..., NDArray[np.float32]]
+    """The exact response curve."""
+    lower: float
+    """The lowest input value in the table."""
+    upper: float
+    """The highest input value in the table."""
+    values: NDArray[np.float32]
+    """The values of the curve at evenly spaced inputs from lower to upper."""
+    max_error: float
+    """The largest error of the interpolated values, found at the interval midpoints."""
+
+    def __call__(self, x: NDArray[np.float32]) -> NDArray[np.float32]:
+        """Evaluate the response curve.
+
+        Args:
+            x: The input values to evaluate the curve at.
+
+        Returns:
+            The (interpolated) values of the curve.
+        """
+
+        x = np.asarray(x, dtype=np.float64)
+        result = np.empty_like(x)
+
+        inside = (x >= self.lower) & (x <= self.upper)
+        spacing = (self.upper - self.lower) / (len(self.values) - 1)
+        position = (x[inside] - self.lower) / spacing
+        index = np.minimum(position.astype(int), len(self.values) - 2)
+        weight = position - index
+        result[inside] = self.values[index] + weight * (
+            self.values[index + 1] - self.values[index]
+        )
+
+        if not np.all(inside):
+            result[~inside] = self.curve(x[~inside])
+
+        return result
+
+
+def tabulate_response_curve(
+    curve: Callable[..., NDArray[np.float32]],
+    lower: float,
+    upper: float,
+    tolerance: float,
+) -> ResponseCurveTable:
+    """Tabulate a response curve to within a given error bound.
+
+    The number of intervals in the table is doubled until the error of linear
+    interpolation at the midpoint of every interval is within the tolerance. For curves
+    that are smooth over each interval this is where the interpolation error is largest.
+
+    Args:
+        curve: The exact response curve, which must accept an array of inputs.
+        lower: The lowest input value to tabulate.
+        upper: The highest input value to tabulate.
+        tolerance: The largest acceptable error of the interpolated values.
+
+    Returns:
+        The tabulated response curve.
+    """
+
+    no_points = 65
+    while True:
+        inputs = np.linspace(lower, upper, no_points)
+        values = curve(inputs)
+        midpoints = (inputs[:-1] + inputs[1:]) / 2
+        max_error = float(
+            np.max(np.abs(curve(midpoints) - (values[:-1] + values[1:]) / 2))
+        )
+        if max_error <= tolerance or no_points >= MAX_TABULATED_POINTS:
+            break
+        no_points = 2 * no_points - 1
+
+    if max_error > tolerance:
+        LOGGER.warning(
+            f"Response curve tabulated with a maximum error of {max_error:.3g}, which "
+            f"exceeds the requested tolerance of {tolerance:.3g}"
+        )
+
+    return ResponseCurveTable(
+        curve=curve, lower=lower, upper=upper, values=values, max_error=max_error
+    )
+
+
+@dataclass(frozen=True)
+class ResponseCurveTables:
+    """The tabulated response curves that depend only on the soil model constants."""
+
+    water: ResponseCurveTable
+    """Impact of soil water potential on microbial rates."""
+    pH: ResponseCurveTable
+    """Suitability of the soil pH for microbial activity."""
+    carbon_use_efficiency: ResponseCurveTable
+    """The temperature dependent carbon use efficiency."""
+
+
+@lru_cache(maxsize=16)
+def get_response_curve_tables(
+    constants: SoilConsts, tolerance: float
+) -> ResponseCurveTables:
+    """Get the tabulated response curves for a set of soil model constants.
+
+    The tables are cached using the (frozen) constants and the tolerance, so a new set
+    of tables is only built when either of them changes.
+
+    Args:
+        constants: Set of constants for the soil model.
+        tolerance: The largest acceptable error of the interpolated values.
+
+    Returns:
+        The tabulated response curves.
+    """
+
+    water = tabulate_response_curve(
+        curve=lambda water_potential: calculate_water_potential_impact_on_microbes(
+            water_potential=water_potential,
+            water_potential_halt=constants.soil_microbe_water_potential_halt,
+            water_potential_opt=constants.soil_microbe_water_potential_optimum,
+            response_curvature=constants.microbial_water_response_curvature,
+        ),
+        lower=constants.soil_microbe_water_potential_halt,
+        upper=constants.soil_microbe_water_potential_optimum,
+        tolerance=tolerance,
+    )
+    pH = tabulate_response_curve(
+        curve=lambda soil_pH: calculate_pH_suitability(
+            soil_pH=soil_pH,
+            maximum_pH=constants.max_pH_microbes,
+            minimum_pH=constants.min_pH_microbes,
+            lower_optimum_pH=constants.lowest_optimal_pH_microbes,
+            upper_optimum_pH=constants.highest_optimal_pH_microbes,
+        ),
+        lower=TABULATED_PH_RANGE[0],
+        upper=TABULATED_PH_RANGE[1],
+        tolerance=tolerance,
+    )
+    carbon_use_efficiency = tabulate_response_curve(
+        curve=lambda soil_temp: calculate_carbon_use_efficiency(
+            soil_temp=soil_temp,
+            reference_cue_logit=constants.reference_cue_logit,
+            cue_reference_temp=constants.cue_reference_temp,
+            logit_cue_with_temp=constants.logit_cue_with_temperature,
+        ),
+        lower=TABULATED_TEMPERATURE_RANGE[0],
+        upper=TABULATED_TEMPERATURE_RANGE[1],
+        tolerance=tolerance,
+    )
+
+    return ResponseCurveTables(
+        water=water, pH=pH, carbon_use_efficiency=carbon_use_efficiency
+    )
+
+
+@lru_cache(maxsize=64)
+def get_temperature_effect_table(
+    activation_energy: float, reference_temperature: float, tolerance: float
+) -> ResponseCurveTable:
+    """Get the tabulated effect of temperature on a microbial rate.
+
+    The tables are cached using the parameters of the Arrhenius equation and the
+    tolerance, so each distinct curve is only tabulated once.
+
+    Args:
+        activation_energy: Energy of activation [J mol^-1]
+        reference_temperature: The reference temperature of the Arrhenius equation [C]
+        tolerance: The largest acceptable error of the interpolated values.
+
+    Returns:
+        The tabulated temperature effect.
+    """
+
+    return tabulate_response_curve(
+        curve=lambda soil_temp: calculate_temperature_effect_on_microbes(
+            soil_temperature=soil_temp,
+            activation_energy=activation_energy,
+            reference_temperature=reference_temperature,
+        ),
+        lower=TABULATED_TEMPERATURE_RANGE[0],
+        upper=TABULATED_TEMPERATURE_RANGE[1],
+        tolerance=tolerance,
+    )
+
+
 def calculate_environmental_effect_factors(
     soil_water_potential: NDArray[np.float32],
     pH: NDArray[np.float32],
     clay_fraction: NDArray[np.float32],
     constants: SoilConsts,
+    response_curve_tolerance: float | None = None,
 ) -> EnvironmentalEffectFactors:
     """Calculate the effects that the environment has on relevant biogeochemical rates.
 
@@ -44,6 +251,8 @@ def calculate_environmental_effect_factors(
         pH: pH values for each soil grid cell [unitless]
         clay_fraction: The clay fraction for each soil grid cell [unitless]
         constants: Set of constants for the soil model
+        response_curve_tolerance: If provided, the water potential and pH responses
+            are evaluated from tables with this error bound rather than exactly.
 
     Returns:
         An object containing four environmental factors, one for the effect of water
@@ -54,19 +263,24 @@ def calculate_environmental_effect_factors(
 
     # Calculate the impact that each environment variable has on the relevant
     # biogeochemical soil processes
-    water_factor = calculate_water_potential_impact_on_microbes(
-        water_potential=soil_water_potential,
-        water_potential_halt=constants.soil_microbe_water_potential_halt,
-        water_potential_opt=constants.soil_microbe_water_potential_optimum,
-        response_curvature=constants.microbial_water_response_curvature,
-    )
-    pH_factor = calculate_pH_suitability(
-        soil_pH=pH,
-        maximum_pH=constants.max_pH_microbes,
-        minimum_pH=constants.min_pH_microbes,
-        lower_optimum_pH=constants.lowest_optimal_pH_microbes,
-        upper_optimum_pH=constants.highest_optimal_pH_microbes,
-    )
+    if response_curve_tolerance is not None:
+        tables = get_response_curve_tables(constants, response_curve_tolerance)
+        water_factor = tables.water(soil_water_potential)
+        pH_factor = tables.pH(pH)
+    else:
+        water_factor = calculate_water_potential_impact_on_microbes(
+            water_potential=soil_water_potential,
+            water_potential_halt=constants.soil_microbe_water_potential_halt,
+            water_potential_opt=constants.soil_microbe_water_potential_optimum,
+            response_curvature=constants.microbial_water_response_curvature,
+        )
+        pH_factor = calculate_pH_suitability(
+            soil_pH=pH,
+            maximum_pH=constants.max_pH_microbes,
+            minimum_pH=constants.min_pH_microbes,
+            lower_optimum_pH=constants.lowest_optimal_pH_microbes,
+            upper_optimum_pH=constants.highest_optimal_pH_microbes,
+        )
     clay_factor_saturation = calculate_clay_impact_on_enzyme_saturation(
         clay_fraction=clay_fraction,
         base_protection=constants.base_soil_protection,
@@ -83,8 +297,8 @@ def calculate_environmental_effect_factors(
 
 def calculate_temperature_effect_on_microbes(
     soil_temperature: NDArray[np.float32],
-    activation_energy: float,
-    reference_temperature: float,
+    activation_energy: float | NDArray[np.float32],
+    reference_temperature: float | NDArray[np.float32],
 ) -> NDArray[np.float32]:
     """Calculate the effect that temperature has on microbial metabolic rates.
 
@@ -103,6 +317,8 @@ def calculate_temperature_effect_on_microbes(
         A multiplicative factor capturing the effect of temperature on microbial rates
     """
 
+    from scipy.constants import convert_temperature, gas_constant
+
     # Convert the temperatures to Kelvin
     soil_temp_in_kelvin = convert_temperature(
         soil_temperature, old_scale="Celsius", new_scale="Kelvin"
@@ -267,6 +483,8 @@ def calculate_nitrification_temperature_factor(
         [unitless].
     """
 
+    from scipy.constants import convert_temperature
+
     # TODO - This will be removed once temperatures start being supplied in Kelvin
     # Convert the temperatures to Kelvin
     soil_temp_in_kelvin = convert_temperature(
@@ -322,6 +540,8 @@ def calculate_denitrification_temperature_factor(
         [unitless].
     """
 
+    from scipy.constants import convert_temperature
+
     # TODO - This will be removed once temperatures start being supplied in Kelvin
     # Convert the temperatures to Kelvin
     soil_temp_in_kelvin = convert_temperature(
@@ -435,6 +655,8 @@ def calculate_carbon_use_efficiency(
         The carbon use efficiency (CUE) of the microbial community
     """
 
+    from scipy.special import expit
+
     return expit(
         reference_cue_logit + logit_cue_with_temp * (soil_temp - cue_reference_temp)
     )
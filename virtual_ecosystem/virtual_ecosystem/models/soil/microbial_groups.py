@@ -2,7 +2,7 @@
 the different microbial functional groups used in the soil model.
 """  # noqa: D205
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
 from typing import Any
 
 import numpy as np
@@ -396,3 +396,268 @@ def calculate_symbiotic_carbon_supply(
         ectomycorrhiza=ectomycorrhiza_supply,
         arbuscular_mycorrhiza=arbuscular_mycorrhiza_supply,
     )
+
+
+@dataclass(frozen=True)
+class EnzymeClassArrays:
+    """The constants for the full set of enzyme classes stacked into arrays.
+
+    Each numerical constant is stored as an array with one row per enzyme class and a
+    trailing axis of length one, so that it broadcasts directly against arrays of per
+    cell values with shape (number of enzyme classes, number of cells).
+    """
+
+    names: tuple[str, ...]
+    """The names of the enzyme classes, which set the order of the rows."""
+
+    sources: tuple[str, ...]
+    """The microbial taxonomic group which produces each enzyme class."""
+
+    substrates: tuple[str, ...]
+    """The substrate that each enzyme class acts upon."""
+
+    pool_names: tuple[str, ...]
+    """The names of the soil pools that hold each enzyme class."""
+
+    substrate_pool_names: tuple[str, ...]
+    """The names of the soil pools that each enzyme class acts upon."""
+
+    substrate_names: tuple[str, ...]
+    """The distinct substrates, which set the order of ``substrate_membership``."""
+
+    substrate_membership: NDArray[np.float32]
+    """Matrix marking the substrate that each enzyme class acts upon.
+
+    This has shape (number of substrates, number of enzyme classes), so multiplying it
+    by per enzyme class rates gives the total rate for each substrate.
+    """
+
+    maximum_rate: NDArray[np.float32]
+    """The maximum rate of each enzyme at the reference temperature [day^-1]."""
+
+    half_saturation_constant: NDArray[np.float32]
+    """The half saturation constant at the reference temperature [kg C m^-3]."""
+
+    activation_energy_rate: NDArray[np.float32]
+    """Activation energy for enzyme rate with temperature [J K^-1]."""
+
+    activation_energy_saturation: NDArray[np.float32]
+    """Activation energy for enzyme saturation with temperature [J K^-1]."""
+
+    reference_temperature: NDArray[np.float32]
+    """The reference temperature that rate and saturation were measured at [C]."""
+
+    turnover_rate: NDArray[np.float32]
+    """The turnover rate of each enzyme [day^-1]."""
+
+    c_n_ratio: NDArray[np.float32]
+    """Ratio of carbon to nitrogen for each enzyme [unitless]."""
+
+    c_p_ratio: NDArray[np.float32]
+    """Ratio of carbon to phosphorus for each enzyme [unitless]."""
+
+
+@dataclass(frozen=True)
+class MicrobialGroupArrays:
+    """The constants for the full set of microbial groups stacked into arrays.
+
+    Each numerical constant is stored as an array with one row per microbial group and
+    a trailing axis of length one, so that it broadcasts directly against arrays of per
+    cell values with shape (number of groups, number of cells). Only the constants used
+    by the group level processes are stacked.
+    """
+
+    names: tuple[str, ...]
+    """The names of the microbial groups, which set the order of the rows."""
+
+    pool_names: tuple[str, ...]
+    """The names of the soil pools that hold the biomass of each microbial group."""
+
+    turnover_rate: NDArray[np.float32]
+    """Microbial maintenance turnover rate at reference temperature [day^-1]."""
+
+    activation_energy_turnover: NDArray[np.float32]
+    """Activation energy for microbial maintenance turnover rate [J K^-1]."""
+
+    activation_energy_uptake_rate: NDArray[np.float32]
+    """Activation energy for nutrient uptake [J K^-1]."""
+
+    activation_energy_uptake_saturation: NDArray[np.float32]
+    """Activation energy for nutrient uptake saturation constants [J K^-1]."""
+
+    max_uptake_rate_labile_C: NDArray[np.float32]
+    """Maximum rate at the reference temperature of labile carbon uptake [day^-1]."""
+
+    half_sat_labile_C_uptake: NDArray[np.float32]
+    """Half saturation constant for uptake of labile carbon (LMWC) [kg C m^-3]."""
+
+    max_uptake_rate_ammonium: NDArray[np.float32]
+    """Maximum possible rate for ammonium uptake [day^-1]."""
+
+    half_sat_ammonium_uptake: NDArray[np.float32]
+    """Half saturation constant for uptake of ammonium [kg N m^-3]."""
+
+    max_uptake_rate_nitrate: NDArray[np.float32]
+    """Maximum possible rate for nitrate uptake [day^-1]."""
+
+    half_sat_nitrate_uptake: NDArray[np.float32]
+    """Half saturation constant for uptake of nitrate [kg N m^-3]."""
+
+    max_uptake_rate_labile_p: NDArray[np.float32]
+    """Maximum possible rate for labile inorganic phosphorus uptake [day^-1]."""
+
+    half_sat_labile_p_uptake: NDArray[np.float32]
+    """Half saturation constant for uptake of labile inorganic phosphorus [kg P m^-3].
+    """
+
+    reference_temperature: NDArray[np.float32]
+    """The reference temperature that turnover and uptake rates were measured at [C]."""
+
+    c_n_ratio: NDArray[np.float32]
+    """Ratio of carbon to nitrogen in biomass [unitless]."""
+
+    c_p_ratio: NDArray[np.float32]
+    """Ratio of carbon to phosphorus in biomass [unitless]."""
+
+    enzyme_production: NDArray[np.float32]
+    """Allocation of (cellular) biomass growth to the production of each enzyme class.
+
+    This has shape (number of enzyme classes, number of groups), with the enzyme
+    classes in the order given by
+    :attr:`EnzymeClassArrays.names
+    <virtual_ecosystem.models.soil.microbial_groups.EnzymeClassArrays.names>`, so
+    multiplying it by the growth rates of each group gives the total production rate of
+    each enzyme class.
+    """
+
+    def select_groups(self, names: tuple[str, ...]) -> "MicrobialGroupArrays":
+        """Select the constants for a subset of the microbial groups.
+
+        Args:
+            names: The names of the microbial groups to select, which set the order of
+                the rows in the selection.
+
+        Returns:
+            The stacked constants for the selected microbial groups.
+        """
+
+        rows = [self.names.index(name) for name in names]
+
+        def select(name: str) -> Any:
+            value = getattr(self, name)
+            if name == "enzyme_production":
+                return value[:, rows]
+            if isinstance(value, tuple):
+                return tuple(value[row] for row in rows)
+            return value[rows]
+
+        return replace(
+            self, **{field.name: select(field.name) for field in fields(self)}
+        )
+
+
+def stack_enzyme_classes(
+    enzyme_classes: dict[str, EnzymeConstants],
+) -> EnzymeClassArrays:
+    """Stack the constants for the full set of enzyme classes into arrays.
+
+    Args:
+        enzyme_classes: Details of the enzyme classes used by the soil model.
+
+    Returns:
+        The enzyme class constants stacked into arrays, with the classes sorted by name.
+    """
+
+    names = tuple(sorted(enzyme_classes))
+    enzymes = [enzyme_classes[name] for name in names]
+    substrates = tuple(enzyme.substrate for enzyme in enzymes)
+    substrate_names = tuple(sorted(set(substrates)))
+
+    def stack(attribute: str) -> NDArray[np.float32]:
+        return np.array([[getattr(enzyme, attribute)] for enzyme in enzymes])
+
+    return EnzymeClassArrays(
+        names=names,
+        sources=tuple(enzyme.source for enzyme in enzymes),
+        substrates=substrates,
+        pool_names=tuple(
+            f"soil_enzyme_{enzyme.substrate}_{enzyme.source}" for enzyme in enzymes
+        ),
+        substrate_pool_names=tuple(
+            f"soil_c_pool_{substrate}" for substrate in substrates
+        ),
+        substrate_names=substrate_names,
+        substrate_membership=np.array(
+            [
+                [float(substrate == substrate_name) for substrate in substrates]
+                for substrate_name in substrate_names
+            ]
+        ),
+        maximum_rate=stack("maximum_rate"),
+        half_saturation_constant=stack("half_saturation_constant"),
+        activation_energy_rate=stack("activation_energy_rate"),
+        activation_energy_saturation=stack("activation_energy_saturation"),
+        reference_temperature=stack("reference_temperature"),
+        turnover_rate=stack("turnover_rate"),
+        c_n_ratio=stack("c_n_ratio"),
+        c_p_ratio=stack("c_p_ratio"),
+    )
+
+
+def stack_microbial_groups(
+    microbial_groups: dict[str, MicrobialGroupConstants],
+    enzyme_classes: EnzymeClassArrays,
+) -> MicrobialGroupArrays:
+    """Stack the constants for the full set of microbial groups into arrays.
+
+    Args:
+        microbial_groups: Set of microbial functional groups used by the soil model.
+        enzyme_classes: The stacked constants of the enzyme classes used by the soil
+            model, which set the order of the enzyme production matrix.
+
+    Returns:
+        The microbial group constants stacked into arrays, with the groups sorted by
+        name.
+    """
+
+    names = tuple(sorted(microbial_groups))
+    groups = [microbial_groups[name] for name in names]
+
+    def stack(attribute: str) -> NDArray[np.float32]:
+        return np.array([[getattr(group, attribute)] for group in groups])
+
+    return MicrobialGroupArrays(
+        names=names,
+        pool_names=tuple(f"soil_c_pool_{name}" for name in names),
+        turnover_rate=stack("turnover_rate"),
+        activation_energy_turnover=stack("activation_energy_turnover"),
+        activation_energy_uptake_rate=stack("activation_energy_uptake_rate"),
+        activation_energy_uptake_saturation=stack(
+            "activation_energy_uptake_saturation"
+        ),
+        max_uptake_rate_labile_C=stack("max_uptake_rate_labile_C"),
+        half_sat_labile_C_uptake=stack("half_sat_labile_C_uptake"),
+        max_uptake_rate_ammonium=stack("max_uptake_rate_ammonium"),
+        half_sat_ammonium_uptake=stack("half_sat_ammonium_uptake"),
+        max_uptake_rate_nitrate=stack("max_uptake_rate_nitrate"),
+        half_sat_nitrate_uptake=stack("half_sat_nitrate_uptake"),
+        max_uptake_rate_labile_p=stack("max_uptake_rate_labile_p"),
+        half_sat_labile_p_uptake=stack("half_sat_labile_p_uptake"),
+        reference_temperature=stack("reference_temperature"),
+        c_n_ratio=stack("c_n_ratio"),
+        c_p_ratio=stack("c_p_ratio"),
+        enzyme_production=np.array(
+            [
+                [
+                    group.enzyme_production[substrate]
+                    if group.taxonomic_group == source
+                    and substrate in group.find_enzyme_substrates()
+                    else 0.0
+                    for group in groups
+                ]
+                for source, substrate in zip(
+                    enzyme_classes.sources, enzyme_classes.substrates
+                )
+            ]
+        ),
+    )
@@ -6,11 +6,11 @@ enzymes. Pools that track the nitrogen and phosphorus pools associated with each
 carbon pools are also included, as well as inorganic nitrogen and phosphorus pools.
 """  # noqa: D205
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, is_dataclass, replace
+from typing import Any
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.constants import convert_temperature
 
 from virtual_ecosystem.core.core_components import LayerStructure
 from virtual_ecosystem.core.data import Data
@@ -24,6 +24,7 @@ from virtual_ecosystem.models.litter.env_factors import (
 from virtual_ecosystem.models.soil.constants import SoilConsts
 from virtual_ecosystem.models.soil.env_factors import (
     EnvironmentalEffectFactors,
+    calculate_carbon_use_efficiency,
     calculate_denitrification_temperature_factor,
     calculate_environmental_effect_factors,
     calculate_leaching_rate,
@@ -32,14 +33,19 @@ from virtual_ecosystem.models.soil.env_factors import (
     calculate_symbiotic_nitrogen_fixation_carbon_cost,
     calculate_temperature_effect_on_microbes,
     find_total_soil_moisture_for_microbially_active_depth,
+    get_response_curve_tables,
 )
 from virtual_ecosystem.models.soil.microbial_groups import (
     CarbonSupply,
-    EnzymeConstants,
+    EnzymeClassArrays,
+    MicrobialGroupArrays,
     MicrobialGroupConstants,
     calculate_symbiotic_carbon_supply,
 )
-from virtual_ecosystem.models.soil.uptake import calculate_nutrient_uptake_rates
+from virtual_ecosystem.models.soil.uptake import (
+    calculate_nutrient_uptake_rates,
+    calculate_uptake_temperature_factors,
+)
 
 
 @dataclass
@@ -80,41 +86,18 @@ class MicrobialChanges:
     and mineralisation of labile P. A positive value indicates a net immobilisation
     (uptake) of P. """
 
-    bacteria_change: NDArray[np.float32]
-    """Rate of change of bacterial biomass pool [kg C m^-3 day^-1]."""
-
-    saprotrophic_fungi_change: NDArray[np.float32]
-    """Rate of change of saprotrophic fungal biomass pool [kg C m^-3 day^-1]."""
-
-    arbuscular_mycorrhiza_change: NDArray[np.float32]
-    """Rate of change of arbuscular mycorrhizal fungi biomass pool [kg C m^-3 day^-1].
-    """
-
-    ectomycorrhiza_change: NDArray[np.float32]
-    """Rate of change of ectomycorrhizal fungi biomass pool [kg C m^-3 day^-1]."""
+    biomass_change: NDArray[np.float32]
+    """Rate of change of the biomass pool of each microbial group [kg C m^-3 day^-1].
 
-    pom_enzyme_bacteria_change: NDArray[np.float32]
-    """Rate of change for the bacterially produced :term:`POM` degrading enzymes.
-
-    Units of [kg C m^-3 day^-1].
-    """
-
-    maom_enzyme_bacteria_change: NDArray[np.float32]
-    """Rate of change for the bacterially produced :term:`MAOM` degrading enzymes.
-    
-    Units of [kg C m^-3 day^-1].
+    This has one row per microbial group, in the order set by
+    :class:`~virtual_ecosystem.models.soil.microbial_groups.MicrobialGroupArrays`.
     """
 
-    pom_enzyme_fungi_change: NDArray[np.float32]
-    """Rate of change for the fungally produced :term:`POM` degrading enzymes.
+    enzyme_change: NDArray[np.float32]
+    """Rate of change of the pool of each enzyme class [kg C m^-3 day^-1].
 
-    Units of [kg C m^-3 day^-1].
-    """
-
-    maom_enzyme_fungi_change: NDArray[np.float32]
-    """Rate of change for the fungally produced :term:`MAOM` degrading enzymes.
-    
-    Units of [kg C m^-3 day^-1].
+    This has one row per enzyme class, in the order set by
+    :class:`~virtual_ecosystem.models.soil.microbial_groups.EnzymeClassArrays`.
     """
 
     necromass_generation: NDArray[np.float32]
@@ -146,72 +129,17 @@ class EnzymeMediatedRates:
 
 @dataclass
 class EnzymePoolChanges:
-    """Changes to the different enzyme pools due to production and denaturation."""
-
-    net_change_pom_bacteria: NDArray[np.float32]
-    """Net change in the bacterially produced enzyme pool that breaks down :term:`POM`.
-    
-    Units of [kg C m^-3 day^-1]
-    """
-
-    net_change_maom_bacteria: NDArray[np.float32]
-    """Net change in the bacterially produced enzyme pool that breaks down :term:`MAOM`.
-    
-    Units of [kg C m^-3 day^-1]
-    """
-
-    net_change_pom_fungi: NDArray[np.float32]
-    """Net change in the fungally produced enzyme pool that breaks down :term:`POM`.
-    
-    Units of [kg C m^-3 day^-1]
-    """
-
-    net_change_maom_fungi: NDArray[np.float32]
-    """Net change in the fungally produced enzyme pool that breaks down :term:`MAOM`.
-    
-    Units of [kg C m^-3 day^-1]
-    """
-
-    denaturation_pom_bacteria: NDArray[np.float32]
-    """Denaturation rate for the :term:`POM` degrading enzyme produced by bacteria.
-    
-    Units of [kg C m^-3 day^-1]
-    """
-
-    denaturation_maom_bacteria: NDArray[np.float32]
-    """Denaturation rate for the :term:`MAOM` degrading enzyme produced by bacteria.
-    
-    Units of [kg C m^-3 day^-1]
-    """
-
-    denaturation_pom_fungi: NDArray[np.float32]
-    """Denaturation rate for the :term:`POM` degrading enzyme produced by fungi.
-    
-    Units of [kg C m^-3 day^-1]
-    """
+    """Changes to the different enzyme pools due to production and denaturation.
 
-    denaturation_maom_fungi: NDArray[np.float32]
-    """Denaturation rate for the :term:`MAOM` degrading enzyme produced by fungi.
-    
-    Units of [kg C m^-3 day^-1]
+    Both attributes have one row per enzyme class, in the order set by
+    :class:`~virtual_ecosystem.models.soil.microbial_groups.EnzymeClassArrays`.
     """
 
+    net_change: NDArray[np.float32]
+    """Net change in each enzyme pool [kg C m^-3 day^-1]."""
 
-@dataclass
-class BiomassLosses:
-    """Losses of biomass from each microbial functional group due to turnover."""
-
-    bacteria: NDArray[np.float32]
-    """Rate of loss of bacterial biomass [kg C m^-3 day^-1]."""
-
-    saprotrophic_fungi: NDArray[np.float32]
-    """Rate of loss of saprotrophic fungal biomass [kg C m^-3 day^-1]."""
-
-    ectomycorrhiza: NDArray[np.float32]
-    """Rate of loss of ectomycorrhizal fungal biomass [kg C m^-3 day^-1]."""
-
-    arbuscular_mycorrhiza: NDArray[np.float32]
-    """Rate of loss of arbuscular mycorrhizal fungal biomass [kg C m^-3 day^-1]."""
+    denaturation: NDArray[np.float32]
+    """Denaturation rate for each enzyme class [kg C m^-3 day^-1]."""
 
 
 @dataclass
@@ -355,26 +283,157 @@ class PoolData:
     """Inorganic labile phosphorus pool [kg P m^-3]."""
 
 
+@dataclass
+class SoilForcing:
+    """Pool independent forcing used when calculating soil pool changes.
+
+    None of these quantities depend on the soil pools being integrated, so they are
+    calculated once per soil model update (using
+    :func:`~virtual_ecosystem.models.soil.pools.calculate_soil_forcing`) rather than
+    every time the integrator evaluates the rate of change of the soil pools. All rates
+    supplied by other models are stored in per volume units.
+    """
+
+    soil_temperature: NDArray[np.float32]
+    """Average soil temperature over the microbially active depth [C]."""
+
+    soil_moisture: NDArray[np.float32]
+    """Total soil moisture in the microbially active depth [mm]."""
+
+    effective_saturation: NDArray[np.float32]
+    """Effective saturation of the topsoil layer [unitless]."""
+
+    env_factors: EnvironmentalEffectFactors
+    """Factors through which the environment effects soil cycling rates."""
+
+    carbon_supply: CarbonSupply
+    """Supply of carbon from plants to each symbiotic microbial group."""
+
+    litter_mineralisation: LitterMineralisationFluxes
+    """Fluxes into each soil pool due to mineralisation from the litter model."""
+
+    vertical_flow_rate: NDArray[np.float32]
+    """The vertical flow rate through the soil [mm day^-1]."""
+
+    root_carbohydrate_exudation: NDArray[np.float32]
+    """Rate of root carbohydrate exudation into the soil [kg C m^-3 day^-1]."""
+
+    plant_n_uptake_arbuscular: NDArray[np.float32]
+    """Plant nitrogen uptake via arbuscular mycorrhizal fungi [kg N m^-3 day^-1]."""
+
+    plant_p_uptake_arbuscular: NDArray[np.float32]
+    """Plant phosphorus uptake via arbuscular mycorrhizal fungi [kg P m^-3 day^-1]."""
+
+    plant_n_uptake_ecto: NDArray[np.float32]
+    """Plant nitrogen uptake via ectomycorrhizal fungi [kg N m^-3 day^-1]."""
+
+    plant_p_uptake_ecto: NDArray[np.float32]
+    """Plant phosphorus uptake via ectomycorrhizal fungi [kg P m^-3 day^-1]."""
+
+    plant_ammonium_uptake: NDArray[np.float32]
+    """Direct plant uptake of ammonium [kg N m^-3 day^-1]."""
+
+    plant_nitrate_uptake: NDArray[np.float32]
+    """Direct plant uptake of nitrate [kg N m^-3 day^-1]."""
+
+    plant_phosphorus_uptake: NDArray[np.float32]
+    """Direct plant uptake of labile phosphorus [kg P m^-3 day^-1]."""
+
+    symbiotic_nitrogen_fixation: NDArray[np.float32]
+    """Rate of symbiotic nitrogen fixation [kg N m^-3 day^-1]."""
+
+    free_living_nitrogen_fixation: NDArray[np.float32]
+    """Rate of free living nitrogen fixation [kg N m^-3 day^-1]."""
+
+    ammonium_deposition: NDArray[np.float32]
+    """Rate of ammonium deposition [kg N m^-3 day^-1]."""
+
+    phosphorus_deposition: NDArray[np.float32]
+    """Rate of phosphorus deposition [kg P m^-3 day^-1]."""
+
+    maintenance_turnover_rate: NDArray[np.float32]
+    """Temperature adjusted biomass turnover rate of each microbial group [day^-1].
+
+    This has one row per microbial group.
+    """
+
+    carbon_use_efficiency: NDArray[np.float32]
+    """The carbon use efficiency of the microbial community [unitless]."""
+
+    uptake_temperature_factor_rate: NDArray[np.float32]
+    """Impact of temperature on the uptake rates of each microbial group [unitless].
+
+    This has one row per microbial group.
+    """
+
+    uptake_temperature_factor_saturation: NDArray[np.float32]
+    """Impact of temperature on the uptake saturation constants [unitless].
+
+    This has one row per microbial group.
+    """
+
+    enzyme_rate_constant: NDArray[np.float32]
+    """Environment adjusted maximum rate of each enzyme class [day^-1].
+
+    This has one row per enzyme class.
+    """
+
+    enzyme_saturation_constant: NDArray[np.float32]
+    """Environment adjusted half saturation constant of each enzyme class.
+
+    Units of [kg C m^-3]. This has one row per enzyme class.
+    """
+
+    def select_cells(self, cells: slice) -> "SoilForcing":
+        """Select the forcing for a block of grid cells.
+
+        Args:
+            cells: A slice selecting the grid cells of interest, which are always
+                found along the last axis of the forcing arrays.
+
+        Returns:
+            The forcing restricted to the selected cells. Values that do not vary
+            between cells are shared with the original forcing.
+        """
+
+        def select(value: Any) -> Any:
+            if is_dataclass(value):
+                return replace(
+                    value,  # type: ignore[type-var]
+                    **{
+                        field.name: select(getattr(value, field.name))
+                        for field in fields(value)
+                    },
+                )
+            if np.ndim(value) > 0:
+                return value[..., cells]
+            return value
+
+        return select(self)
+
+
 class SoilPools:
     """This class collects all the various soil pools so that they can be updated.
 
-    This class contains a method to update all soil pools. As well as taking in the data
-    object it also has to take in another dataclass containing the pools. This
-    dictionary is modifiable by the integration algorithm whereas the data object will
-    only be modified when the entire soil model simulation has finished.
+    This class contains a method to update all soil pools. As well as taking in the
+    (pool independent) forcing for the current update it also has to take in a
+    dictionary containing the pools. This dictionary is modifiable by the integration
+    algorithm whereas the data object will only be modified when the entire soil model
+    simulation has finished.
     """
 
     def __init__(
         self,
-        data: Data,
+        forcing: SoilForcing,
         pools: dict[str, NDArray[np.float32]],
         constants: SoilConsts,
         functional_groups: dict[str, MicrobialGroupConstants],
-        enzyme_classes: dict[str, EnzymeConstants],
+        microbial_group_arrays: MicrobialGroupArrays,
+        enzyme_classes: EnzymeClassArrays,
         max_depth_of_microbial_activity: float,
     ):
-        self.data = data
-        """The data object for the Virtual Ecosystem simulation."""
+        self.forcing = forcing
+        """Pool independent forcing for the current soil model update."""
 
         self.pools = PoolData(**pools)
         """Pools which can change during the soil model update.
@@ -388,8 +447,11 @@ class SoilPools:
         self.functional_groups = functional_groups
         """Set of microbial functional groups used by the soil model."""
 
+        self.microbial_group_arrays = microbial_group_arrays
+        """Constants of the microbial functional groups stacked into arrays."""
+
         self.enzyme_classes = enzyme_classes
-        """Details of the enzyme classes used by the soil model."""
+        """Constants of the enzyme classes stacked into arrays."""
 
         self.max_depth_of_microbial_activity = max_depth_of_microbial_activity
         """Maximum depth of the soil profile where microbial activity occurs [m]."""
@@ -397,106 +459,65 @@ class SoilPools:
     def calculate_all_pool_updates(
         self,
         delta_pools_ordered: dict[str, NDArray[np.float32]],
-        layer_structure: LayerStructure,
-        soil_moisture_saturation: float,
-        soil_moisture_residual: float,
-        top_soil_layer_thickness: float,
-    ) -> NDArray[np.float32]:
+    ) -> None:
         """Calculate net change for all soil pools.
 
         This function calls lower level functions which calculate the transfers between
         pools. When all transfers have been calculated the net transfer is used to
-        calculate the net change for each pool.
-
-        The data that this function uses (which comes from the `data` object) is stored
-        in a dictionary form. This becomes an issue as the `scipy` integrator used to
-        integrate this function expects a `numpy` array, and if the order of variables
-        changes in this array the integrator will generate nonsensical results. To
-        prevent this from happening a dictionary (`delta_pools_ordered`) is supplied
-        that contains all the variables that get integrated, this dictionary sets the
-        order of variables in the output `numpy` array. As this dictionary is passed
-        from :func:`~virtual_ecosystem.models.soil.soil_model.SoilModel.integrate` this
+        calculate the net change for each pool. Quantities that do not depend on the
+        pools (e.g. environmental factors and inputs from other models) are taken from
+        the precalculated :class:`SoilForcing` rather than being recalculated here.
+
+        The `scipy` integrator used to integrate this function expects a single `numpy`
+        array, and if the order of variables changes in this array the integrator will
+        generate nonsensical results. To prevent this from happening a dictionary
+        (`delta_pools_ordered`) is supplied that contains a view into the output array
+        for each variable that gets integrated. The net changes are written straight
+        into these views, so that no new output array has to be assembled for every
+        evaluation. As the views are created once per integration (see
+        :func:`~virtual_ecosystem.models.soil.soil_model.make_rate_workspace`) this
         ensures that the order is the same for the entire integration.
 
         Args:
-            delta_pools_ordered: Dictionary to store pool changes in the order that
-                pools are stored in the initial condition vector.
-            layer_structure: The details of the layer structure used across the Virtual
-                Ecosystem.
-            soil_moisture_saturation: The :term:`soil moisture saturation` [unitless].
-            soil_moisture_residual: The :term:`soil moisture residual` [unitless].
-            top_soil_layer_thickness: Thickness of the topsoil layer [m].
-
-        Returns:
-            A vector containing net changes to each pool. Order [lmwc, maom].
+            delta_pools_ordered: Dictionary of views into the output array, in the order
+                that pools are stored in the initial condition vector. The net change
+                for each pool is written into the corresponding view.
         """
 
-        # Find temperature, soil water potential and soil moisture values for the
-        # microbially active depth
-        soil_water_potential = average_water_potential_over_microbially_active_layers(
-            water_potentials=self.data["matric_potential"],
-            layer_structure=layer_structure,
-        )
-        soil_temperature = average_temperature_over_microbially_active_layers(
-            soil_temperatures=self.data["soil_temperature"],
-            surface_temperature=self.data["air_temperature"][
-                layer_structure.index_surface_scalar
-            ].to_numpy(),
-            layer_structure=layer_structure,
-        )
-        soil_moisture = find_total_soil_moisture_for_microbially_active_depth(
-            soil_moistures=self.data["soil_moisture"], layer_structure=layer_structure
-        )
-        # Calculate the effective saturation of the soil (soil moistures need to be
-        # converted from mm to a unitless measure for this to work).
-        effective_saturation = calculate_effective_saturation(
-            soil_moisture=soil_moisture / (top_soil_layer_thickness * 1e3),
-            soil_moisture_saturation=soil_moisture_saturation,
-            soil_moisture_residual=soil_moisture_residual,
-        )
-        # Find supply rate to each plant symbiotic group
-        carbon_supply = calculate_symbiotic_carbon_supply(
-            total_plant_supply=self.to_per_volume(
-                self.data["plant_symbiote_carbon_supply"].to_numpy()
-            ),
-            nitrogen_fixer_fraction=self.constants.nitrogen_fixer_supply_fraction,
-            ectomycorrhiza_fraction=self.constants.ectomycorrhiza_supply_fraction,
-        )
+        forcing = self.forcing
 
-        # Find environmental factors which impact biogeochemical soil processes
-        env_factors = calculate_environmental_effect_factors(
-            soil_water_potential=soil_water_potential,
-            pH=self.data["pH"].to_numpy(),
-            clay_fraction=self.data["clay_fraction"].to_numpy(),
-            constants=self.constants,
+        # Stack the enzyme pools, as they are used for every enzyme class at once
+        enzyme_pools = np.stack(
+            [getattr(self.pools, name) for name in self.enzyme_classes.pool_names]
         )
+
         # find changes related to microbial uptake, growth and decay
         microbial_changes = calculate_microbial_changes(
             pools=self.pools,
-            soil_temp=soil_temperature,
-            env_factors=env_factors,
+            enzyme_pools=enzyme_pools,
+            env_factors=forcing.env_factors,
+            carbon_use_efficiency=forcing.carbon_use_efficiency,
+            uptake_temperature_factor_rate=forcing.uptake_temperature_factor_rate,
+            uptake_temperature_factor_saturation=(
+                forcing.uptake_temperature_factor_saturation
+            ),
             constants=self.constants,
             microbial_groups=self.functional_groups,
+            microbial_group_arrays=self.microbial_group_arrays,
             enzyme_classes=self.enzyme_classes,
-            carbon_supply=carbon_supply,
-            plant_n_uptake_arbuscular=self.to_per_volume(
-                self.data["plant_n_uptake_arbuscular"].to_numpy()
-            ),
-            plant_p_uptake_arbuscular=self.to_per_volume(
-                self.data["plant_p_uptake_arbuscular"].to_numpy()
-            ),
-            plant_n_uptake_ecto=self.to_per_volume(
-                self.data["plant_n_uptake_ecto"].to_numpy()
-            ),
-            plant_p_uptake_ecto=self.to_per_volume(
-                self.data["plant_p_uptake_ecto"].to_numpy()
-            ),
+            maintenance_turnover_rate=forcing.maintenance_turnover_rate,
+            carbon_supply=forcing.carbon_supply,
+            plant_n_uptake_arbuscular=forcing.plant_n_uptake_arbuscular,
+            plant_p_uptake_arbuscular=forcing.plant_p_uptake_arbuscular,
+            plant_n_uptake_ecto=forcing.plant_n_uptake_ecto,
+            plant_p_uptake_ecto=forcing.plant_p_uptake_ecto,
         )
         # find changes driven by the enzyme pools
         enzyme_mediated = calculate_enzyme_mediated_rates(
             pools=self.pools,
-            soil_temp=soil_temperature,
-            env_factors=env_factors,
+            enzyme_pools=enzyme_pools,
+            rate_constant=forcing.enzyme_rate_constant,
+            saturation_constant=forcing.enzyme_saturation_constant,
             enzyme_classes=self.enzyme_classes,
         )
 
@@ -508,8 +529,8 @@ class SoilPools:
             soil_n_pool_ammonium=self.pools.soil_n_pool_ammonium,
             soil_n_pool_nitrate=self.pools.soil_n_pool_nitrate,
             soil_p_pool_labile=self.pools.soil_p_pool_labile,
-            vertical_flow_rate=self.data["vertical_flow"].to_numpy(),
-            soil_moisture=soil_moisture,
+            vertical_flow_rate=forcing.vertical_flow_rate,
+            soil_moisture=forcing.soil_moisture,
             constants=self.constants,
         )
 
@@ -533,20 +554,6 @@ class SoilPools:
             sorption_rate_constant=self.constants.lmwc_sorption_rate,
         )
 
-        # Calculate the flux to each pool from litter mineralisation
-        litter_mineralisation_flux = calculate_litter_mineralisation_fluxes(
-            litter_C_mineralisation_rate=self.data[
-                "litter_C_mineralisation_rate"
-            ].to_numpy(),
-            litter_N_mineralisation_rate=self.data[
-                "litter_N_mineralisation_rate"
-            ].to_numpy(),
-            litter_P_mineralisation_rate=self.data[
-                "litter_P_mineralisation_rate"
-            ].to_numpy(),
-            constants=self.constants,
-        )
-
         # Find mineralisation rates from POM
         pom_n_mineralisation = calculate_soil_nutrient_mineralisation(
             pool_carbon=self.pools.soil_c_pool_pom,
@@ -588,14 +595,14 @@ class SoilPools:
 
         # Calculate nitrification and denitrification rates
         nitrification_rate = calculate_rate_of_nitrification(
-            soil_temp=soil_temperature,
-            effective_saturation=effective_saturation,
+            soil_temp=forcing.soil_temperature,
+            effective_saturation=forcing.effective_saturation,
             soil_n_pool_ammonium=self.pools.soil_n_pool_ammonium,
             constants=self.constants,
         )
         denitrification_rate = calculate_rate_of_denitrification(
-            soil_temp=soil_temperature,
-            effective_saturation=effective_saturation,
+            soil_temp=forcing.soil_temperature,
+            effective_saturation=forcing.effective_saturation,
             soil_n_pool_nitrate=self.pools.soil_n_pool_nitrate,
             constants=self.constants,
         )
@@ -608,20 +615,6 @@ class SoilPools:
             0.0,
         )
 
-        # Calculate rate at which nitrogen is fixed
-        symbiotic_nitrogen_fixation = calculate_symbiotic_nitrogen_fixation(
-            carbon_supply=carbon_supply.nitrogen_fixers,
-            soil_temp=soil_temperature,
-            constants=self.constants,
-        )
-        free_living_nitrogen_fixation = calculate_free_living_nitrogen_fixation(
-            soil_temp=soil_temperature,
-            fixation_at_reference=self.constants.free_living_N_fixation_reference_rate,
-            reference_temperature=self.constants.free_living_N_fixation_reference_temp,
-            q10_nitrogen_fixation=self.constants.free_living_N_fixation_q10_coefficent,
-            active_depth=self.max_depth_of_microbial_activity,
-        )
-
         primary_phosphorus_breakdown = (
             self.constants.primary_phosphorus_breakdown_rate
             * self.pools.soil_p_pool_primary
@@ -633,157 +626,378 @@ class SoilPools:
             labile_p_sorption_rate=self.constants.labile_phosphorus_sorption_rate,
         )
 
-        # Determine net changes to the pools
-        delta_pools_ordered["soil_c_pool_lmwc"] = (
-            litter_mineralisation_flux.lmwc
-            + self.to_per_volume(self.data["root_carbohydrate_exudation"].to_numpy())
-            + enzyme_mediated.pom_to_lmwc
-            + enzyme_mediated.maom_to_lmwc
-            + maom_desorption_to_lmwc
-            + necromass_decay_to_lmwc
-            - microbial_changes.lmwc_uptake
-            - lmwc_sorption_to_maom
-            - nutrient_leaching.lmwc
+        # Write the net changes straight into the (preallocated) output views
+        accumulate_pool_change(
+            delta_pools_ordered["soil_c_pool_lmwc"],
+            inflows=(
+                forcing.litter_mineralisation.lmwc,
+                forcing.root_carbohydrate_exudation,
+                enzyme_mediated.pom_to_lmwc,
+                enzyme_mediated.maom_to_lmwc,
+                maom_desorption_to_lmwc,
+                necromass_decay_to_lmwc,
+            ),
+            outflows=(
+                microbial_changes.lmwc_uptake,
+                lmwc_sorption_to_maom,
+                nutrient_leaching.lmwc,
+            ),
         )
 
-        delta_pools_ordered["soil_c_pool_maom"] = (
-            necromass_sorption_to_maom
-            + lmwc_sorption_to_maom
-            - enzyme_mediated.maom_to_lmwc
-            - maom_desorption_to_lmwc
-        )
-        delta_pools_ordered["soil_c_pool_bacteria"] = microbial_changes.bacteria_change
-        delta_pools_ordered["soil_c_pool_saprotrophic_fungi"] = (
-            microbial_changes.saprotrophic_fungi_change
-        )
-        delta_pools_ordered["soil_c_pool_arbuscular_mycorrhiza"] = (
-            microbial_changes.arbuscular_mycorrhiza_change
-        )
-        delta_pools_ordered["soil_c_pool_ectomycorrhiza"] = (
-            microbial_changes.ectomycorrhiza_change
-        )
-        delta_pools_ordered["soil_c_pool_pom"] = (
-            litter_mineralisation_flux.pom - enzyme_mediated.pom_to_lmwc
-        )
-        delta_pools_ordered["soil_c_pool_necromass"] = (
-            microbial_changes.necromass_generation
-            - necromass_decay_to_lmwc
-            - necromass_sorption_to_maom
-        )
-        delta_pools_ordered["soil_enzyme_pom_bacteria"] = (
-            microbial_changes.pom_enzyme_bacteria_change
-        )
-        delta_pools_ordered["soil_enzyme_maom_bacteria"] = (
-            microbial_changes.maom_enzyme_bacteria_change
+        accumulate_pool_change(
+            delta_pools_ordered["soil_c_pool_maom"],
+            inflows=(
+                necromass_sorption_to_maom,
+                lmwc_sorption_to_maom,
+            ),
+            outflows=(
+                enzyme_mediated.maom_to_lmwc,
+                maom_desorption_to_lmwc,
+            ),
         )
-        delta_pools_ordered["soil_enzyme_pom_fungi"] = (
-            microbial_changes.pom_enzyme_fungi_change
+        for pool_name, biomass_change in zip(
+            self.microbial_group_arrays.pool_names, microbial_changes.biomass_change
+        ):
+            delta_pools_ordered[pool_name][...] = biomass_change
+        accumulate_pool_change(
+            delta_pools_ordered["soil_c_pool_pom"],
+            inflows=(forcing.litter_mineralisation.pom,),
+            outflows=(enzyme_mediated.pom_to_lmwc,),
         )
-        delta_pools_ordered["soil_enzyme_maom_fungi"] = (
-            microbial_changes.maom_enzyme_fungi_change
+        accumulate_pool_change(
+            delta_pools_ordered["soil_c_pool_necromass"],
+            inflows=(microbial_changes.necromass_generation,),
+            outflows=(
+                necromass_decay_to_lmwc,
+                necromass_sorption_to_maom,
+            ),
         )
-        delta_pools_ordered["soil_n_pool_don"] = (
-            litter_mineralisation_flux.don
-            + pom_n_mineralisation
-            + necromass_outflows["decay_nitrogen"]
-            + nutrient_transfers_maom_to_lmwc["nitrogen"]
-            - microbial_changes.don_uptake
-            - nutrient_leaching.don
+        for pool_name, enzyme_change in zip(
+            self.enzyme_classes.pool_names, microbial_changes.enzyme_change
+        ):
+            delta_pools_ordered[pool_name][...] = enzyme_change
+        accumulate_pool_change(
+            delta_pools_ordered["soil_n_pool_don"],
+            inflows=(
+                forcing.litter_mineralisation.don,
+                pom_n_mineralisation,
+                necromass_outflows["decay_nitrogen"],
+                nutrient_transfers_maom_to_lmwc["nitrogen"],
+            ),
+            outflows=(
+                microbial_changes.don_uptake,
+                nutrient_leaching.don,
+            ),
         )
-        delta_pools_ordered["soil_n_pool_particulate"] = (
-            litter_mineralisation_flux.particulate_n - pom_n_mineralisation
+        accumulate_pool_change(
+            delta_pools_ordered["soil_n_pool_particulate"],
+            inflows=(forcing.litter_mineralisation.particulate_n,),
+            outflows=(pom_n_mineralisation,),
         )
-        delta_pools_ordered["soil_n_pool_necromass"] = (
-            microbial_changes.necromass_n_flow
-            - necromass_outflows["decay_nitrogen"]
-            - necromass_outflows["sorption_nitrogen"]
+        accumulate_pool_change(
+            delta_pools_ordered["soil_n_pool_necromass"],
+            inflows=(microbial_changes.necromass_n_flow,),
+            outflows=(
+                necromass_outflows["decay_nitrogen"],
+                necromass_outflows["sorption_nitrogen"],
+            ),
         )
-        delta_pools_ordered["soil_n_pool_maom"] = (
-            necromass_outflows["sorption_nitrogen"]
-            - nutrient_transfers_maom_to_lmwc["nitrogen"]
+        accumulate_pool_change(
+            delta_pools_ordered["soil_n_pool_maom"],
+            inflows=(necromass_outflows["sorption_nitrogen"],),
+            outflows=(nutrient_transfers_maom_to_lmwc["nitrogen"],),
         )
-        delta_pools_ordered["soil_n_pool_ammonium"] = (
-            self.to_per_volume(self.constants.ammonium_deposition_rate)
-            + litter_mineralisation_flux.ammonium
-            + symbiotic_nitrogen_fixation
-            + free_living_nitrogen_fixation
-            - microbial_changes.ammonium_change
-            - self.to_per_volume(self.data["plant_ammonium_uptake"].to_numpy())
-            - nutrient_leaching.ammonium
-            - ammonia_volatilisation_rate
-            - nitrification_rate
+        accumulate_pool_change(
+            delta_pools_ordered["soil_n_pool_ammonium"],
+            inflows=(
+                forcing.ammonium_deposition,
+                forcing.litter_mineralisation.ammonium,
+                forcing.symbiotic_nitrogen_fixation,
+                forcing.free_living_nitrogen_fixation,
+            ),
+            outflows=(
+                microbial_changes.ammonium_change,
+                forcing.plant_ammonium_uptake,
+                nutrient_leaching.ammonium,
+                ammonia_volatilisation_rate,
+                nitrification_rate,
+            ),
         )
-        delta_pools_ordered["soil_n_pool_nitrate"] = (
-            nitrification_rate
-            - denitrification_rate
-            - microbial_changes.nitrate_change
-            - self.to_per_volume(self.data["plant_nitrate_uptake"].to_numpy())
-            - nutrient_leaching.nitrate
+        accumulate_pool_change(
+            delta_pools_ordered["soil_n_pool_nitrate"],
+            inflows=(nitrification_rate,),
+            outflows=(
+                denitrification_rate,
+                microbial_changes.nitrate_change,
+                forcing.plant_nitrate_uptake,
+                nutrient_leaching.nitrate,
+            ),
         )
-        delta_pools_ordered["soil_p_pool_dop"] = (
-            litter_mineralisation_flux.dop
-            + pom_p_mineralisation
-            + necromass_outflows["decay_phosphorus"]
-            + nutrient_transfers_maom_to_lmwc["phosphorus"]
-            - microbial_changes.dop_uptake
-            - nutrient_leaching.dop
+        accumulate_pool_change(
+            delta_pools_ordered["soil_p_pool_dop"],
+            inflows=(
+                forcing.litter_mineralisation.dop,
+                pom_p_mineralisation,
+                necromass_outflows["decay_phosphorus"],
+                nutrient_transfers_maom_to_lmwc["phosphorus"],
+            ),
+            outflows=(
+                microbial_changes.dop_uptake,
+                nutrient_leaching.dop,
+            ),
         )
-        delta_pools_ordered["soil_p_pool_particulate"] = (
-            litter_mineralisation_flux.particulate_p - pom_p_mineralisation
+        accumulate_pool_change(
+            delta_pools_ordered["soil_p_pool_particulate"],
+            inflows=(forcing.litter_mineralisation.particulate_p,),
+            outflows=(pom_p_mineralisation,),
         )
-        delta_pools_ordered["soil_p_pool_necromass"] = (
-            microbial_changes.necromass_p_flow
-            - necromass_outflows["decay_phosphorus"]
-            - necromass_outflows["sorption_phosphorus"]
+        accumulate_pool_change(
+            delta_pools_ordered["soil_p_pool_necromass"],
+            inflows=(microbial_changes.necromass_p_flow,),
+            outflows=(
+                necromass_outflows["decay_phosphorus"],
+                necromass_outflows["sorption_phosphorus"],
+            ),
         )
-        delta_pools_ordered["soil_p_pool_maom"] = (
-            necromass_outflows["sorption_phosphorus"]
-            - nutrient_transfers_maom_to_lmwc["phosphorus"]
+        accumulate_pool_change(
+            delta_pools_ordered["soil_p_pool_maom"],
+            inflows=(necromass_outflows["sorption_phosphorus"],),
+            outflows=(nutrient_transfers_maom_to_lmwc["phosphorus"],),
         )
-        delta_pools_ordered["soil_p_pool_primary"] = (
-            self.constants.tectonic_uplift_rate_phosphorus
-            - primary_phosphorus_breakdown
+        accumulate_pool_change(
+            delta_pools_ordered["soil_p_pool_primary"],
+            inflows=(self.constants.tectonic_uplift_rate_phosphorus,),
+            outflows=(primary_phosphorus_breakdown,),
         )
-        delta_pools_ordered["soil_p_pool_secondary"] = net_formation_secondary_P
-        delta_pools_ordered["soil_p_pool_labile"] = (
-            litter_mineralisation_flux.labile_p
-            + self.to_per_volume(self.constants.phosphorus_deposition_rate)
-            + primary_phosphorus_breakdown
-            - microbial_changes.labile_p_change
-            - self.to_per_volume(self.data["plant_phosphorus_uptake"].to_numpy())
-            - net_formation_secondary_P
-            - nutrient_leaching.labile_P
+        delta_pools_ordered["soil_p_pool_secondary"][...] = net_formation_secondary_P
+        accumulate_pool_change(
+            delta_pools_ordered["soil_p_pool_labile"],
+            inflows=(
+                forcing.litter_mineralisation.labile_p,
+                forcing.phosphorus_deposition,
+                primary_phosphorus_breakdown,
+            ),
+            outflows=(
+                microbial_changes.labile_p_change,
+                forcing.plant_phosphorus_uptake,
+                net_formation_secondary_P,
+                nutrient_leaching.labile_P,
+            ),
         )
 
-        # Create output array of pools in desired order
-        return np.concatenate(list(delta_pools_ordered.values()))
 
-    def to_per_volume(
-        self, input_rate: float | NDArray[np.float32]
-    ) -> NDArray[np.float32]:
-        """Method to convert an external input rate from per area to per volume units.
+def accumulate_pool_change(
+    out: NDArray[np.float32],
+    inflows: tuple[NDArray[np.float32] | float, ...],
+    outflows: tuple[NDArray[np.float32] | float, ...] = (),
+) -> None:
+    """Write the net change of a soil pool into a preallocated array.
 
-        Args:
-            input_rate: Rate of input to convert [kg m^-2 day^-1].
+    The flows are combined using in place operations, in the order that they are
+    given, so that no temporary arrays are created.
 
-        Returns:
-            Input rate converted to per volume (of the microbial active layer) units [kg
-            m^-3 day^-1].
-        """
+    Args:
+        out: The array to write the net change into, normally a view into the output
+            vector of the soil model.
+        inflows: The flows into the pool, at least one must be given.
+        outflows: The flows out of the pool.
+    """
 
-        if isinstance(input_rate, float):
-            return np.array(input_rate / self.max_depth_of_microbial_activity)
-        else:
-            return input_rate / self.max_depth_of_microbial_activity
+    out[...] = inflows[0]
+    for flow in inflows[1:]:
+        np.add(out, flow, out=out)
+    for flow in outflows:
+        np.subtract(out, flow, out=out)
+
+
+def calculate_soil_forcing(
+    data: Data,
+    layer_structure: LayerStructure,
+    constants: SoilConsts,
+    microbial_groups: MicrobialGroupArrays,
+    enzyme_classes: EnzymeClassArrays,
+    max_depth_of_microbial_activity: float,
+    soil_moisture_saturation: float,
+    soil_moisture_residual: float,
+    top_soil_layer_thickness: float,
+    response_curve_tolerance: float | None = None,
+) -> SoilForcing:
+    """Calculate the pool independent forcing for a soil model update.
+
+    The environmental conditions and the inputs from other models are held constant
+    over a soil model update, so everything derived from them can be calculated once
+    before the integration starts.
+
+    Args:
+        data: The data object for the Virtual Ecosystem simulation.
+        layer_structure: The details of the layer structure used across the Virtual
+            Ecosystem.
+        constants: Set of constants for the soil model.
+        microbial_groups: The constants of the microbial functional groups stacked into
+            arrays.
+        enzyme_classes: The constants of the enzyme classes stacked into arrays.
+        max_depth_of_microbial_activity: Maximum depth of the soil profile where
+            microbial activity occurs [m].
+        soil_moisture_saturation: The :term:`soil moisture saturation` [unitless].
+        soil_moisture_residual: The :term:`soil moisture residual` [unitless].
+        top_soil_layer_thickness: Thickness of the topsoil layer [m].
+        response_curve_tolerance: If provided, the environmental response curves are
+            evaluated from tables with this error bound rather than exactly.
+
+    Returns:
+        The forcing to use when calculating soil pool changes.
+    """
+
+    def to_per_volume(input_rate: NDArray[np.float32]) -> NDArray[np.float32]:
+        return input_rate / max_depth_of_microbial_activity
+
+    # Find temperature, soil water potential and soil moisture values for the
+    # microbially active depth
+    soil_water_potential = average_water_potential_over_microbially_active_layers(
+        water_potentials=data["matric_potential"],
+        layer_structure=layer_structure,
+    )
+    soil_temperature = average_temperature_over_microbially_active_layers(
+        soil_temperatures=data["soil_temperature"],
+        surface_temperature=data["air_temperature"][
+            layer_structure.index_surface_scalar
+        ].to_numpy(),
+        layer_structure=layer_structure,
+    )
+    soil_moisture = find_total_soil_moisture_for_microbially_active_depth(
+        soil_moistures=data["soil_moisture"], layer_structure=layer_structure
+    )
+    # Calculate the effective saturation of the soil (soil moistures need to be
+    # converted from mm to a unitless measure for this to work).
+    effective_saturation = calculate_effective_saturation(
+        soil_moisture=soil_moisture / (top_soil_layer_thickness * 1e3),
+        soil_moisture_saturation=soil_moisture_saturation,
+        soil_moisture_residual=soil_moisture_residual,
+    )
+    # Find supply rate to each plant symbiotic group
+    carbon_supply = calculate_symbiotic_carbon_supply(
+        total_plant_supply=to_per_volume(
+            data["plant_symbiote_carbon_supply"].to_numpy()
+        ),
+        nitrogen_fixer_fraction=constants.nitrogen_fixer_supply_fraction,
+        ectomycorrhiza_fraction=constants.ectomycorrhiza_supply_fraction,
+    )
+
+    # Find environmental factors which impact biogeochemical soil processes
+    env_factors = calculate_environmental_effect_factors(
+        soil_water_potential=soil_water_potential,
+        pH=data["pH"].to_numpy(),
+        clay_fraction=data["clay_fraction"].to_numpy(),
+        constants=constants,
+        response_curve_tolerance=response_curve_tolerance,
+    )
+    # Find the temperature dependent carbon use efficiency and uptake constants
+    if response_curve_tolerance is not None:
+        carbon_use_efficiency = get_response_curve_tables(
+            constants, response_curve_tolerance
+        ).carbon_use_efficiency(soil_temperature)
+    else:
+        carbon_use_efficiency = calculate_carbon_use_efficiency(
+            soil_temp=soil_temperature,
+            reference_cue_logit=constants.reference_cue_logit,
+            cue_reference_temp=constants.cue_reference_temp,
+            logit_cue_with_temp=constants.logit_cue_with_temperature,
+        )
+    uptake_temperature_factor_rate, uptake_temperature_factor_saturation = (
+        calculate_uptake_temperature_factors(
+            soil_temp=soil_temperature,
+            microbial_groups=microbial_groups,
+            response_curve_tolerance=response_curve_tolerance,
+        )
+    )
+    # Find the environment adjusted rate constants for every enzyme class
+    enzyme_rate_constant, enzyme_saturation_constant = calculate_enzyme_rate_constants(
+        soil_temp=soil_temperature,
+        env_factors=env_factors,
+        enzyme_classes=enzyme_classes,
+    )
+
+    return SoilForcing(
+        soil_temperature=soil_temperature,
+        soil_moisture=soil_moisture,
+        effective_saturation=effective_saturation,
+        env_factors=env_factors,
+        carbon_supply=carbon_supply,
+        # Calculate the flux to each pool from litter mineralisation
+        litter_mineralisation=calculate_litter_mineralisation_fluxes(
+            litter_C_mineralisation_rate=data[
+                "litter_C_mineralisation_rate"
+            ].to_numpy(),
+            litter_N_mineralisation_rate=data[
+                "litter_N_mineralisation_rate"
+            ].to_numpy(),
+            litter_P_mineralisation_rate=data[
+                "litter_P_mineralisation_rate"
+            ].to_numpy(),
+            constants=constants,
+        ),
+        vertical_flow_rate=data["vertical_flow"].to_numpy(),
+        root_carbohydrate_exudation=to_per_volume(
+            data["root_carbohydrate_exudation"].to_numpy()
+        ),
+        plant_n_uptake_arbuscular=to_per_volume(
+            data["plant_n_uptake_arbuscular"].to_numpy()
+        ),
+        plant_p_uptake_arbuscular=to_per_volume(
+            data["plant_p_uptake_arbuscular"].to_numpy()
+        ),
+        plant_n_uptake_ecto=to_per_volume(data["plant_n_uptake_ecto"].to_numpy()),
+        plant_p_uptake_ecto=to_per_volume(data["plant_p_uptake_ecto"].to_numpy()),
+        plant_ammonium_uptake=to_per_volume(data["plant_ammonium_uptake"].to_numpy()),
+        plant_nitrate_uptake=to_per_volume(data["plant_nitrate_uptake"].to_numpy()),
+        plant_phosphorus_uptake=to_per_volume(
+            data["plant_phosphorus_uptake"].to_numpy()
+        ),
+        # Calculate rate at which nitrogen is fixed
+        symbiotic_nitrogen_fixation=calculate_symbiotic_nitrogen_fixation(
+            carbon_supply=carbon_supply.nitrogen_fixers,
+            soil_temp=soil_temperature,
+            constants=constants,
+        ),
+        free_living_nitrogen_fixation=calculate_free_living_nitrogen_fixation(
+            soil_temp=soil_temperature,
+            fixation_at_reference=constants.free_living_N_fixation_reference_rate,
+            reference_temperature=constants.free_living_N_fixation_reference_temp,
+            q10_nitrogen_fixation=constants.free_living_N_fixation_q10_coefficent,
+            active_depth=max_depth_of_microbial_activity,
+        ),
+        ammonium_deposition=np.array(
+            constants.ammonium_deposition_rate / max_depth_of_microbial_activity
+        ),
+        phosphorus_deposition=np.array(
+            constants.phosphorus_deposition_rate / max_depth_of_microbial_activity
+        ),
+        maintenance_turnover_rate=microbial_groups.turnover_rate
+        * calculate_temperature_effect_on_microbes(
+            soil_temperature=soil_temperature,
+            activation_energy=microbial_groups.activation_energy_turnover,
+            reference_temperature=microbial_groups.reference_temperature,
+        ),
+        carbon_use_efficiency=carbon_use_efficiency,
+        uptake_temperature_factor_rate=uptake_temperature_factor_rate,
+        uptake_temperature_factor_saturation=uptake_temperature_factor_saturation,
+        enzyme_rate_constant=enzyme_rate_constant,
+        enzyme_saturation_constant=enzyme_saturation_constant,
+    )
 
 
 def calculate_microbial_changes(
     pools: PoolData,
-    soil_temp: NDArray[np.float32],
+    enzyme_pools: NDArray[np.float32],
     env_factors: EnvironmentalEffectFactors,
+    carbon_use_efficiency: NDArray[np.float32],
+    uptake_temperature_factor_rate: NDArray[np.float32],
+    uptake_temperature_factor_saturation: NDArray[np.float32],
     constants: SoilConsts,
     microbial_groups: dict[str, MicrobialGroupConstants],
-    enzyme_classes: dict[str, EnzymeConstants],
+    microbial_group_arrays: MicrobialGroupArrays,
+    enzyme_classes: EnzymeClassArrays,
+    maintenance_turnover_rate: NDArray[np.float32],
     carbon_supply: CarbonSupply,
     plant_n_uptake_arbuscular: NDArray[np.float32],
     plant_p_uptake_arbuscular: NDArray[np.float32],
@@ -799,12 +1013,23 @@ def calculate_microbial_changes(
 
     Args:
         pools: Data class containing the various soil pools.
-        soil_temp: soil temperature for each soil grid cell [degrees C]
+        enzyme_pools: The size of each enzyme pool, with one row per enzyme class [kg
+            C m^-3]
         env_factors: Data class containing the various factors through which the
             environment effects soil cycling rates.
+        carbon_use_efficiency: The carbon use efficiency of the microbial community
+            [unitless]
+        uptake_temperature_factor_rate: Impact of temperature on the uptake rates of
+            each microbial group [unitless]
+        uptake_temperature_factor_saturation: Impact of temperature on the uptake
+            saturation constants of each microbial group [unitless]
         constants: Set of constants for the soil model.
         microbial_groups: Set of microbial functional groups used by the soil model.
-        enzyme_classes: Details of the enzyme classes used by the soil model.
+        microbial_group_arrays: The constants of the microbial functional groups
+            stacked into arrays.
+        enzyme_classes: The constants of the enzyme classes stacked into arrays.
+        maintenance_turnover_rate: Temperature adjusted biomass turnover rate of each
+            microbial group [day^-1]
         carbon_supply: The carbon supply to each symbiotic microbial partner [kg C m^-3
             day^-1]
         plant_n_uptake_arbuscular: The rate at which plants take up nitrogen from the
@@ -821,6 +1046,12 @@ def calculate_microbial_changes(
         the rate of change in the microbial biomass pool and the enzyme pools.
     """
 
+    # Find the temperature factors of each group, which are stacked in the order of the
+    # group constants
+    group_index = {
+        name: index for index, name in enumerate(microbial_group_arrays.names)
+    }
+
     # Calculate uptake, growth rate, and loss rate
     bacterial_growth, bacterial_uptake = calculate_nutrient_uptake_rates(
         soil_c_pool_lmwc=pools.soil_c_pool_lmwc,
@@ -835,7 +1066,11 @@ def calculate_microbial_changes(
         phosphorus_exchange=None,
         water_factor=env_factors.water,
         pH_factor=env_factors.pH,
-        soil_temp=soil_temp,
+        temp_factor_rate=uptake_temperature_factor_rate[group_index["bacteria"]],
+        temp_factor_saturation=uptake_temperature_factor_saturation[
+            group_index["bacteria"]
+        ],
+        carbon_use_efficiency=carbon_use_efficiency,
         constants=constants,
         functional_group=microbial_groups["bacteria"],
     )
@@ -853,7 +1088,13 @@ def calculate_microbial_changes(
             phosphorus_exchange=None,
             water_factor=env_factors.water,
             pH_factor=env_factors.pH,
-            soil_temp=soil_temp,
+            temp_factor_rate=uptake_temperature_factor_rate[
+                group_index["saprotrophic_fungi"]
+            ],
+            temp_factor_saturation=uptake_temperature_factor_saturation[
+                group_index["saprotrophic_fungi"]
+            ],
+            carbon_use_efficiency=carbon_use_efficiency,
             constants=constants,
             functional_group=microbial_groups["saprotrophic_fungi"],
         )
@@ -872,7 +1113,13 @@ def calculate_microbial_changes(
             phosphorus_exchange=plant_p_uptake_arbuscular,
             water_factor=env_factors.water,
             pH_factor=env_factors.pH,
-            soil_temp=soil_temp,
+            temp_factor_rate=uptake_temperature_factor_rate[
+                group_index["arbuscular_mycorrhiza"]
+            ],
+            temp_factor_saturation=uptake_temperature_factor_saturation[
+                group_index["arbuscular_mycorrhiza"]
+            ],
+            carbon_use_efficiency=carbon_use_efficiency,
             constants=constants,
             functional_group=microbial_groups["arbuscular_mycorrhiza"],
         )
@@ -890,33 +1137,41 @@ def calculate_microbial_changes(
         phosphorus_exchange=plant_p_uptake_ecto,
         water_factor=env_factors.water,
         pH_factor=env_factors.pH,
-        soil_temp=soil_temp,
+        temp_factor_rate=uptake_temperature_factor_rate[group_index["ectomycorrhiza"]],
+        temp_factor_saturation=uptake_temperature_factor_saturation[
+            group_index["ectomycorrhiza"]
+        ],
+        carbon_use_efficiency=carbon_use_efficiency,
         constants=constants,
         functional_group=microbial_groups["ectomycorrhiza"],
     )
 
+    # Stack the growth rates and biomass of the groups, in the order of the constants
+    growth_rates = {
+        "bacteria": bacterial_growth,
+        "saprotrophic_fungi": saprotrophic_fungal_growth,
+        "arbuscular_mycorrhiza": arbuscular_mycorrhizal_growth,
+        "ectomycorrhiza": ectomycorrhizal_growth,
+    }
+    growth = np.stack([growth_rates[name] for name in microbial_group_arrays.names])
+    biomass = np.stack(
+        [getattr(pools, name) for name in microbial_group_arrays.pool_names]
+    )
+
     biomass_losses = calculate_biomass_losses(
-        pools=pools, microbial_groups=microbial_groups, soil_temp=soil_temp
+        microbial_biomass=biomass, maintenance_turnover_rate=maintenance_turnover_rate
     )
 
-    # Calculate the total production of each enzyme class
+    # Calculate the total production of each enzyme class, symbiotic groups can have
+    # negative growth rates but this should not lead to negative enzyme production
     enzyme_production = calculate_enzyme_production(
-        microbial_groups=microbial_groups,
-        growth_rates={
-            "bacteria": bacterial_growth,
-            "saprotrophic_fungi": saprotrophic_fungal_growth,
-            "arbuscular_mycorrhiza": np.where(
-                arbuscular_mycorrhizal_growth > 0, arbuscular_mycorrhizal_growth, 0
-            ),
-            "ectomycorrhiza": np.where(
-                ectomycorrhizal_growth > 0, ectomycorrhizal_growth, 0
-            ),
-        },
+        microbial_groups=microbial_group_arrays,
+        growth_rates=np.where(growth > 0, growth, 0),
     )
 
     # Find changes in each enzyme pool
     enzyme_changes = calculate_enzyme_changes(
-        pools=pools,
+        enzyme_pools=enzyme_pools,
         enzyme_production=enzyme_production,
         enzyme_classes=enzyme_classes,
     )
@@ -925,7 +1180,7 @@ def calculate_microbial_changes(
     necromass_n_flow, necromass_p_flow = calculate_nutrient_flows_to_necromass(
         biomass_losses=biomass_losses,
         enzyme_changes=enzyme_changes,
-        microbial_groups=microbial_groups,
+        microbial_groups=microbial_group_arrays,
         enzyme_classes=enzyme_classes,
     )
 
@@ -958,25 +1213,10 @@ def calculate_microbial_changes(
             + arbuscular_mycorrhizal_uptake.inorganic_phosphorus
             + ectomycorrhizal_uptake.inorganic_phosphorus
         ),
-        bacteria_change=bacterial_growth - biomass_losses.bacteria,
-        saprotrophic_fungi_change=saprotrophic_fungal_growth
-        - biomass_losses.saprotrophic_fungi,
-        arbuscular_mycorrhiza_change=arbuscular_mycorrhizal_growth
-        - biomass_losses.arbuscular_mycorrhiza,
-        ectomycorrhiza_change=ectomycorrhizal_growth - biomass_losses.ectomycorrhiza,
-        pom_enzyme_bacteria_change=enzyme_changes.net_change_pom_bacteria,
-        maom_enzyme_bacteria_change=enzyme_changes.net_change_maom_bacteria,
-        pom_enzyme_fungi_change=enzyme_changes.net_change_pom_fungi,
-        maom_enzyme_fungi_change=enzyme_changes.net_change_maom_fungi,
+        biomass_change=growth - biomass_losses,
+        enzyme_change=enzyme_changes.net_change,
         necromass_generation=(
-            enzyme_changes.denaturation_pom_bacteria
-            + enzyme_changes.denaturation_maom_bacteria
-            + enzyme_changes.denaturation_pom_fungi
-            + enzyme_changes.denaturation_maom_fungi
-            + biomass_losses.bacteria
-            + biomass_losses.saprotrophic_fungi
-            + biomass_losses.arbuscular_mycorrhiza
-            + biomass_losses.ectomycorrhiza
+            np.sum(enzyme_changes.denaturation, axis=0) + np.sum(biomass_losses, axis=0)
         ),
         necromass_n_flow=necromass_n_flow,
         necromass_p_flow=necromass_p_flow,
@@ -984,74 +1224,68 @@ def calculate_microbial_changes(
 
 
 def calculate_biomass_losses(
-    pools: PoolData,
-    microbial_groups: dict[str, MicrobialGroupConstants],
-    soil_temp: NDArray[np.float32],
-) -> BiomassLosses:
+    microbial_biomass: NDArray[np.float32],
+    maintenance_turnover_rate: NDArray[np.float32],
+) -> NDArray[np.float32]:
     """Calculate the rate of biomass loss for each microbial group.
 
     Args:
-        pools: Data class containing the various soil pools.
-        microbial_groups: Set of microbial functional groups defined in the soil model.
-        soil_temp: temperature of the microbially active soil [degrees C]
+        microbial_biomass: The biomass of each microbial group, with one row per group
+            [kg C m^-3]
+        maintenance_turnover_rate: Temperature adjusted biomass turnover rate of each
+            microbial group [day^-1]
 
     Returns:
         The rate of biomass loss of each microbial functional group [kg C m^-3 day^-1]
     """
 
-    return BiomassLosses(
-        **{
-            group.name: calculate_maintenance_biomass_synthesis(
-                microbe_pool_size=getattr(pools, f"soil_c_pool_{group.name}"),
-                soil_temp=soil_temp,
-                microbial_group=group,
-            )
-            for group in microbial_groups.values()
-        }
-    )
+    return maintenance_turnover_rate * microbial_biomass
 
 
 def calculate_enzyme_mediated_rates(
     pools: PoolData,
-    soil_temp: NDArray[np.float32],
-    env_factors: EnvironmentalEffectFactors,
-    enzyme_classes: dict[str, EnzymeConstants],
+    enzyme_pools: NDArray[np.float32],
+    rate_constant: NDArray[np.float32],
+    saturation_constant: NDArray[np.float32],
+    enzyme_classes: EnzymeClassArrays,
 ) -> EnzymeMediatedRates:
     """Calculate the rates of each enzyme mediated reaction.
 
+    The decomposition rate for every enzyme class is found at once, and the rates for
+    the enzyme classes acting on each substrate are then summed.
+
     Args:
         pools: Data class containing the various soil pools.
-        soil_temp: soil temperature for each soil grid cell [degrees C]
-        env_factors: Data class containing the various factors through which the
-            environment effects soil cycling rates.
-        enzyme_classes: Details of the enzyme classes used in the soil model.
+        enzyme_pools: The size of each enzyme pool, with one row per enzyme class [kg
+            C m^-3]
+        rate_constant: Environment adjusted maximum rate of each enzyme class [day^-1]
+        saturation_constant: Environment adjusted half saturation constant of each
+            enzyme class [kg C m^-3]
+        enzyme_classes: The constants of the enzyme classes stacked into arrays.
 
     Returns:
         A dataclass containing the enzyme mediated decomposition rates of both the
         :term:`POM` and :term:`MAOM` pool.
     """
 
-    substrates = ["pom", "maom"]
-    sources = ["bacteria", "fungi"]
-
-    decomposition_rates = {
-        f"{substrate}_to_lmwc": np.sum(
-            [
-                calculate_enzyme_mediated_decomposition(
-                    soil_c_pool=getattr(pools, f"soil_c_pool_{substrate}"),
-                    soil_enzyme=getattr(pools, f"soil_enzyme_{substrate}_{source}"),
-                    soil_temp=soil_temp,
-                    env_factors=env_factors,
-                    enzyme_class=enzyme_classes[f"{source}_{substrate}"],
-                )
-                for source in sources
-            ],
-            axis=0,
+    decomposition_rates = calculate_enzyme_mediated_decomposition(
+        soil_c_pool=np.stack(
+            [getattr(pools, name) for name in enzyme_classes.substrate_pool_names]
+        ),
+        soil_enzyme=enzyme_pools,
+        rate_constant=rate_constant,
+        saturation_constant=saturation_constant,
+    )
+    substrate_rates = dict(
+        zip(
+            enzyme_classes.substrate_names,
+            enzyme_classes.substrate_membership @ decomposition_rates,
         )
-        for substrate in substrates
-    }
+    )
 
-    return EnzymeMediatedRates(**decomposition_rates)
+    return EnzymeMediatedRates(
+        pom_to_lmwc=substrate_rates["pom"], maom_to_lmwc=substrate_rates["maom"]
+    )
 
 
 def calculate_nutrient_leaching(
@@ -1133,64 +1367,36 @@ def calculate_nutrient_leaching(
 
 
 def calculate_enzyme_changes(
-    pools: PoolData,
-    enzyme_production: dict[str, NDArray[np.float32]],
-    enzyme_classes: dict[str, EnzymeConstants],
+    enzyme_pools: NDArray[np.float32],
+    enzyme_production: NDArray[np.float32],
+    enzyme_classes: EnzymeClassArrays,
 ) -> EnzymePoolChanges:
     """Calculate the change in each of the soil enzyme pools.
 
     Args:
-        pools: Data class containing the various soil pools.
+        enzyme_pools: The size of each enzyme pool, with one row per enzyme class [kg
+            C m^-3]
         enzyme_production: Production rates for each class of enzyme [kg C m^-3 day^-1]
-        constants: Set of constants for the soil model.
-        enzyme_classes: Details of the enzyme classes used in the soil model.
+        enzyme_classes: The constants of the enzyme classes stacked into arrays.
 
     Returns:
-        A dataclass containing the net changes in each enzyme class, as well as the
-        combined denaturation rates of the bacterial and fungal enzyme classes.
+        A dataclass containing the net changes in each enzyme class, as well as their
+        denaturation rates.
     """
 
-    substrates = ["pom", "maom"]
-    sources = ["bacteria", "fungi"]
-
-    enzyme_changes = {
-        source: {
-            substrate: {
-                key: value
-                for key, value in zip(
-                    ["net_change", "denaturation"],
-                    calculate_net_enzyme_change(
-                        enzyme_pool_size=getattr(
-                            pools, f"soil_enzyme_{substrate}_{source}"
-                        ),
-                        enzyme_production=enzyme_production[f"{source}_{substrate}"],
-                        enzyme_turnover_rate=enzyme_classes[
-                            f"{source}_{substrate}"
-                        ].turnover_rate,
-                    ),
-                )
-            }
-            for substrate in substrates
-        }
-        for source in sources
-    }
-
-    return EnzymePoolChanges(
-        net_change_pom_bacteria=enzyme_changes["bacteria"]["pom"]["net_change"],
-        net_change_maom_bacteria=enzyme_changes["bacteria"]["maom"]["net_change"],
-        net_change_pom_fungi=enzyme_changes["fungi"]["pom"]["net_change"],
-        net_change_maom_fungi=enzyme_changes["fungi"]["maom"]["net_change"],
-        denaturation_pom_bacteria=enzyme_changes["bacteria"]["pom"]["denaturation"],
-        denaturation_maom_bacteria=enzyme_changes["bacteria"]["maom"]["denaturation"],
-        denaturation_pom_fungi=enzyme_changes["fungi"]["pom"]["denaturation"],
-        denaturation_maom_fungi=enzyme_changes["fungi"]["maom"]["denaturation"],
+    net_change, denaturation = calculate_net_enzyme_change(
+        enzyme_pool_size=enzyme_pools,
+        enzyme_production=enzyme_production,
+        enzyme_turnover_rate=enzyme_classes.turnover_rate,
     )
 
+    return EnzymePoolChanges(net_change=net_change, denaturation=denaturation)
+
 
 def calculate_net_enzyme_change(
     enzyme_pool_size: NDArray[np.float32],
     enzyme_production: NDArray[np.float32],
-    enzyme_turnover_rate: float,
+    enzyme_turnover_rate: float | NDArray[np.float32],
 ) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
     """Calculate the change in concentration for a specific enzyme pool.
 
@@ -1218,73 +1424,30 @@ def calculate_net_enzyme_change(
 
 
 def calculate_enzyme_production(
-    microbial_groups: dict[str, MicrobialGroupConstants],
-    growth_rates: dict[str, NDArray[np.float32]],
-) -> dict[str, NDArray[np.float32]]:
-    """Calculate the total production of each enzyme class.
-
-    This function checks which substrates each functional group produces enzymes for,
-    and then calculates the enzyme productions based on the growth rates and the
-    proportional enzyme production.
-
-    Args:
-        microbial_groups: Set of microbial functional groups defined in the soil model
-        growth_rates: The (gross) growth rates of each microbial group [kg C m^-3
-            day^-1]
-
-    Returns:
-        A dictionary containing the total production rate of each enzyme class [kg C
-        m^-3 day^-1]
-    """
-
-    production_rates: dict[str, NDArray[np.float32]] = {}
-
-    for group in microbial_groups.values():
-        for substrate in group.find_enzyme_substrates():
-            if f"{group.taxonomic_group}_{substrate}" in production_rates.keys():
-                production_rates[f"{group.taxonomic_group}_{substrate}"] += (
-                    growth_rates[group.name] * group.enzyme_production[substrate]
-                )
-            else:
-                production_rates[f"{group.taxonomic_group}_{substrate}"] = (
-                    growth_rates[group.name] * group.enzyme_production[substrate]
-                )
-
-    return production_rates
-
-
-def calculate_maintenance_biomass_synthesis(
-    microbe_pool_size: NDArray[np.float32],
-    soil_temp: NDArray[np.float32],
-    microbial_group: MicrobialGroupConstants,
+    microbial_groups: MicrobialGroupArrays,
+    growth_rates: NDArray[np.float32],
 ) -> NDArray[np.float32]:
-    """Calculate biomass synthesis rate required to offset losses for a microbial pool.
+    """Calculate the total production of each enzyme class.
 
-    In order for a microbial population to not decline it must synthesise enough new
-    biomass to offset losses. These losses mostly come from cell death and protein
-    decay, but also include loses due to extracellular enzyme excretion.
+    The production of each enzyme class is the sum over the microbial groups of their
+    growth rates multiplied by their proportional allocation to that enzyme class.
 
     Args:
-        microbe_pool_size: Size of the microbial pool of interest [kg C m^-3]
-        soil_temp: soil temperature for each soil grid cell [degrees C]
-        microbial_group: Constants associated with the microbial group of interest
+        microbial_groups: The constants of the microbial functional groups stacked into
+            arrays.
+        growth_rates: The (gross) growth rates of each microbial group, with one row per
+            group [kg C m^-3 day^-1]
 
     Returns:
-        The rate of microbial biomass loss that must be matched to maintain a steady
-        population [kg C m^-3 day^-1]
+        The total production rate of each enzyme class, with one row per enzyme class
+        [kg C m^-3 day^-1]
     """
 
-    temp_factor = calculate_temperature_effect_on_microbes(
-        soil_temperature=soil_temp,
-        activation_energy=microbial_group.activation_energy_turnover,
-        reference_temperature=microbial_group.reference_temperature,
-    )
-
-    return microbial_group.turnover_rate * temp_factor * microbe_pool_size
+    return microbial_groups.enzyme_production @ growth_rates
 
 
 def calculate_enzyme_turnover(
-    enzyme_pool: NDArray[np.float32], turnover_rate: float
+    enzyme_pool: NDArray[np.float32], turnover_rate: float | NDArray[np.float32]
 ) -> NDArray[np.float32]:
     """Calculate the turnover rate of a specific enzyme class.
 
@@ -1299,58 +1462,80 @@ def calculate_enzyme_turnover(
     return turnover_rate * enzyme_pool
 
 
-def calculate_enzyme_mediated_decomposition(
-    soil_c_pool: NDArray[np.float32],
-    soil_enzyme: NDArray[np.float32],
+def calculate_enzyme_rate_constants(
     soil_temp: NDArray[np.float32],
     env_factors: EnvironmentalEffectFactors,
-    enzyme_class: EnzymeConstants,
-) -> NDArray[np.float32]:
-    """Calculate rate of a enzyme mediated decomposition process.
+    enzyme_classes: EnzymeClassArrays,
+) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+    """Calculate the environment adjusted rate constants for each enzyme class.
 
     This function calculates various environmental factors that effect enzyme activity,
-    then uses these to find environmental adjusted rate and saturation constants. These
-    are then used to find the decomposition rate of the pool in question.
+    then uses these to find environmental adjusted rate and saturation constants.
 
     Args:
-        soil_c_pool: Size of organic matter pool [kg C m^-3]
-        soil_enzyme: Amount of enzyme class which breaks down the organic matter pool in
-            question [kg C m^-3]
         soil_temp: soil temperature for each soil grid cell [degrees C]
         env_factors: Data class containing the various factors through which the
             environment effects soil cycling rates.
-        enzyme_class: Constants associated with the enzyme class in question.
+        enzyme_classes: The constants of the enzyme classes stacked into arrays.
 
     Returns:
-        The rate of decomposition of the organic matter pool in question [kg C m^-3
-        day^-1]
+        A tuple containing the rate constant [day^-1] and the saturation constant [kg
+        C m^-3] for each enzyme class, with one row per enzyme class.
     """
 
     # Calculate the factors which impact the rate and saturation constants
     temp_factor_rate = calculate_temperature_effect_on_microbes(
         soil_temperature=soil_temp,
-        activation_energy=enzyme_class.activation_energy_rate,
-        reference_temperature=enzyme_class.reference_temperature,
+        activation_energy=enzyme_classes.activation_energy_rate,
+        reference_temperature=enzyme_classes.reference_temperature,
     )
     temp_factor_saturation = calculate_temperature_effect_on_microbes(
         soil_temperature=soil_temp,
-        activation_energy=enzyme_class.activation_energy_saturation,
-        reference_temperature=enzyme_class.reference_temperature,
+        activation_energy=enzyme_classes.activation_energy_saturation,
+        reference_temperature=enzyme_classes.reference_temperature,
     )
 
     # Calculate the adjusted rate and saturation constants
     rate_constant = (
-        enzyme_class.maximum_rate
+        enzyme_classes.maximum_rate
         * temp_factor_rate
         * env_factors.water
         * env_factors.pH
     )
     saturation_constant = (
-        enzyme_class.half_saturation_constant
+        enzyme_classes.half_saturation_constant
         * temp_factor_saturation
         * env_factors.clay_saturation
     )
 
+    return rate_constant, saturation_constant
+
+
+def calculate_enzyme_mediated_decomposition(
+    soil_c_pool: NDArray[np.float32],
+    soil_enzyme: NDArray[np.float32],
+    rate_constant: NDArray[np.float32],
+    saturation_constant: NDArray[np.float32],
+) -> NDArray[np.float32]:
+    """Calculate rate of a enzyme mediated decomposition process.
+
+    The environment adjusted rate and saturation constants (see
+    :func:`calculate_enzyme_rate_constants`) are used to find the decomposition rate of
+    the pool in question.
+
+    Args:
+        soil_c_pool: Size of organic matter pool [kg C m^-3]
+        soil_enzyme: Amount of enzyme class which breaks down the organic matter pool in
+            question [kg C m^-3]
+        rate_constant: Environment adjusted maximum rate of the enzyme class [day^-1]
+        saturation_constant: Environment adjusted half saturation constant of the
+            enzyme class [kg C m^-3]
+
+    Returns:
+        The rate of decomposition of the organic matter pool in question [kg C m^-3
+        day^-1]
+    """
+
     return (
         rate_constant * soil_enzyme * soil_c_pool / (saturation_constant + soil_c_pool)
     )
@@ -1544,10 +1729,10 @@ def calculate_soil_nutrient_mineralisation(
 
 
 def calculate_nutrient_flows_to_necromass(
-    biomass_losses: BiomassLosses,
+    biomass_losses: NDArray[np.float32],
     enzyme_changes: EnzymePoolChanges,
-    microbial_groups: dict[str, MicrobialGroupConstants],
-    enzyme_classes: dict[str, EnzymeConstants],
+    microbial_groups: MicrobialGroupArrays,
+    enzyme_classes: EnzymeClassArrays,
 ) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
     """Calculate the rate at which nutrients flow into the necromass pool.
 
@@ -1556,43 +1741,26 @@ def calculate_nutrient_flows_to_necromass(
 
     Args:
         biomass_losses: Rate at which biomass of each microbial functional group becomes
-            necromass [kg C m^-3 day^-1]
+            necromass, with one row per group [kg C m^-3 day^-1]
         enzyme_changes: Details of the rate change for the soil enzyme pools.
-        microbial_groups: Set of microbial functional groups defined in the soil model
-        enzyme_classes: Details of the enzyme classes used by the soil model.
+        microbial_groups: The constants of the microbial functional groups stacked into
+            arrays.
+        enzyme_classes: The constants of the enzyme classes stacked into arrays.
 
     Returns:
         A tuple containing the rates at which nitrogen [kg N m^-3 day^-1] and phosphorus
         [kg P m^-3 day^-1] are added to the soil necromass pool
     """
 
-    # Calculate nutrient flows due to cellular losses
-    necromass_n_cellular = sum(
-        getattr(biomass_losses, group) / microbial_groups[group].c_n_ratio
-        for group in microbial_groups.keys()
-    )
-    necromass_p_cellular = sum(
-        getattr(biomass_losses, group) / microbial_groups[group].c_p_ratio
-        for group in microbial_groups.keys()
-    )
-    # And those due to enzyme denaturation
-    necromass_n_enzyme = sum(
-        getattr(enzyme_changes, f"denaturation_{substrate}_{group}")
-        / enzyme_classes[f"{group}_{substrate}"].c_n_ratio
-        for group in ["bacteria", "fungi"]
-        for substrate in ["maom", "pom"]
-    )
-    necromass_p_enzyme = sum(
-        getattr(enzyme_changes, f"denaturation_{substrate}_{group}")
-        / enzyme_classes[f"{group}_{substrate}"].c_p_ratio
-        for group in ["bacteria", "fungi"]
-        for substrate in ["maom", "pom"]
-    )
+    # Sum the nutrient flows due to cellular losses and enzyme denaturation
+    necromass_n_flow = np.sum(
+        biomass_losses / microbial_groups.c_n_ratio, axis=0
+    ) + np.sum(enzyme_changes.denaturation / enzyme_classes.c_n_ratio, axis=0)
+    necromass_p_flow = np.sum(
+        biomass_losses / microbial_groups.c_p_ratio, axis=0
+    ) + np.sum(enzyme_changes.denaturation / enzyme_classes.c_p_ratio, axis=0)
 
-    return (
-        necromass_n_cellular + necromass_n_enzyme,
-        necromass_p_cellular + necromass_p_enzyme,
-    )
+    return necromass_n_flow, necromass_p_flow
 
 
 def find_necromass_nutrient_outflows(
@@ -1844,6 +2012,8 @@ def calculate_free_living_nitrogen_fixation(
         [kg N m^-3 day^-1]
     """
 
+    from scipy.constants import convert_temperature
+
     soil_temp_in_kelvin = convert_temperature(
         soil_temp, old_scale="Celsius", new_scale="Kelvin"
     )
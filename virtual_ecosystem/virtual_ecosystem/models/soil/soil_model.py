@@ -2,7 +2,7 @@
 :class:`~virtual_ecosystem.models.soil.soil_model.SoilModel` class as a child of the
 :class:`~virtual_ecosystem.core.base_model.BaseModel` class. At present a lot of the
 abstract methods of the parent class (e.g.
-:func:`~virtual_ecosystem.core.base_model.BaseModel.spinup`) are overwritten using
+:func:`~virtual_ecosystem.core.base_model.BaseModel.cleanup`) are overwritten using
 placeholder functions that don't do anything. This will change as the Virtual Ecosystem
 model develops. The factory method
 :func:`~virtual_ecosystem.models.soil.soil_model.SoilModel.from_config` exists in a
@@ -17,46 +17,121 @@ reported as one.
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import pairwise
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.integrate import solve_ivp
 from xarray import DataArray, where
 
 from virtual_ecosystem.core.base_model import BaseModel
 from virtual_ecosystem.core.config import Config
 from virtual_ecosystem.core.constants_loader import load_constants
-from virtual_ecosystem.core.core_components import CoreComponents, LayerStructure
+from virtual_ecosystem.core.core_components import CoreComponents
 from virtual_ecosystem.core.data import Data
-from virtual_ecosystem.core.exceptions import InitialisationError
+from virtual_ecosystem.core.exceptions import ConfigurationError, InitialisationError
 from virtual_ecosystem.core.logger import LOGGER
-from virtual_ecosystem.models.litter.env_factors import (
-    average_temperature_over_microbially_active_layers,
-    average_water_potential_over_microbially_active_layers,
-)
 from virtual_ecosystem.models.soil.constants import SoilConsts
 from virtual_ecosystem.models.soil.env_factors import (
     EnvironmentalEffectFactors,
     calculate_environmental_effect_factors,
+    calculate_temperature_effect_on_microbes,
 )
 from virtual_ecosystem.models.soil.microbial_groups import (
+    EnzymeClassArrays,
     EnzymeConstants,
+    MicrobialGroupArrays,
     MicrobialGroupConstants,
     make_full_set_of_enzymes,
     make_full_set_of_microbial_groups,
+    stack_enzyme_classes,
+    stack_microbial_groups,
 )
 from virtual_ecosystem.models.soil.pools import (
+    SoilForcing,
     SoilPools,
-    calculate_maintenance_biomass_synthesis,
+    calculate_biomass_losses,
+    calculate_soil_forcing,
+)
+from virtual_ecosystem.models.soil.solver_diagnostics import (
+    SolverDiagnostics,
+    log_solver_diagnostics,
+    summarise_solver_output,
+    write_solver_diagnostics,
+)
+from virtual_ecosystem.models.soil.uptake import (
+    calculate_maximum_uptake_rates,
+    calculate_uptake_temperature_factors,
+)
+
+if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
+
+
+SPARSE_JACOBIAN_METHODS: tuple[str, ...] = ("Radau", "BDF")
+"""Integration methods that can make use of the soil model Jacobian sparsity."""
+
+FAST_SOIL_POOLS: tuple[str, ...] = (
+    "soil_c_pool_lmwc",
+    "soil_n_pool_don",
+    "soil_p_pool_dop",
+    "soil_n_pool_ammonium",
+    "soil_n_pool_nitrate",
+    "soil_p_pool_labile",
 )
-from virtual_ecosystem.models.soil.uptake import calculate_maximum_uptake_rates
+"""The dissolved soil pools that are integrated separately when splitting is used."""
+
+MYCORRHIZAL_SUPPLY_LIMIT_NAMES: dict[str, str] = {
+    "arbuscular_mycorrhiza": "arbuscular",
+    "ectomycorrhiza": "ecto",
+}
+"""The prefix of the supply limit variables for each mycorrhizal group."""
+
+MIN_SPINUP_SPAN: float = 1.0
+"""The shortest span that the soil spin up retries a failed time step over [days]."""
 
 
 class IntegrationError(Exception):
     """Custom exception class for cases when model integration cannot be completed."""
 
 
+@dataclass
+class SoilRateWorkspace:
+    """Storage that is reused by every evaluation of the soil model rate of change.
+
+    The solver evaluates the rate of change many times for each update, so the slices
+    into the integration vector and the output vector are set up once per integration
+    rather than on every evaluation.
+    """
+
+    pool_slices: dict[str, slice]
+    """The slice of the integration vector that holds each soil pool."""
+    rates: NDArray[np.float32]
+    """Preallocated output vector containing the rate of change of every pool."""
+    delta_pools_ordered: dict[str, NDArray[np.float32]]
+    """Views into the output vector for each pool, in integration vector order."""
+
+
+@dataclass(frozen=True)
+class SplittingOptions:
+    """Settings for integrating the fast and slow soil pools separately."""
+
+    step: float
+    """The length of each Strang splitting step [days]."""
+    fast_pools: tuple[str, ...]
+    """The names of the soil pools that are integrated as fast pools."""
+    fast_method: str
+    """The (implicit) solve_ivp method used to integrate the fast pools."""
+    slow_method: str
+    """The (explicit) solve_ivp method used to integrate the slow pools."""
+
+
 class SoilModel(
     BaseModel,
     model_name="soil",
@@ -226,6 +301,7 @@ class SoilModel(
         # Load in the relevant constants
         model_constants = load_constants(config, "soil", "SoilConsts")
         static = config["soil"]["static"]
+        response_curve_tolerance = config["soil"].get("response_curve_tolerance")
 
         LOGGER.info(
             "Information required to initialise the soil model successfully extracted."
@@ -239,6 +315,19 @@ class SoilModel(
         # Load hydrology constants
         hydro_constants = load_constants(config, "hydrology", "HydroConsts")
 
+        # Extract the settings for the numerical integration
+        integration = config["soil"]["integration"]
+        spinup = config["soil"]["spinup"]
+        splitting = config["soil"]["splitting"]
+
+        # Relative paths to the solver diagnostics file are within the output folder
+        diagnostics_file = None
+        if "diagnostics_file" in integration:
+            diagnostics_file = (
+                Path(config["core"]["data_output_options"]["out_path"])
+                / integration["diagnostics_file"]
+            )
+
         return cls(
             data=data,
             core_components=core_components,
@@ -248,6 +337,28 @@ class SoilModel(
             enzyme_classes=enzyme_classes,
             soil_moisture_saturation=hydro_constants.soil_moisture_saturation,
             soil_moisture_residual=hydro_constants.soil_moisture_residual,
+            integration_method=integration["method"],
+            rtol=integration["rtol"],
+            atol=integration["atol"],
+            max_step=integration.get("max_step", np.inf),
+            cell_blocks=integration["cell_blocks"],
+            integration_workers=integration["workers"],
+            diagnostics_file=diagnostics_file,
+            splitting=(
+                SplittingOptions(
+                    step=splitting["step"],
+                    fast_pools=tuple(splitting["fast_pools"]),
+                    fast_method=splitting["fast_method"],
+                    slow_method=splitting["slow_method"],
+                )
+                if splitting["enabled"]
+                else None
+            ),
+            spinup_enabled=spinup["enabled"],
+            spinup_tolerance=spinup["tolerance"],
+            spinup_newton_max_iterations=spinup["newton_max_iterations"],
+            spinup_max_years=spinup["max_years"],
+            response_curve_tolerance=response_curve_tolerance,
         )
 
     def _setup(
@@ -257,29 +368,79 @@ class SoilModel(
         enzyme_classes: dict[str, EnzymeConstants],
         soil_moisture_saturation: float,
         soil_moisture_residual: float,
+        integration_method: str = "RK45",
+        rtol: float = 1e-3,
+        atol: float = 1e-6,
+        max_step: float = np.inf,
+        cell_blocks: int = 1,
+        integration_workers: int = 1,
+        diagnostics_file: Path | None = None,
+        splitting: SplittingOptions | None = None,
+        spinup_enabled: bool = False,
+        spinup_tolerance: float = 1e-6,
+        spinup_newton_max_iterations: int = 50,
+        spinup_max_years: float = 1000.0,
+        response_curve_tolerance: float | None = None,
         **kwargs: Any,
     ) -> None:
         """Function to setup up the soil model."""
 
         self.model_constants = model_constants
+        # If set, environmental response curves are evaluated from cached tables
+        self.response_curve_tolerance = response_curve_tolerance
 
         # Store microbial functional groups and enzyme classes needed by the model
         self.microbial_groups = microbial_groups
         self.enzyme_classes = enzyme_classes
 
+        # Stack the constants of the groups and enzyme classes into arrays, so that
+        # processes can be calculated for all of them at once
+        self.enzyme_class_arrays = stack_enzyme_classes(enzyme_classes)
+        self.microbial_group_arrays = stack_microbial_groups(
+            microbial_groups, enzyme_classes=self.enzyme_class_arrays
+        )
+
         # Store the two required hydrology constants
         self.soil_moisture_saturation = soil_moisture_saturation
         self.soil_moisture_residual = soil_moisture_residual
 
+        # Store the settings for the numerical integration
+        self.integration_method = integration_method
+        self.rtol = rtol
+        self.atol = atol
+        self.max_step = max_step
+        self.cell_blocks = cell_blocks
+        self.integration_workers = integration_workers
+        self.diagnostics_file = diagnostics_file
+
+        # Store the settings for integrating the fast and slow pools separately
+        if splitting is not None:
+            unknown_pools = set(splitting.fast_pools) - set(self.vars_updated)
+            if unknown_pools:
+                to_raise: Exception = ConfigurationError(
+                    "Fast soil pools for splitting are not soil pools: "
+                    f"{', '.join(sorted(unknown_pools))}"
+                )
+                LOGGER.error(to_raise)
+                raise to_raise
+        self.splitting = splitting
+
+        # Store the settings for spinning the pools up to a steady state
+        self.spinup_enabled = spinup_enabled
+        self.spinup_tolerance = spinup_tolerance
+        self.spinup_newton_max_iterations = spinup_newton_max_iterations
+        self.spinup_max_years = spinup_max_years
+        # Set if the spin up has to wait for the first update of the model
+        self._spinup_pending = False
+
         # Calculate dissolved amounts of each inorganic nutrient
         dissolved_nutrient_pools = self.calculate_dissolved_nutrient_concentrations()
         # Update the data object with these pools
         self.data.add_from_dict(dissolved_nutrient_pools)
 
-        # Calculate the limit on what the plants can take from the symbiotic microbes
-        symbiotic_supply_limits = self.calculate_symbiotic_supply_limits(init=True)
-        # Add these limits to the data object
-        self.data.add_from_dict(symbiotic_supply_limits)
+        # Calculate the limit on what the plants can take from the symbiotic microbes,
+        # and add these limits to the data object
+        self._update_symbiotic_supply_limits()
 
         # Check that soil pool data is appropriately bounded
         if not self._all_pools_positive():
@@ -290,7 +451,75 @@ class SoilModel(
             raise to_raise
 
     def spinup(self) -> None:
-        """Placeholder function to spin up the soil model."""
+        """Spin the soil pools up to a steady state.
+
+        This is only done if spin up is enabled in the ``[soil.spinup]`` section of the
+        configuration. The forcing from the other models is held at its current value,
+        and the pools that give no net change under that forcing are found using
+        :func:`find_steady_state_pools`. This is much cheaper than integrating the soil
+        model through the many years it takes the slower pools to equilibrate.
+
+        Some of the variables that the forcing is calculated from are only populated by
+        the first update of other models. If any of these are missing the spin up is
+        deferred until the start of the first update of the soil model.
+        """
+
+        if not self.spinup_enabled:
+            return
+
+        missing = [var for var in self.vars_required_for_update if var not in self.data]
+        if missing:
+            LOGGER.info(
+                "Soil spin up deferred to the first update, as the following "
+                f"variables are not yet available: {', '.join(missing)}"
+            )
+            self._spinup_pending = True
+            return
+
+        self._spin_up_pools()
+
+    def _spin_up_pools(self) -> None:
+        """Replace the soil pools with their steady state values.
+
+        The dissolved nutrients and symbiotic supply limits are recalculated for the new
+        pools.
+        """
+
+        self._spinup_pending = False
+
+        pool_names, y0 = self._get_pool_vector()
+
+        steady_pools, converged = find_steady_state_pools(
+            y0=y0,
+            forcing=self._calculate_forcing(),
+            pool_names=pool_names,
+            model_constants=self.model_constants,
+            functional_groups=self.microbial_groups,
+            microbial_group_arrays=self.microbial_group_arrays,
+            enzyme_classes=self.enzyme_class_arrays,
+            max_depth_of_microbial_activity=(
+                self.core_constants.max_depth_of_microbial_activity
+            ),
+            solver_options={"rtol": self.rtol, "atol": self.atol},
+            tolerance=self.spinup_tolerance,
+            newton_max_iterations=self.spinup_newton_max_iterations,
+            max_time=self.spinup_max_years * 365.25,
+        )
+
+        if not converged:
+            LOGGER.warning("Soil pools were not fully spun up to a steady state")
+
+        no_cells = self.data.grid.n_cells
+        self.data.add_from_dict(
+            {
+                name: DataArray(steady_pools[slc], dims="cell_id")
+                for name, slc in zip(pool_names, make_slices(no_cells, len(pool_names)))
+            }
+        )
+
+        # Recalculate the quantities that depend on the pools
+        self.data.add_from_dict(self.calculate_dissolved_nutrient_concentrations())
+        self._update_symbiotic_supply_limits()
 
     def _update(self, time_index: int, **kwargs: Any) -> None:
         """Update the soil model by integrating.
@@ -300,8 +529,16 @@ class SoilModel(
             **kwargs: Further arguments to the update method.
         """
 
+        # Complete a spin up that had to wait for the first update of other models
+        if self._spinup_pending:
+            self._spin_up_pools()
+
+        # The forcing does not depend on the pools, so is found once and shared between
+        # the integration and the symbiotic supply limits
+        forcing = self._calculate_forcing()
+
         # Find carbon pool updates by integration
-        updated_carbon_pools = self.integrate()
+        updated_carbon_pools = self.integrate(time_index=time_index, forcing=forcing)
 
         # Update carbon pools (attributes and data object)
         # n.b. this also updates the data object automatically
@@ -313,11 +550,9 @@ class SoilModel(
         # Update the data object with these pools
         self.data.add_from_dict(dissolved_nutrient_pools)
 
-        # Calculate the limit on what the plants can take from the symbiotic microbes
-        symbiotic_supply_limits = self.calculate_symbiotic_supply_limits(init=False)
-
-        # Add these limits to the data object
-        self.data.add_from_dict(symbiotic_supply_limits)
+        # Calculate the limit on what the plants can take from the symbiotic microbes,
+        # and add these limits to the data object
+        self._update_symbiotic_supply_limits(forcing)
 
     def cleanup(self) -> None:
         """Placeholder function for soil model cleanup."""
@@ -338,15 +573,83 @@ class SoilModel(
 
         return all_positive
 
-    def integrate(self) -> dict[str, DataArray]:
+    def _get_pool_vector(self) -> tuple[tuple[str, ...], NDArray[np.float64]]:
+        """Gather the soil pools into a single vector suitable for integration.
+
+        The vector is always double precision, even if the simulation data is stored in
+        single precision.
+
+        Returns:
+            The names of the soil pools in the order they are stored in the vector, and
+            the vector of pool values.
+        """
+
+        pool_names = tuple(
+            name
+            for name in map(str, self.data.data.keys())
+            if name in self.vars_updated and name not in self.vars_populated_by_init
+        )
+        pools = np.concatenate(
+            [self.data[name].to_numpy() for name in pool_names], dtype=np.float64
+        )
+
+        return pool_names, pools
+
+    def _calculate_forcing(self) -> SoilForcing:
+        """Calculate the pool independent forcing of the soil model from the data.
+
+        Returns:
+            The forcing for the current state of the data object.
+        """
+
+        return calculate_soil_forcing(
+            data=self.data,
+            layer_structure=self.layer_structure,
+            constants=self.model_constants,
+            microbial_groups=self.microbial_group_arrays,
+            enzyme_classes=self.enzyme_class_arrays,
+            max_depth_of_microbial_activity=(
+                self.core_constants.max_depth_of_microbial_activity
+            ),
+            soil_moisture_saturation=self.soil_moisture_saturation,
+            soil_moisture_residual=self.soil_moisture_residual,
+            top_soil_layer_thickness=self.layer_structure.soil_layer_thickness[0],
+            response_curve_tolerance=self.response_curve_tolerance,
+        )
+
+    def integrate(
+        self, time_index: int | None = None, forcing: SoilForcing | None = None
+    ) -> dict[str, DataArray]:
         """Integrate the soil model.
 
-        For now a single integration will be used to advance the entire soil module.
-        However, this might get split into several separate integrations in future (if
-        that is feasible).
+        The grid cells do not interact within the soil model, so the cells can be split
+        into contiguous blocks (set by ``cell_blocks`` in the ``[soil.integration]``
+        configuration section) which are integrated separately, each with its own step
+        size control. The blocks are integrated in parallel using a pool of ``workers``
+        processes, and the results are stitched back together once all blocks have been
+        integrated. Threads are not used, as the rate of change is evaluated in Python
+        and so the blocks could not be integrated at the same time.
 
         This function unpacks the variables that are to be integrated into a single
-        numpy array suitable for integration.
+        numpy array suitable for integration. The integration method, tolerances and
+        maximum step size are set in the ``[soil.integration]`` section of the
+        configuration. As grid cells are independent of each other, the implicit
+        methods (``Radau`` and ``BDF``) are given the block diagonal sparsity structure
+        of the Jacobian (see :func:`make_jacobian_sparsity`), and for ``LSODA`` the
+        pools are reordered so that the Jacobian is banded.
+
+        A summary of the work done by the solver for each block (see
+        :class:`~virtual_ecosystem.models.soil.solver_diagnostics.SolverDiagnostics`) is
+        written to the log, and appended to the diagnostics file if one is set by
+        ``diagnostics_file`` in the ``[soil.integration]`` configuration section. This
+        is done before checking whether the integration succeeded, so that failed
+        integrations can be diagnosed.
+
+        Args:
+            time_index: The index of the current update, recorded in the diagnostics
+                file.
+            forcing: The pool independent forcing of the soil model, which is calculated
+                from the data object if not provided.
 
         Returns:
             A data array containing the new pool values (i.e. the values at the final
@@ -363,58 +666,100 @@ class SoilModel(
         update_time = self.model_timing.update_interval_quantity.to("days").magnitude
         t_span = (0.0, update_time)
 
-        # Construct vector of initial values y0
-        y0 = np.concatenate(
-            [
-                self.data[name].to_numpy()
-                for name in map(str, self.data.data.keys())
-                if name in self.vars_updated and name not in self.vars_populated_by_init
-            ]
-        )
+        # Construct vector of initial values y0, and find the order of the pools in it
+        pool_names, y0 = self._get_pool_vector()
 
-        # Find and store order of pools
-        delta_pools_ordered = {
-            name: np.array([])
-            for name in map(str, self.data.data.keys())
-            if name in self.vars_updated and name not in self.vars_populated_by_init
-        }
+        # The forcing does not depend on the pools, so only needs to be found once per
+        # update rather than on every evaluation of the rate of change
+        if forcing is None:
+            forcing = self._calculate_forcing()
 
-        # Carry out simulation
-        output = solve_ivp(
-            construct_full_soil_model,
+        solver_options: dict[str, Any] = {
+            "method": self.integration_method,
+            "rtol": self.rtol,
+            "atol": self.atol,
+            "max_step": self.max_step,
+        }
+        block_args = (
             t_span,
-            y0,
-            args=(
-                self.data,
-                no_cells,
-                self.layer_structure,
-                delta_pools_ordered,
-                self.model_constants,
-                self.microbial_groups,
-                self.enzyme_classes,
-                self.core_constants.max_depth_of_microbial_activity,
-                self.soil_moisture_saturation,
-                self.soil_moisture_residual,
-                self.layer_structure.soil_layer_thickness[0],
-            ),
+            pool_names,
+            self.model_constants,
+            self.microbial_groups,
+            self.microbial_group_arrays,
+            self.enzyme_class_arrays,
+            self.core_constants.max_depth_of_microbial_activity,
+            solver_options,
         )
 
-        # Check if integration failed
-        if not output.success:
-            LOGGER.error(
-                "Integration of soil module failed with following message: {}".format(  # noqa: UP032
-                    str(output.message)
+        # Split the grid cells into contiguous blocks that are integrated separately,
+        # so that the step size in each block is only limited by the cells it contains
+        no_pools = len(pool_names)
+        cell_blocks = make_cell_blocks(no_cells, self.cell_blocks)
+        pools_by_cell = y0.reshape(no_pools, no_cells)
+
+        # Use operator splitting if it is configured
+        integrate_block: Callable[..., tuple[Any, SolverDiagnostics]] = (
+            integrate_soil_block
+            if self.splitting is None
+            else partial(integrate_soil_block_split, splitting=self.splitting)
+        )
+
+        block_outputs: list[tuple[Any, SolverDiagnostics]]
+        if len(cell_blocks) == 1:
+            block_outputs = [integrate_block(y0, forcing, *block_args)]
+        elif self.integration_workers == 1:
+            block_outputs = [
+                integrate_block(
+                    pools_by_cell[:, block].ravel(),
+                    forcing.select_cells(block),
+                    *block_args,
+                    first_cell=block.start,
                 )
+                for block in cell_blocks
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=self.integration_workers) as executor:
+                futures = [
+                    executor.submit(
+                        integrate_block,
+                        pools_by_cell[:, block].ravel(),
+                        forcing.select_cells(block),
+                        *block_args,
+                        first_cell=block.start,
+                    )
+                    for block in cell_blocks
+                ]
+                block_outputs = [future.result() for future in futures]
+
+        # Report the solver telemetry for every block
+        block_diagnostics = [diagnostics for _, diagnostics in block_outputs]
+        for diagnostics in block_diagnostics:
+            log_solver_diagnostics(diagnostics)
+        if self.diagnostics_file is not None:
+            write_solver_diagnostics(
+                self.diagnostics_file, time_index, block_diagnostics
             )
-            raise IntegrationError()
 
-        # Construct index slices
-        slices = make_slices(no_cells, round(len(y0) / no_cells))
+        # Check if integration failed
+        for output, _ in block_outputs:
+            if not output.success:
+                LOGGER.error(
+                    "Integration of soil module failed with following message: "
+                    f"{output.message}"
+                )
+                raise IntegrationError()
+
+        # Stitch the final values for each block back together
+        final_pools = np.empty_like(pools_by_cell)
+        for block, (output, _) in zip(cell_blocks, block_outputs):
+            block_slices = make_slices(block.stop - block.start, no_pools)
+            for pool_index, slc in enumerate(block_slices):
+                final_pools[pool_index, block] = output.y[slc, -1]
 
         # Construct dictionary of data arrays
         new_c_pools = {
-            str(pool): DataArray(output.y[slc, -1], dims="cell_id")
-            for slc, pool in zip(slices, delta_pools_ordered.keys())
+            pool: DataArray(final_pools[pool_index], dims="cell_id")
+            for pool_index, pool in enumerate(pool_names)
         }
 
         return new_c_pools
@@ -476,25 +821,31 @@ class SoilModel(
         else:
             return output_rate * self.core_constants.max_depth_of_microbial_activity
 
-    def calculate_symbiotic_supply_limits(self, init: bool) -> dict[str, DataArray]:
+    def calculate_symbiotic_supply_limits(
+        self, forcing: SoilForcing | None = None
+    ) -> dict[str, NDArray[np.float32]]:
         """Calculate supply limits of nutrients to plants by symbiotic microbes.
 
         These limits are calculated for each symbiote for each nutrient. If the limits
         are negative they are returned as zero to prevent negative uptake. The rates are
         converted from the per volume units used in the soil model, to the per area
-        units used in the plant model.
+        units used in the plant model. The limits for all mycorrhizal groups are found
+        in a single pass over the stacked group constants.
+
+        During a model update the environmental factors are taken from the forcing that
+        was used to integrate the soil pools, so that they are not recalculated.
 
         TODO - These supply limits can only be properly calculated once the soil
         temperature and matric potential are known. At present these are only found once
         the abiotic and hydrology models (respectively), are updated. Instead a
-        temperature of 25C and optimal water potential (set in the constants) are used.
-        Down the line we need to decide whether this inaccuracy is acceptable, or
-        whether the stage at which basic abiotic information gets calculated needs to
-        change.
+        temperature of 25C and optimal water potential (set in the constants) are used
+        when no forcing is provided. Down the line we need to decide whether this
+        inaccuracy is acceptable, or whether the stage at which basic abiotic
+        information gets calculated needs to change.
 
         Args:
-            init: A boolean specifying whether this function is being called as part of
-               the model initialisation or as part of the model update.
+            forcing: The forcing of the current model update, or None to calculate the
+                limits under optimal conditions (e.g. as part of model initialisation).
 
         Returns:
             The maximum amount each nutrient (nitrogen and phosphorus) that plants can
@@ -502,22 +853,19 @@ class SoilModel(
             ectomycorrhizal fungi) [kg m^-2 day^-1]
         """
 
-        if not init:
-            # Average soil temperature and water potential over the microbially active
-            # layers, and then use to calculate the environmental factors
-            soil_water_potential = (
-                average_water_potential_over_microbially_active_layers(
-                    water_potentials=self.data["matric_potential"],
-                    layer_structure=self.layer_structure,
-                )
-            )
-            soil_temperature = average_temperature_over_microbially_active_layers(
-                soil_temperatures=self.data["soil_temperature"],
-                surface_temperature=self.data["air_temperature"][
-                    self.layer_structure.index_surface_scalar
-                ].to_numpy(),
-                layer_structure=self.layer_structure,
-            )
+        mycorrhizal_groups = self.microbial_group_arrays.select_groups(
+            tuple(MYCORRHIZAL_SUPPLY_LIMIT_NAMES)
+        )
+
+        if forcing is not None:
+            rows = [
+                self.microbial_group_arrays.names.index(name)
+                for name in mycorrhizal_groups.names
+            ]
+            env_factors = forcing.env_factors
+            temp_factor_rate = forcing.uptake_temperature_factor_rate[rows]
+            temp_factor_saturation = forcing.uptake_temperature_factor_saturation[rows]
+            maintenance_turnover_rate = forcing.maintenance_turnover_rate[rows]
         else:
             # Want to establish the maximum for optimal conditions, so use the water
             # potential optimum from the constants, and arbitrarily select a soil
@@ -527,61 +875,74 @@ class SoilModel(
                 self.data["pH"].to_numpy(),
                 self.model_constants.soil_microbe_water_potential_optimum,
             )
+            env_factors = calculate_environmental_effect_factors(
+                soil_water_potential=soil_water_potential,
+                pH=self.data["pH"].to_numpy(),
+                clay_fraction=self.data["clay_fraction"].to_numpy(),
+                constants=self.model_constants,
+                response_curve_tolerance=self.response_curve_tolerance,
+            )
+            temp_factor_rate, temp_factor_saturation = (
+                calculate_uptake_temperature_factors(
+                    soil_temp=soil_temperature,
+                    microbial_groups=mycorrhizal_groups,
+                    response_curve_tolerance=self.response_curve_tolerance,
+                )
+            )
+            maintenance_turnover_rate = (
+                mycorrhizal_groups.turnover_rate
+                * calculate_temperature_effect_on_microbes(
+                    soil_temperature=soil_temperature,
+                    activation_energy=mycorrhizal_groups.activation_energy_turnover,
+                    reference_temperature=mycorrhizal_groups.reference_temperature,
+                )
+            )
 
-        env_factors = calculate_environmental_effect_factors(
-            soil_water_potential=soil_water_potential,
-            pH=self.data["pH"].to_numpy(),
-            clay_fraction=self.data["clay_fraction"].to_numpy(),
-            constants=self.model_constants,
-        )
-
-        ecto_n_limit, ecto_p_limit = find_maximum_mycorrhizal_supply(
-            soil_c_pool_lmwc=self.data["soil_c_pool_lmwc"].to_numpy(),
-            soil_n_pool_don=self.data["soil_n_pool_don"].to_numpy(),
-            soil_n_pool_ammonium=self.data["soil_n_pool_ammonium"].to_numpy(),
-            soil_n_pool_nitrate=self.data["soil_n_pool_nitrate"].to_numpy(),
-            soil_p_pool_dop=self.data["soil_p_pool_dop"].to_numpy(),
-            soil_p_pool_labile=self.data["soil_p_pool_labile"].to_numpy(),
-            microbe_pool_size=self.data["soil_c_pool_ectomycorrhiza"].to_numpy(),
-            soil_temp=soil_temperature,
-            microbial_group=self.microbial_groups["ectomycorrhiza"],
-            env_factors=env_factors,
-        )
-        arbuscular_n_limit, arbuscular_p_limit = find_maximum_mycorrhizal_supply(
+        nitrogen_limits, phosphorus_limits = find_maximum_mycorrhizal_supply(
             soil_c_pool_lmwc=self.data["soil_c_pool_lmwc"].to_numpy(),
             soil_n_pool_don=self.data["soil_n_pool_don"].to_numpy(),
             soil_n_pool_ammonium=self.data["soil_n_pool_ammonium"].to_numpy(),
             soil_n_pool_nitrate=self.data["soil_n_pool_nitrate"].to_numpy(),
             soil_p_pool_dop=self.data["soil_p_pool_dop"].to_numpy(),
             soil_p_pool_labile=self.data["soil_p_pool_labile"].to_numpy(),
-            microbe_pool_size=self.data["soil_c_pool_arbuscular_mycorrhiza"].to_numpy(),
-            soil_temp=soil_temperature,
-            microbial_group=self.microbial_groups["arbuscular_mycorrhiza"],
+            microbe_pool_size=np.stack(
+                [self.data[name].to_numpy() for name in mycorrhizal_groups.pool_names]
+            ),
+            maintenance_turnover_rate=maintenance_turnover_rate,
+            microbial_groups=mycorrhizal_groups,
             env_factors=env_factors,
+            temp_factor_rate=temp_factor_rate,
+            temp_factor_saturation=temp_factor_saturation,
         )
 
-        return {
-            "ecto_supply_limit_n": where(
-                DataArray(ecto_n_limit) >= 0.0,
-                self.to_per_area(ecto_n_limit),
-                0.0,
-            ),
-            "ecto_supply_limit_p": where(
-                DataArray(ecto_p_limit) >= 0.0,
-                self.to_per_area(ecto_p_limit),
-                0.0,
-            ),
-            "arbuscular_supply_limit_n": where(
-                DataArray(arbuscular_n_limit) >= 0.0,
-                self.to_per_area(arbuscular_n_limit),
-                0.0,
-            ),
-            "arbuscular_supply_limit_p": where(
-                DataArray(arbuscular_p_limit) >= 0.0,
-                self.to_per_area(arbuscular_p_limit),
-                0.0,
-            ),
-        }
+        supply_limits = {}
+        for row, name in enumerate(mycorrhizal_groups.names):
+            prefix = MYCORRHIZAL_SUPPLY_LIMIT_NAMES[name]
+            for nutrient, limits in (("n", nitrogen_limits), ("p", phosphorus_limits)):
+                supply_limits[f"{prefix}_supply_limit_{nutrient}"] = np.where(
+                    limits[row] >= 0.0, self.to_per_area(limits[row]), 0.0
+                )
+
+        return supply_limits
+
+    def _update_symbiotic_supply_limits(
+        self, forcing: SoilForcing | None = None
+    ) -> None:
+        """Calculate the symbiotic supply limits and add them to the data object.
+
+        Args:
+            forcing: The forcing of the current model update, or None to calculate the
+                limits under optimal conditions.
+        """
+
+        self.data.add_from_dict(
+            {
+                name: DataArray(limit, dims="cell_id")
+                for name, limit in self.calculate_symbiotic_supply_limits(
+                    forcing
+                ).items()
+            }
+        )
 
 
 def find_maximum_mycorrhizal_supply(
@@ -592,9 +953,11 @@ def find_maximum_mycorrhizal_supply(
     soil_p_pool_dop: NDArray[np.float32],
     soil_p_pool_labile: NDArray[np.float32],
     microbe_pool_size: NDArray[np.float32],
-    soil_temp: NDArray[np.float32],
-    microbial_group: MicrobialGroupConstants,
+    maintenance_turnover_rate: NDArray[np.float32],
+    microbial_groups: MicrobialGroupArrays,
     env_factors: EnvironmentalEffectFactors,
+    temp_factor_rate: NDArray[np.float32],
+    temp_factor_saturation: NDArray[np.float32],
 ) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
     """Find maximum amount of nutrients mycorrhizal fungi can supply to plant partners.
 
@@ -605,6 +968,9 @@ def find_maximum_mycorrhizal_supply(
     possible nutrient uptake rates to determine the maximum amount of nutrients that
     mycorrhiza are prepared to supply to their plant partners.
 
+    The calculation is done for every mycorrhizal group at once, so all of the group
+    specific inputs have one row per group, in the order of the stacked constants.
+
     Args:
         soil_c_pool_lmwc: The amount of carbon in the labile mineral associated organic
             matter pool [kg C m^-3]
@@ -615,26 +981,30 @@ def find_maximum_mycorrhizal_supply(
         soil_p_pool_dop: The amount of phosphorus in the dissolved organic phosphorus
             pool [kg P m^-3]
         soil_p_pool_labile: Size of the labile phosphorus pool [kg P m^-3]
-        microbe_pool_size: Size of the microbial pool of interest [kg C m^-3]
-        soil_temp: Soil temperature [degrees C]
-        microbial_group: Constants associated with the microbial group of interest.
+        microbe_pool_size: Size of the pool of each mycorrhizal group [kg C m^-3]
+        maintenance_turnover_rate: Temperature adjusted biomass turnover rate of each
+            mycorrhizal group [day^-1]
+        microbial_groups: The stacked constants of the mycorrhizal groups.
         env_factors: Data class containing the various factors through which the
             environment effects soil cycling rates.
+        temp_factor_rate: A factor capturing the impact of soil temperature on the
+            uptake rates of each mycorrhizal group [unitless]
+        temp_factor_saturation: A factor capturing the impact of soil temperature on
+            the uptake saturation constants of each mycorrhizal group [unitless]
 
     Returns:
-        A tuple containing the maximum rate that the mycorrhizal fungal group is
+        A tuple containing the maximum rate that each mycorrhizal fungal group is
         prepared to supply nitrogen and phosphorus to their plant partners [kg m^-3
         day^-1].
     """
 
     # Find the nitrogen and phosphorus uptake rates required to balance biomass losses
-    biomass_loss = calculate_maintenance_biomass_synthesis(
-        microbe_pool_size=microbe_pool_size,
-        soil_temp=soil_temp,
-        microbial_group=microbial_group,
+    biomass_loss = calculate_biomass_losses(
+        microbial_biomass=microbe_pool_size,
+        maintenance_turnover_rate=maintenance_turnover_rate,
     )
-    nitrogen_requirement = biomass_loss / microbial_group.c_n_ratio
-    phosphorus_requirement = biomass_loss / microbial_group.c_p_ratio
+    nitrogen_requirement = biomass_loss / microbial_groups.c_n_ratio
+    phosphorus_requirement = biomass_loss / microbial_groups.c_p_ratio
 
     # Find maximum uptake rates, and sum nitrogen and phosphorus ones
     maximum_uptake_rates = calculate_maximum_uptake_rates(
@@ -647,8 +1017,9 @@ def find_maximum_mycorrhizal_supply(
         microbial_pool_size=microbe_pool_size,
         water_factor=env_factors.water,
         pH_factor=env_factors.pH,
-        soil_temp=soil_temp,
-        functional_group=microbial_group,
+        temp_factor_rate=temp_factor_rate,
+        temp_factor_saturation=temp_factor_saturation,
+        functional_group=microbial_groups,
     )
     maximum_nitrogen_uptake = (
         maximum_uptake_rates.organic_nitrogen
@@ -669,17 +1040,13 @@ def find_maximum_mycorrhizal_supply(
 def construct_full_soil_model(
     t: float,
     pools: NDArray[np.float32],
-    data: Data,
-    no_cells: int,
-    layer_structure: LayerStructure,
-    delta_pools_ordered: dict[str, NDArray[np.float32]],
+    forcing: SoilForcing,
+    workspace: SoilRateWorkspace,
     model_constants: SoilConsts,
     functional_groups: dict[str, MicrobialGroupConstants],
-    enzyme_classes: dict[str, EnzymeConstants],
+    microbial_group_arrays: MicrobialGroupArrays,
+    enzyme_classes: EnzymeClassArrays,
     max_depth_of_microbial_activity: float,
-    soil_moisture_saturation: float,
-    soil_moisture_residual: float,
-    top_soil_layer_thickness: float,
 ) -> NDArray[np.float32]:
     """Function that constructs the full soil model in a solve_ivp friendly form.
 
@@ -688,50 +1055,562 @@ def construct_full_soil_model(
             but the function must still be accept a time value to allow it to be
             integrated.
         pools: An array containing all soil pools in a single vector
-        data: The data object, used to populate the arguments i.e. pH and bulk density
-        no_cells: Number of grid cells the integration is being performed over
-        layer_structure: The details of the layer structure used across the Virtual
-            Ecosystem.
-        delta_pools_ordered: Dictionary to store pool changes in the order that pools
-            are stored in the initial condition vector.
+        forcing: The pool independent forcing for the current update, as found by
+            :func:`~virtual_ecosystem.models.soil.pools.calculate_soil_forcing`.
+        workspace: The pool slices and preallocated output vector for the
+            integration, as found by :func:`make_rate_workspace`.
         model_constants: Set of constants for the soil model.
         functional_groups: Set of microbial functional groups used by the soil model.
-        enzyme_classes: Set of enzyme classes used by the soil model.
+        microbial_group_arrays: The constants of the microbial functional groups
+            stacked into arrays.
+        enzyme_classes: The constants of the enzyme classes stacked into arrays.
         max_depth_of_microbial_activity: Maximum depth of the soil profile where
             microbial activity occurs [m].
-        soil_moisture_saturation: :term:`soil moisture saturation`, i.e. the maximum
-            (volumetric) moisture the soil can hold [unitless].
-        soil_moisture_residual: :term:`soil moisture residual`, i.e. the minimum
-            (volumetric) moisture the soil can hold [unitless].
-        top_soil_layer_thickness: Thickness of the topsoil layer [m].
 
     Returns:
         The rate of change for each soil pool
     """
 
-    # Construct index slices
-    slices = make_slices(no_cells, len(delta_pools_ordered))
-
-    # Construct dictionary of numpy arrays (using a for loop)
-    all_pools = {
-        str(pool): pools[slc] for slc, pool in zip(slices, delta_pools_ordered.keys())
-    }
+    # Views of each pool in the integration vector
+    all_pools = {pool: pools[slc] for pool, slc in workspace.pool_slices.items()}
 
     soil_pools = SoilPools(
-        data,
+        forcing,
         pools=all_pools,
         constants=model_constants,
         functional_groups=functional_groups,
+        microbial_group_arrays=microbial_group_arrays,
         enzyme_classes=enzyme_classes,
         max_depth_of_microbial_activity=max_depth_of_microbial_activity,
     )
+    soil_pools.calculate_all_pool_updates(
+        delta_pools_ordered=workspace.delta_pools_ordered
+    )
+
+    # The solver keeps hold of earlier evaluations, so the shared output vector must
+    # not be handed out directly
+    return workspace.rates.copy()
+
+
+def integrate_soil_block(
+    y0: NDArray[np.float64],
+    forcing: SoilForcing,
+    t_span: tuple[float, float],
+    pool_names: tuple[str, ...],
+    model_constants: SoilConsts,
+    functional_groups: dict[str, MicrobialGroupConstants],
+    microbial_group_arrays: MicrobialGroupArrays,
+    enzyme_classes: EnzymeClassArrays,
+    max_depth_of_microbial_activity: float,
+    solver_options: dict[str, Any],
+    first_cell: int = 0,
+) -> tuple[Any, SolverDiagnostics]:
+    """Integrate the soil pools for a block of grid cells.
+
+    Grid cells are independent of each other, so the Jacobian only links pools within
+    the same cell. The implicit methods are given this sparsity directly, but LSODA can
+    only exploit a banded Jacobian so for that method the pools are reordered to be
+    contiguous for each cell. The trajectory in the returned solution is always in the
+    original (pool major) order.
+
+    Args:
+        y0: The initial values of the soil pools for the block of cells.
+        forcing: The pool independent forcing for the block of cells.
+        t_span: The start and end time of the integration [days].
+        pool_names: The names of the soil pools, in the order they are stored in the
+            initial condition vector.
+        model_constants: Set of constants for the soil model.
+        functional_groups: Set of microbial functional groups used by the soil model.
+        microbial_group_arrays: The constants of the microbial functional groups
+            stacked into arrays.
+        enzyme_classes: The constants of the enzyme classes stacked into arrays.
+        max_depth_of_microbial_activity: Maximum depth of the soil profile where
+            microbial activity occurs [m].
+        solver_options: The method, tolerances and maximum step size to pass to
+            :func:`scipy.integrate.solve_ivp`.
+        first_cell: Index of the first grid cell in the block, used to report grid
+            cell indices in the solver diagnostics.
+
+    Returns:
+        The solution object returned by :func:`scipy.integrate.solve_ivp`, and a summary
+        of the work done by the solver.
+    """
+
+    # Importing scipy.integrate is expensive, so it is deferred until the model is
+    # first integrated rather than when the model is registered
+    from scipy.integrate import solve_ivp
+
+    no_pools = len(pool_names)
+    no_cells = len(y0) // no_pools
+    solver_options = dict(solver_options)
+
+    # Each block gets its own workspace, as the output vector is overwritten by every
+    # evaluation of the rate of change
+    model_args: tuple[Any, ...] = (
+        forcing,
+        make_rate_workspace(pool_names, no_cells),
+        model_constants,
+        functional_groups,
+        microbial_group_arrays,
+        enzyme_classes,
+        max_depth_of_microbial_activity,
+    )
+
+    rate_function: Callable[..., NDArray[np.float32]] = construct_full_soil_model
+    rate_args = model_args
+    y_start = y0
+    if solver_options["method"] in SPARSE_JACOBIAN_METHODS:
+        solver_options["jac_sparsity"] = make_jacobian_sparsity(no_cells, no_pools)
+    if solver_options["method"] == "LSODA":
+        cell_order = make_cell_major_order(no_cells, no_pools)
+        solver_options["lband"] = no_pools - 1
+        solver_options["uband"] = no_pools - 1
+        rate_function = construct_cell_major_soil_model
+        rate_args = (cell_order, *model_args)
+        y_start = y0[cell_order]
+
+    # The rates at the start of the integration are used to find the cell and pool
+    # that are likely to limit the step size
+    initial_rates = rate_function(0.0, y_start, *rate_args)
+
+    start = perf_counter()
+    output = solve_ivp(rate_function, t_span, y_start, args=rate_args, **solver_options)
+    wall_time = perf_counter() - start
+
+    # Restore the original order if it was changed
+    if solver_options["method"] == "LSODA":
+        initial_rates[cell_order] = initial_rates.copy()
+        if output.y is not None:
+            pool_major = np.empty_like(output.y)
+            pool_major[cell_order] = output.y
+            output.y = pool_major
+
+    diagnostics = summarise_solver_output(
+        output=output,
+        method=solver_options["method"],
+        first_cell=first_cell,
+        pool_names=pool_names,
+        y0=y0,
+        initial_rates=initial_rates,
+        rtol=solver_options["rtol"],
+        atol=solver_options["atol"],
+        wall_time=wall_time,
+    )
+
+    return output, diagnostics
+
+
+def integrate_soil_block_split(
+    y0: NDArray[np.float64],
+    forcing: SoilForcing,
+    t_span: tuple[float, float],
+    pool_names: tuple[str, ...],
+    model_constants: SoilConsts,
+    functional_groups: dict[str, MicrobialGroupConstants],
+    microbial_group_arrays: MicrobialGroupArrays,
+    enzyme_classes: EnzymeClassArrays,
+    max_depth_of_microbial_activity: float,
+    solver_options: dict[str, Any],
+    first_cell: int = 0,
+    *,
+    splitting: SplittingOptions,
+) -> tuple[Any, SolverDiagnostics]:
+    """Integrate the soil pools for a block of grid cells using operator splitting.
+
+    The dissolved pools change much faster than the organic matter pools, and when all
+    pools are integrated together the slow pools have to be stepped at the rate set by
+    the fast pools. Here the pools are instead split into a fast and a slow subsystem,
+    each of which is integrated while the pools of the other subsystem are held fixed.
+    Each splitting step uses Strang splitting, i.e. a half step of the slow pools, a
+    full step of the fast pools and a second half step of the slow pools, which keeps
+    the splitting error second order in the step length. The fast pools are integrated
+    with an implicit method, and the slow pools with an explicit method that can take
+    large steps as they change slowly.
+
+    Args:
+        y0: The initial values of the soil pools for the block of cells.
+        forcing: The pool independent forcing for the block of cells.
+        t_span: The start and end time of the integration [days].
+        pool_names: The names of the soil pools, in the order they are stored in the
+            initial condition vector.
+        model_constants: Set of constants for the soil model.
+        functional_groups: Set of microbial functional groups used by the soil model.
+        microbial_group_arrays: The constants of the microbial functional groups
+            stacked into arrays.
+        enzyme_classes: The constants of the enzyme classes stacked into arrays.
+        max_depth_of_microbial_activity: Maximum depth of the soil profile where
+            microbial activity occurs [m].
+        solver_options: The tolerances and maximum step size to pass to
+            :func:`scipy.integrate.solve_ivp`, the method is set by the splitting
+            options.
+        first_cell: Index of the first grid cell in the block, used to report grid
+            cell indices in the solver diagnostics.
+        splitting: The settings for the operator splitting.
+
+    Returns:
+        A solution object with the pools at the end of every splitting step, and a
+        summary of the work done by the solver. The numbers of rate and Jacobian
+        evaluations and LU decompositions are summed over all of the subsystem solves.
+    """
+
+    from scipy.integrate import solve_ivp
+    from scipy.optimize import OptimizeResult
+
+    no_pools = len(pool_names)
+    no_cells = len(y0) // no_pools
+    model_args: tuple[Any, ...] = (
+        forcing,
+        make_rate_workspace(pool_names, no_cells),
+        model_constants,
+        functional_groups,
+        microbial_group_arrays,
+        enzyme_classes,
+        max_depth_of_microbial_activity,
+    )
+
+    # Indices of the fast and slow pools in the integration vector
+    slices = make_slices(no_cells, no_pools)
+    is_fast = np.zeros(len(y0), dtype=np.bool_)
+    for name, slc in zip(pool_names, slices):
+        is_fast[slc] = name in splitting.fast_pools
+    fast = np.flatnonzero(is_fast)
+    slow = np.flatnonzero(~is_fast)
+
+    fast_options = dict(solver_options, method=splitting.fast_method)
+    if splitting.fast_method in SPARSE_JACOBIAN_METHODS:
+        fast_options["jac_sparsity"] = make_jacobian_sparsity(no_cells, no_pools)[fast][
+            :, fast
+        ]
+    slow_options = dict(solver_options, method=splitting.slow_method)
+
+    # The full pool vector, which holds the fixed pools while a subsystem is solved
+    pools = y0.astype(np.float64)
+    rate_function: Callable[..., NDArray[np.float32]] = construct_full_soil_model
+    work = {"nfev": 0, "njev": 0, "nlu": 0}
+
+    def advance(
+        indices: NDArray[np.int_], start: float, end: float, options: dict[str, Any]
+    ) -> Any:
+        def sub_rate_function(t: float, sub_pools: NDArray[np.float64]) -> Any:
+            pools[indices] = sub_pools
+            return rate_function(t, pools, *model_args)[indices]
+
+        output = solve_ivp(sub_rate_function, (start, end), pools[indices], **options)
+        for key in work:
+            work[key] += int(getattr(output, key))
+        if output.success:
+            pools[indices] = output.y[:, -1]
+        return output
+
+    no_steps = max(int(np.ceil((t_span[1] - t_span[0]) / splitting.step)), 1)
+    times = np.linspace(t_span[0], t_span[1], no_steps + 1)
+    states = [pools.copy()]
+    success, message = True, "The solver successfully reached the end of the span."
+
+    initial_rates = rate_function(t_span[0], pools, *model_args)
+
+    start = perf_counter()
+    for step_start, step_end in pairwise(times):
+        midpoint = (step_start + step_end) / 2
+        for indices, sub_start, sub_end, options in (
+            (slow, step_start, midpoint, slow_options),
+            (fast, step_start, step_end, fast_options),
+            (slow, midpoint, step_end, slow_options),
+        ):
+            output = advance(indices, sub_start, sub_end, options)
+            if not output.success:
+                success, message = False, output.message
+                break
+        if not success:
+            break
+        states.append(pools.copy())
+    wall_time = perf_counter() - start
+
+    output = OptimizeResult(
+        t=times[: len(states)],
+        y=np.stack(states, axis=1),
+        success=success,
+        message=message,
+        **work,
+    )
+    diagnostics = summarise_solver_output(
+        output=output,
+        method="strang",
+        first_cell=first_cell,
+        pool_names=pool_names,
+        y0=y0,
+        initial_rates=initial_rates,
+        rtol=solver_options["rtol"],
+        atol=solver_options["atol"],
+        wall_time=wall_time,
+    )
+
+    return output, diagnostics
+
+
+def find_steady_state_pools(
+    y0: NDArray[np.float64],
+    forcing: SoilForcing,
+    pool_names: tuple[str, ...],
+    model_constants: SoilConsts,
+    functional_groups: dict[str, MicrobialGroupConstants],
+    microbial_group_arrays: MicrobialGroupArrays,
+    enzyme_classes: EnzymeClassArrays,
+    max_depth_of_microbial_activity: float,
+    solver_options: dict[str, Any],
+    tolerance: float,
+    newton_max_iterations: int,
+    max_time: float,
+) -> tuple[NDArray[np.float64], bool]:
+    """Find the soil pools at which the soil model is at steady state.
+
+    The steady state is first solved for directly, by finding the pools at which the
+    rate of change is zero using the Newton-Krylov method. The problem is scaled by the
+    initial pool sizes, so that the tolerance applies to the rate of change relative to
+    the size of each pool. The Newton-Krylov method can fail to converge, or can
+    converge on an unphysical steady state with negative pools. In either case the
+    pools are instead stepped through time using the ``BDF`` method, over spans that
+    double in length each time, until the relative rate of change falls below the
+    tolerance or the maximum spin up time is reached. As the fast pools equilibrate the
+    implicit method takes ever longer steps, so this is far cheaper than stepping
+    through the same time with the update interval of the simulation.
+
+    If a span fails, or drives any pool negative, it is retried from the last valid
+    pools with half the length. The forcing is held constant, so it can drive a pool
+    negative (for example when fixed plant uptake rates exceed the supply of a
+    nutrient), in which case there is no valid steady state. The time stepping then
+    stops once the span falls below :data:`MIN_SPINUP_SPAN`, and the pools are left as
+    close as possible to that point.
+
+    Args:
+        y0: The initial values of the soil pools.
+        forcing: The pool independent forcing, which is held constant.
+        pool_names: The names of the soil pools, in the order they are stored in the
+            initial condition vector.
+        model_constants: Set of constants for the soil model.
+        functional_groups: Set of microbial functional groups used by the soil model.
+        microbial_group_arrays: The constants of the microbial functional groups
+            stacked into arrays.
+        enzyme_classes: The constants of the enzyme classes stacked into arrays.
+        max_depth_of_microbial_activity: Maximum depth of the soil profile where
+            microbial activity occurs [m].
+        solver_options: The tolerances to pass to :func:`scipy.integrate.solve_ivp` when
+            stepping through time.
+        tolerance: The largest relative rate of change of any pool that counts as
+            steady state [day^-1].
+        newton_max_iterations: The maximum number of Newton-Krylov iterations, if this
+            is zero the pools are only stepped through time.
+        max_time: The maximum time to step the pools through [days].
+
+    Returns:
+        The pools at steady state (or the last valid pools from the time stepping if no
+        steady state was found), and whether the steady state tolerance was met.
+    """
+
+    # Importing scipy.optimize is expensive, so it is deferred until it is needed
+    from scipy.optimize import NoConvergence, newton_krylov
+
+    no_cells = len(y0) // len(pool_names)
+    model_args = (
+        forcing,
+        make_rate_workspace(pool_names, no_cells),
+        model_constants,
+        functional_groups,
+        microbial_group_arrays,
+        enzyme_classes,
+        max_depth_of_microbial_activity,
+    )
+
+    def relative_rate(
+        pools: NDArray[np.float32], scale: NDArray[np.float32]
+    ) -> NDArray[np.float32]:
+        """Find the rate of change of each pool relative to its scale."""
+        return construct_full_soil_model(0.0, pools, *model_args) / scale
+
+    if newton_max_iterations > 0:
+        scale = np.maximum(np.abs(y0), solver_options["atol"])
+        try:
+            steady_pools = scale * newton_krylov(
+                lambda scaled_pools: relative_rate(scale * scaled_pools, scale),
+                y0 / scale,
+                f_tol=tolerance,
+                maxiter=newton_max_iterations,
+            )
+        except (NoConvergence, ValueError):
+            LOGGER.info("Newton-Krylov soil spin up did not converge")
+        else:
+            if np.all(steady_pools >= -solver_options["atol"]):
+                LOGGER.info("Soil pools spun up to steady state using Newton-Krylov")
+                return steady_pools, True
+
+            LOGGER.info("Newton-Krylov soil spin up found negative pools")
+
+    # Fall back to stepping through time, doubling the time span after each valid pass
+    # and halving it after each failed pass
+    step_options = {**solver_options, "method": "BDF", "max_step": np.inf}
+    pools = y0
+    elapsed = 0.0
+    span = min(365.25, max_time)
+    while elapsed < max_time:
+        output, _ = integrate_soil_block(
+            pools,
+            forcing,
+            (0.0, span),
+            pool_names,
+            model_constants,
+            functional_groups,
+            microbial_group_arrays,
+            enzyme_classes,
+            max_depth_of_microbial_activity,
+            step_options,
+        )
+
+        # Retry from the last valid pools over a shorter span
+        if not output.success or np.any(output.y[:, -1] < -solver_options["atol"]):
+            span /= 2
+            if span < MIN_SPINUP_SPAN:
+                LOGGER.warning(
+                    f"Soil spin up stopped after {elapsed / 365.25:.2f} years, as the "
+                    "pools do not approach a valid steady state under the current "
+                    "forcing"
+                )
+                return pools, False
+            continue
+
+        pools = output.y[:, -1]
+        elapsed += span
+        scale = np.maximum(np.abs(pools), solver_options["atol"])
+        largest_rate = np.max(np.abs(relative_rate(pools, scale)))
+        LOGGER.debug(
+            f"Soil spin up at {elapsed / 365.25:.2f} years: largest relative rate of "
+            f"change {largest_rate:.3g} day^-1"
+        )
+        if largest_rate < tolerance:
+            LOGGER.info(
+                f"Soil pools spun up to steady state after {elapsed / 365.25:.1f} years"
+            )
+            return pools, True
+
+        span = min(2 * span, max_time - elapsed)
+
+    return pools, False
+
+
+def construct_cell_major_soil_model(
+    t: float,
+    pools: NDArray[np.float32],
+    cell_order: NDArray[np.int_],
+    *args: Any,
+) -> NDArray[np.float32]:
+    """Wrapper of the full soil model for pools stored in cell major order.
+
+    The full soil model stores each pool contiguously across all grid cells. This
+    wrapper instead takes and returns vectors where the pools for each grid cell are
+    contiguous, so that the Jacobian of the system is banded (see
+    :func:`make_cell_major_order`).
+
+    Args:
+        t: Current time [days].
+        pools: An array containing all soil pools in cell major order.
+        cell_order: The indices of the full soil model vector in cell major order.
+        *args: The remaining arguments to
+            :func:`~virtual_ecosystem.models.soil.soil_model.construct_full_soil_model`.
+
+    Returns:
+        The rate of change for each soil pool, in cell major order.
+    """
+
+    pool_major = np.empty_like(pools)
+    pool_major[cell_order] = pools
+
+    return construct_full_soil_model(t, pool_major, *args)[cell_order]
+
+
+def make_cell_major_order(no_cells: int, no_pools: int) -> NDArray[np.int_]:
+    """Find the order that groups the soil pools of each grid cell together.
+
+    Args:
+        no_cells: Number of grid cells the pools are defined for
+        no_pools: Number of soil pools being integrated
+
+    Returns:
+        The indices of the (pool major) integration vector in cell major order.
+    """
+
+    return np.arange(no_cells * no_pools).reshape(no_pools, no_cells).T.ravel()
+
+
+def make_jacobian_sparsity(no_cells: int, no_pools: int) -> csr_matrix:
+    """Construct the sparsity structure of the soil model Jacobian.
+
+    The soil pools in each grid cell only interact with the other pools in the same
+    cell, so the Jacobian only has non-zero entries between the elements of each pool
+    slice (see :func:`make_slices`) that belong to the same cell. Supplying this
+    structure to the implicit integration methods means that the Jacobian can be
+    estimated using a number of function evaluations that scales with the number of
+    pools rather than the size of the grid.
+
+    Args:
+        no_cells: Number of grid cells the pools are defined for
+        no_pools: Number of soil pools being integrated
+
+    Returns:
+        A sparse boolean matrix marking the potentially non-zero Jacobian entries.
+    """
+
+    from scipy.sparse import coo_matrix
+
+    # Indices of each pool in the integration vector, with shape (no_pools, no_cells)
+    indices = np.stack(
+        [np.arange(no_cells * no_pools)[slc] for slc in make_slices(no_cells, no_pools)]
+    )
+    shape = (no_pools, no_pools, no_cells)
+    rows = np.broadcast_to(indices[:, np.newaxis, :], shape).ravel()
+    cols = np.broadcast_to(indices[np.newaxis, :, :], shape).ravel()
+
+    return coo_matrix(
+        (np.ones(rows.size, dtype=np.bool_), (rows, cols)),
+        shape=(no_cells * no_pools, no_cells * no_pools),
+    ).tocsr()
+
+
+def make_cell_blocks(no_cells: int, no_blocks: int) -> list[slice]:
+    """Split the grid cells into contiguous blocks of as equal size as possible.
+
+    Args:
+        no_cells: Number of grid cells the pools are defined for
+        no_blocks: Number of blocks to split the cells into, this is reduced to the
+            number of cells if there are fewer cells than blocks.
+
+    Returns:
+        A list of slices selecting the cells in each block
+    """
+
+    bounds = np.linspace(0, no_cells, min(no_blocks, no_cells) + 1).round().astype(int)
+    return [slice(start, stop) for start, stop in pairwise(bounds.tolist())]
+
+
+def make_rate_workspace(
+    pool_names: tuple[str, ...], no_cells: int
+) -> SoilRateWorkspace:
+    """Set up the reusable storage for evaluating the soil model rate of change.
+
+    Args:
+        pool_names: The names of the soil pools, in the order they are stored in the
+            integration vector.
+        no_cells: Number of grid cells the integration is being performed over
+
+    Returns:
+        The pool slices, output vector and output views for the integration.
+    """
+
+    pool_slices = dict(zip(pool_names, make_slices(no_cells, len(pool_names))))
+    rates = np.zeros(no_cells * len(pool_names), dtype=float)
 
-    return soil_pools.calculate_all_pool_updates(
-        delta_pools_ordered=delta_pools_ordered,
-        layer_structure=layer_structure,
-        soil_moisture_saturation=soil_moisture_saturation,
-        soil_moisture_residual=soil_moisture_residual,
-        top_soil_layer_thickness=top_soil_layer_thickness,
+    return SoilRateWorkspace(
+        pool_slices=pool_slices,
+        rates=rates,
+        delta_pools_ordered={name: rates[slc] for name, slc in pool_slices.items()},
     )
 
 
@@ -0,0 +1,190 @@
+"""The :mod:`~virtual_ecosystem.models.soil.solver_diagnostics` module provides
+telemetry for the numerical integration of the soil pools. Each integration of a block
+of grid cells (see
+:func:`~virtual_ecosystem.models.soil.soil_model.integrate_soil_block`) is summarised
+by a :class:`SolverDiagnostics` instance, which records the work done by the solver and
+flags the grid cell and soil pool with the fastest rates of change at the start of the
+integration, as a guide to what is likely to be limiting the step size. These summaries
+are written to the log and can optionally be appended to a structured (JSON lines)
+diagnostics file, so that slow or failing integrations can be traced back to the
+parameters and conditions that caused them.
+"""  # noqa: D205
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from virtual_ecosystem.core.logger import LOGGER
+
+RK_STAGES: dict[str, int] = {"RK23": 3, "RK45": 6, "DOP853": 12}
+"""Number of rate evaluations per step attempt for the explicit Runge-Kutta methods."""
+
+
+@dataclass
+class SolverDiagnostics:
+    """Summary of the work done to integrate a block of grid cells."""
+
+    method: str
+    """The integration method used."""
+    first_cell: int
+    """Index of the first grid cell in the block."""
+    no_cells: int
+    """Number of grid cells in the block."""
+    success: bool
+    """Whether the integration reached the end of the time span."""
+    nfev: int
+    """Number of evaluations of the soil model rate of change."""
+    njev: int
+    """Number of evaluations of the Jacobian."""
+    nlu: int
+    """Number of LU decompositions."""
+    accepted_steps: int
+    """Number of steps accepted by the solver."""
+    rejected_steps: int | None
+    """Number of steps rejected by the solver, only known for the explicit methods."""
+    min_step: float
+    """Smallest accepted step size [days]."""
+    wall_time: float
+    """Wall clock time taken by the integration [s]."""
+    fastest_relative_rate_cell: int
+    """Index of the grid cell with the fastest initial rate of change relative to the
+    size of its pools."""
+    largest_scaled_initial_rate_pool: str
+    """Soil pool with the largest initial rate of change scaled by its tolerance."""
+
+
+def summarise_solver_output(
+    output: Any,
+    method: str,
+    first_cell: int,
+    pool_names: tuple[str, ...],
+    y0: NDArray[np.floating],
+    initial_rates: NDArray[np.floating],
+    rtol: float,
+    atol: float,
+    wall_time: float,
+) -> SolverDiagnostics:
+    """Summarise the work done by :func:`scipy.integrate.solve_ivp`.
+
+    The solver does not expose its Jacobian or its local error estimates, so the grid
+    cell and pool reported are heuristics calculated from the rates of change at the
+    start of the integration (t=0), not from the solver itself. The fastest relative
+    rate cell is the one with the shortest relative timescale (largest rate of change
+    relative to pool size), which is a cheap proxy for the stiffest cell. The largest
+    scaled initial rate pool is the pool with the largest sum across cells of its
+    squared rate of change, scaled by the tolerance applied to that pool in the same way
+    as the solver error norm, which is a proxy for the pool contributing most to the
+    local error. Either can differ from the cell and pool limiting the step size later
+    in the integration.
+
+    The number of rejected steps is inferred from the number of rate evaluations for
+    the explicit Runge-Kutta methods. The implicit methods also use rate evaluations to
+    estimate the Jacobian and solve for each step, so for these it is not known.
+
+    Args:
+        output: The solution object returned by :func:`scipy.integrate.solve_ivp`,
+            which must have been run without ``t_eval`` so that every step is recorded.
+        method: The integration method used.
+        first_cell: Index of the first grid cell in the block.
+        pool_names: The names of the soil pools, in the order they are stored in the
+            integration vector.
+        y0: The initial values of the soil pools.
+        initial_rates: The rate of change of the soil pools at the initial values.
+        rtol: The relative tolerance of the integration.
+        atol: The absolute tolerance of the integration.
+        wall_time: Wall clock time taken by the integration [s].
+
+    Returns:
+        The summary of the integration.
+    """
+
+    no_pools = len(pool_names)
+    no_cells = len(y0) // no_pools
+
+    steps = np.diff(output.t)
+    accepted_steps = len(steps)
+    rejected_steps = None
+    if method in RK_STAGES:
+        # Two evaluations are used to select the initial step size
+        attempts = (output.nfev - 2) // RK_STAGES[method]
+        rejected_steps = max(attempts - accepted_steps, 0)
+
+    relative_rates = (np.abs(initial_rates) / np.maximum(np.abs(y0), atol)).reshape(
+        no_pools, no_cells
+    )
+    scaled_rates = (initial_rates / (atol + rtol * np.abs(y0))).reshape(
+        no_pools, no_cells
+    )
+    fastest_cell = int(np.argmax(relative_rates.max(axis=0)))
+    largest_pool = int(np.argmax((scaled_rates**2).sum(axis=1)))
+
+    return SolverDiagnostics(
+        method=method,
+        first_cell=first_cell,
+        no_cells=no_cells,
+        success=bool(output.success),
+        nfev=int(output.nfev),
+        njev=int(output.njev),
+        nlu=int(output.nlu),
+        accepted_steps=accepted_steps,
+        rejected_steps=rejected_steps,
+        min_step=float(steps.min()) if accepted_steps else 0.0,
+        wall_time=wall_time,
+        fastest_relative_rate_cell=first_cell + fastest_cell,
+        largest_scaled_initial_rate_pool=pool_names[largest_pool],
+    )
+
+
+def log_solver_diagnostics(diagnostics: SolverDiagnostics) -> None:
+    """Write a summary of a soil integration to the log.
+
+    Args:
+        diagnostics: The summary of the integration.
+    """
+
+    rejected = (
+        "unknown" if diagnostics.rejected_steps is None else diagnostics.rejected_steps
+    )
+    last_cell = diagnostics.first_cell + diagnostics.no_cells - 1
+    LOGGER.info(
+        f"Soil integration ({diagnostics.method}) of cells "
+        f"{diagnostics.first_cell}-{last_cell}: "
+        f"nfev={diagnostics.nfev}, njev={diagnostics.njev}, nlu={diagnostics.nlu}, "
+        f"steps={diagnostics.accepted_steps} (rejected {rejected}), "
+        f"min step={diagnostics.min_step:.3g} days, "
+        f"wall time={diagnostics.wall_time:.3f} s, "
+        f"at t=0: fastest relative rate cell={diagnostics.fastest_relative_rate_cell}, "
+        "largest scaled rate pool="
+        f"{diagnostics.largest_scaled_initial_rate_pool}"
+    )
+
+
+def write_solver_diagnostics(
+    path: Path, time_index: int | None, diagnostics: list[SolverDiagnostics]
+) -> None:
+    """Append the summaries of the soil integrations for an update to a file.
+
+    Each summary is written as a single JSON object per line, along with the index of
+    the update it belongs to. Problems writing the file are logged but do not stop the
+    simulation.
+
+    Args:
+        path: The path of the diagnostics file.
+        time_index: The index of the update, or None if the integration is not part of
+            a model update.
+        diagnostics: The summaries of the integration of each block of grid cells.
+    """
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a") as diagnostics_io:
+            for record in diagnostics:
+                diagnostics_io.write(
+                    json.dumps({"time_index": time_index, **asdict(record)}) + "\n"
+                )
+    except OSError as excep:
+        LOGGER.warning(f"Could not write soil solver diagnostics to {path}: {excep}")
@@ -10,10 +10,13 @@ from numpy.typing import NDArray
 from virtual_ecosystem.core.logger import LOGGER
 from virtual_ecosystem.models.soil.constants import SoilConsts
 from virtual_ecosystem.models.soil.env_factors import (
-    calculate_carbon_use_efficiency,
     calculate_temperature_effect_on_microbes,
+    get_temperature_effect_table,
+)
+from virtual_ecosystem.models.soil.microbial_groups import (
+    MicrobialGroupArrays,
+    MicrobialGroupConstants,
 )
-from virtual_ecosystem.models.soil.microbial_groups import MicrobialGroupConstants
 
 
 @dataclass
@@ -85,7 +88,9 @@ def calculate_nutrient_uptake_rates(
     phosphorus_exchange: NDArray[np.float32] | None,
     water_factor: NDArray[np.float32],
     pH_factor: NDArray[np.float32],
-    soil_temp: NDArray[np.float32],
+    temp_factor_rate: NDArray[np.float32],
+    temp_factor_saturation: NDArray[np.float32],
+    carbon_use_efficiency: NDArray[np.float32],
     constants: SoilConsts,
     functional_group: MicrobialGroupConstants,
 ) -> tuple[NDArray[np.float32], NetNutrientConsumption]:
@@ -145,7 +150,12 @@ def calculate_nutrient_uptake_rates(
             rates [unitless]
         pH_factor: A factor capturing the impact of soil pH on microbial rates
             [unitless]
-        soil_temp: soil temperature for each soil grid cell [degrees C]
+        temp_factor_rate: A factor capturing the impact of soil temperature on the
+            uptake rates of the microbial group [unitless]
+        temp_factor_saturation: A factor capturing the impact of soil temperature on
+            the uptake saturation constants of the microbial group [unitless]
+        carbon_use_efficiency: The carbon use efficiency of the microbial community
+            [unitless]
         constants: Set of constants for the soil model.
         functional_group: A data class containing the parameters defining the microbial
             functional group
@@ -160,14 +170,6 @@ def calculate_nutrient_uptake_rates(
             demand for nitrogen and phosphorus exchange
     """
 
-    # Calculate carbon use efficiency as it is used in multiple subsequent functions
-    carbon_use_efficiency = calculate_carbon_use_efficiency(
-        soil_temp=soil_temp,
-        reference_cue_logit=constants.reference_cue_logit,
-        cue_reference_temp=constants.cue_reference_temp,
-        logit_cue_with_temp=constants.logit_cue_with_temperature,
-    )
-
     max_uptake_rates = calculate_maximum_uptake_rates(
         soil_c_pool_lmwc=soil_c_pool_lmwc,
         soil_n_pool_don=soil_n_pool_don,
@@ -178,7 +180,8 @@ def calculate_nutrient_uptake_rates(
         microbial_pool_size=microbial_pool_size,
         water_factor=water_factor,
         pH_factor=pH_factor,
-        soil_temp=soil_temp,
+        temp_factor_rate=temp_factor_rate,
+        temp_factor_saturation=temp_factor_saturation,
         functional_group=functional_group,
     )
 
@@ -622,14 +625,19 @@ def calculate_maximum_uptake_rates(
     microbial_pool_size: NDArray[np.float32],
     water_factor: NDArray[np.float32],
     pH_factor: NDArray[np.float32],
-    soil_temp: NDArray[np.float32],
-    functional_group: MicrobialGroupConstants,
+    temp_factor_rate: NDArray[np.float32],
+    temp_factor_saturation: NDArray[np.float32],
+    functional_group: MicrobialGroupConstants | MicrobialGroupArrays,
 ) -> MaxUptakeRates:
     """Calculate the maximum uptake rate for each category of nutrient.
 
     Categories are, carbon, organic nitrogen and phosphorus, inorganic nitrogen
     (ammonium and nitrate), and inorganic phosphorus.
 
+    The rates can be found for several microbial groups at once by passing their
+    stacked constants, along with the biomass and temperature factors of the groups
+    with one row per group.
+
     Args:
         soil_c_pool_lmwc: Low molecular weight carbon pool [kg C m^-3]
         soil_n_pool_don: Dissolved organic nitrogen pool [kg N m^-3]
@@ -646,14 +654,16 @@ def calculate_maximum_uptake_rates(
             rates [unitless]
         pH_factor: A factor capturing the impact of soil pH on microbial rates
             [unitless]
-        soil_temp: soil temperature for each soil grid cell [degrees C]
-        constants: Set of constants for the soil model.
+        temp_factor_rate: A factor capturing the impact of soil temperature on the
+            uptake rates of the microbial group [unitless]
+        temp_factor_saturation: A factor capturing the impact of soil temperature on
+            the uptake saturation constants of the microbial group [unitless]
         functional_group: A data class containing the parameters defining the microbial
-            functional group
+            functional group, or the stacked parameters of several groups
 
     Returns:
         The maximum rate at which each category of nutrient can be taken up by the
-        microbial group of interest.
+        microbial group (or groups) of interest.
     """
 
     # Calculate highest possible microbial uptake rates for organic matter and inorganic
@@ -663,48 +673,40 @@ def calculate_maximum_uptake_rates(
         microbial_pool_size=microbial_pool_size,
         water_factor=water_factor,
         pH_factor=pH_factor,
-        soil_temp=soil_temp,
+        temp_factor_rate=temp_factor_rate,
+        temp_factor_saturation=temp_factor_saturation,
         max_uptake_rate=functional_group.max_uptake_rate_labile_C,
         half_saturation_constant=functional_group.half_sat_labile_C_uptake,
-        activation_energy_uptake=functional_group.activation_energy_uptake_rate,
-        activation_energy_uptake_saturation=functional_group.activation_energy_uptake_saturation,
-        reference_temperature=functional_group.reference_temperature,
     )
     ammonium_uptake_rate_max = calculate_highest_achievable_nutrient_uptake(
         labile_nutrient_pool=soil_n_pool_ammonium,
         microbial_pool_size=microbial_pool_size,
         water_factor=water_factor,
         pH_factor=pH_factor,
-        soil_temp=soil_temp,
+        temp_factor_rate=temp_factor_rate,
+        temp_factor_saturation=temp_factor_saturation,
         max_uptake_rate=functional_group.max_uptake_rate_ammonium,
         half_saturation_constant=functional_group.half_sat_ammonium_uptake,
-        activation_energy_uptake=functional_group.activation_energy_uptake_rate,
-        activation_energy_uptake_saturation=functional_group.activation_energy_uptake_saturation,
-        reference_temperature=functional_group.reference_temperature,
     )
     nitrate_uptake_rate_max = calculate_highest_achievable_nutrient_uptake(
         labile_nutrient_pool=soil_n_pool_nitrate,
         microbial_pool_size=microbial_pool_size,
         water_factor=water_factor,
         pH_factor=pH_factor,
-        soil_temp=soil_temp,
+        temp_factor_rate=temp_factor_rate,
+        temp_factor_saturation=temp_factor_saturation,
         max_uptake_rate=functional_group.max_uptake_rate_nitrate,
         half_saturation_constant=functional_group.half_sat_nitrate_uptake,
-        activation_energy_uptake=functional_group.activation_energy_uptake_rate,
-        activation_energy_uptake_saturation=functional_group.activation_energy_uptake_saturation,
-        reference_temperature=functional_group.reference_temperature,
     )
     inorganic_phosphorus_uptake_rate_max = calculate_highest_achievable_nutrient_uptake(
         labile_nutrient_pool=soil_p_pool_labile,
         microbial_pool_size=microbial_pool_size,
         water_factor=water_factor,
         pH_factor=pH_factor,
-        soil_temp=soil_temp,
+        temp_factor_rate=temp_factor_rate,
+        temp_factor_saturation=temp_factor_saturation,
         max_uptake_rate=functional_group.max_uptake_rate_labile_p,
         half_saturation_constant=functional_group.half_sat_labile_p_uptake,
-        activation_energy_uptake=functional_group.activation_energy_uptake_rate,
-        activation_energy_uptake_saturation=functional_group.activation_energy_uptake_saturation,
-        reference_temperature=functional_group.reference_temperature,
     )
 
     # Find maximum possible uptake rates for organic nitrogen and phosphorus, based on
@@ -729,19 +731,17 @@ def calculate_highest_achievable_nutrient_uptake(
     microbial_pool_size: NDArray[np.float32],
     water_factor: NDArray[np.float32],
     pH_factor: NDArray[np.float32],
-    soil_temp: NDArray[np.float32],
-    max_uptake_rate: float,
-    activation_energy_uptake: float,
-    half_saturation_constant: float,
-    activation_energy_uptake_saturation: float,
-    reference_temperature: float,
+    temp_factor_rate: NDArray[np.float32],
+    temp_factor_saturation: NDArray[np.float32],
+    max_uptake_rate: float | NDArray[np.float32],
+    half_saturation_constant: float | NDArray[np.float32],
 ) -> NDArray[np.float32]:
     """Calculate highest achievable uptake rate for a specific nutrient.
 
-    This function starts by calculating the impact that environmental factors have on
-    the rate and saturation constants for microbial uptake. These constants are then
-    used to calculate the maximum possible uptake rate for the specific nutrient and
-    microbial group in question.
+    This function starts by adjusting the rate and saturation constants for microbial
+    uptake to the environmental conditions. These constants are then used to calculate
+    the maximum possible uptake rate for the specific nutrient and microbial group in
+    question.
 
     Args:
         labile_nutrient_pool: Mass of nutrient that is in a readily uptakeable (labile)
@@ -752,33 +752,20 @@ def calculate_highest_achievable_nutrient_uptake(
             rates [unitless]
         pH_factor: A factor capturing the impact of soil pH on microbial rates
             [unitless]
-        soil_temp: soil temperature for each soil grid cell [degrees C]
+        temp_factor_rate: A factor capturing the impact of soil temperature on the
+            uptake rate constant [unitless]
+        temp_factor_saturation: A factor capturing the impact of soil temperature on
+            the uptake saturation constant [unitless]
         max_uptake_rate: Maximum possible uptake rate of the nutrient (at reference
             temperature) [day^-1]
-        activation_energy_uptake: Activation energy for nutrient uptake for the
-            microbial group in question [J K^-1].
         half_saturation_constant: Half saturation constant for nutrient uptake (at
             reference temperature) [kg nut m^-3]
-        activation_energy_uptake_saturation: Activation energy for nutrient uptake
-            saturation for the microbial group in question [J K^-1].
-        reference_temperature: The reference temperature of the Arrhenius equation [C]
 
     Returns:
         The maximum uptake rate by the soil microbial biomass for the nutrient in
         question.
     """
 
-    # Calculate impact of temperature on the rate and saturation constants
-    temp_factor_rate = calculate_temperature_effect_on_microbes(
-        soil_temperature=soil_temp,
-        activation_energy=activation_energy_uptake,
-        reference_temperature=reference_temperature,
-    )
-    temp_factor_saturation = calculate_temperature_effect_on_microbes(
-        soil_temperature=soil_temp,
-        activation_energy=activation_energy_uptake_saturation,
-        reference_temperature=reference_temperature,
-    )
     # Rate and saturation constants are then adjusted based on these environmental
     # conditions
     rate_constant = max_uptake_rate * temp_factor_rate * water_factor * pH_factor
@@ -792,3 +779,60 @@ def calculate_highest_achievable_nutrient_uptake(
     )
 
     return np.where(uptake_rate >= 0.0, uptake_rate, 0.0)
+
+
+def calculate_uptake_temperature_factors(
+    soil_temp: NDArray[np.float32],
+    microbial_groups: MicrobialGroupArrays,
+    response_curve_tolerance: float | None = None,
+) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+    """Calculate the impact of temperature on microbial uptake for every group.
+
+    These factors do not depend on the soil pools, so they are calculated once per
+    update rather than every time the uptake rates are found.
+
+    Args:
+        soil_temp: soil temperature for each soil grid cell [degrees C]
+        microbial_groups: The constants of the microbial functional groups stacked into
+            arrays.
+        response_curve_tolerance: If provided, the temperature responses are evaluated
+            from tables with this error bound rather than exactly.
+
+    Returns:
+        A tuple containing the factors for the uptake rate constants and the uptake
+        saturation constants, each with one row per microbial group [unitless].
+    """
+
+    if response_curve_tolerance is None:
+        return (
+            calculate_temperature_effect_on_microbes(
+                soil_temperature=soil_temp,
+                activation_energy=microbial_groups.activation_energy_uptake_rate,
+                reference_temperature=microbial_groups.reference_temperature,
+            ),
+            calculate_temperature_effect_on_microbes(
+                soil_temperature=soil_temp,
+                activation_energy=microbial_groups.activation_energy_uptake_saturation,
+                reference_temperature=microbial_groups.reference_temperature,
+            ),
+        )
+
+    def tabulated(activation_energy: NDArray[np.float32]) -> NDArray[np.float32]:
+        return np.stack(
+            [
+                get_temperature_effect_table(
+                    activation_energy=float(energy),
+                    reference_temperature=float(reference),
+                    tolerance=response_curve_tolerance,
+                )(soil_temp)
+                for energy, reference in zip(
+                    activation_energy[:, 0],
+                    microbial_groups.reference_temperature[:, 0],
+                )
+            ]
+        )
+
+    return (
+        tabulated(microbial_groups.activation_energy_uptake_rate),
+        tabulated(microbial_groups.activation_energy_uptake_saturation),
+    )